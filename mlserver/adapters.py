@@ -1,5 +1,6 @@
 
 from __future__ import annotations
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 import numpy as np
 import pandas as pd
@@ -16,6 +17,10 @@ from collections import OrderedDict
 _FEATURE_ORDER_CACHE: OrderedDict[frozenset, List[str]] = OrderedDict()
 _CACHE_MAX_SIZE = 100  # Maximum number of cached feature orderings
 
+# Input size limits to prevent DoS
+MAX_RECORDS = 10000
+MAX_FEATURES = 1000
+
 
 def _get_cached_feature_order(records: List[Dict], config_order: Optional[List[str]] = None) -> List[str]:
     """Get feature order with caching for performance optimization.
@@ -54,6 +59,7 @@ def clear_feature_cache() -> None:
     """Clear the feature order cache. Useful for memory management in long-running services."""
     global _FEATURE_ORDER_CACHE
     _FEATURE_ORDER_CACHE.clear()
+    _INFERRED_DTYPE_CACHE.clear()
 
 
 def get_cache_info() -> Dict[str, Any]:
@@ -65,12 +71,138 @@ def get_cache_info() -> Dict[str, Any]:
     }
 
 
-def _records_to_numpy_fast(records: List[Dict], feature_order: List[str]) -> np.ndarray:
+# Typed conversion: dtype names accepted in mlserver.yaml (api.input_dtype / api.feature_dtypes)
+_NUMERIC_DTYPES: Dict[str, Any] = {
+    "float32": np.float32,
+    "float64": np.float64,
+    "float": np.float64,
+    "int32": np.int32,
+    "int64": np.int64,
+    "int": np.int64,
+}
+_CATEGORY_DTYPES = frozenset({"category", "str", "string"})
+INPUT_DTYPES = frozenset({"object", "auto", *_NUMERIC_DTYPES})
+FEATURE_DTYPES = frozenset({"object", *_NUMERIC_DTYPES, *_CATEGORY_DTYPES})
+
+# Schema inferred from the first batch per feature ordering (input_dtype="auto")
+_INFERRED_DTYPE_CACHE: OrderedDict[tuple, Optional[List[str]]] = OrderedDict()
+
+
+def _infer_column_dtypes(feature_order: List[str], sample_row: Sequence[Any]) -> Optional[List[str]]:
+    """Infer column dtypes from a sample row, cached per feature ordering.
+
+    Returns a float64 schema when every value is numeric, otherwise None so that
+    the payload keeps the generic object conversion.
+    """
+    key = tuple(feature_order)
+    if key in _INFERRED_DTYPE_CACHE:
+        _INFERRED_DTYPE_CACHE.move_to_end(key)
+        return _INFERRED_DTYPE_CACHE[key]
+
+    all_numeric = all(
+        isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+        for v in sample_row
+    )
+    dtypes = ["float64"] * len(feature_order) if all_numeric else None
+
+    if len(_INFERRED_DTYPE_CACHE) >= _CACHE_MAX_SIZE:
+        _INFERRED_DTYPE_CACHE.popitem(last=False)
+    _INFERRED_DTYPE_CACHE[key] = dtypes
+    return dtypes
+
+
+def _resolve_column_dtypes(
+    feature_order: Optional[List[str]],
+    n_columns: int,
+    input_dtype: str = "object",
+    feature_dtypes: Optional[Dict[str, str]] = None,
+    sample_row: Optional[Sequence[Any]] = None,
+) -> Optional[List[str]]:
+    """Resolve the dtype of each column, or None for the generic object conversion.
+
+    Per-feature declarations take precedence over ``input_dtype``; features without
+    a declaration fall back to ``input_dtype`` when it is numeric, else keep their
+    raw value.
+    """
+    if feature_dtypes and feature_order:
+        default = input_dtype if input_dtype in _NUMERIC_DTYPES else "object"
+        return [feature_dtypes.get(f, default) for f in feature_order]
+
+    if input_dtype in _NUMERIC_DTYPES:
+        return [input_dtype] * n_columns
+
+    if input_dtype == "auto" and sample_row is not None:
+        return _infer_column_dtypes(feature_order or [str(i) for i in range(n_columns)], sample_row)
+
+    return None
+
+
+def _as_numeric(values: Any, dtype: Any) -> np.ndarray:
+    """Convert values to a numeric dtype without truncating fractions into integers.
+
+    Raises:
+        ValueError: If a value cannot be converted, or has a fractional part
+            and ``dtype`` is an integer type
+    """
+    try:
+        arr = np.asarray(values, dtype=dtype)
+        if np.dtype(dtype).kind in "iu":
+            # numpy silently truncates 2.7 to 2; the float parse keeps the fraction
+            if not np.array_equal(arr, np.asarray(values, dtype=np.float64)):
+                raise ValueError("values must be whole numbers")
+    except OverflowError as e:
+        raise ValueError(str(e))
+    return arr
+
+
+def _build_typed_array(rows: Sequence[Sequence[Any]], column_dtypes: List[str],
+                       feature_order: Optional[List[str]] = None) -> np.ndarray:
+    """Build a 2D array from row tuples according to per-column dtypes.
+
+    All-numeric schemas produce one contiguous numeric array without boxing
+    each cell. Schemas with categorical or raw columns produce an object array
+    whose numeric columns are coerced column by column.
+
+    Raises:
+        AdapterError: If a value cannot be converted to its declared dtype
+    """
+    if all(d in _NUMERIC_DTYPES for d in column_dtypes):
+        target = np.result_type(*[_NUMERIC_DTYPES[d] for d in column_dtypes])
+        try:
+            return _as_numeric(rows, target)
+        except (ValueError, TypeError):
+            # Fall through to the column-wise path to report the offending feature
+            pass
+
+    n_rows, n_cols = len(rows), len(column_dtypes)
+    out = np.empty((n_rows, n_cols), dtype=object)
+    columns = list(zip(*rows)) if n_rows else [()] * n_cols
+
+    for j, dtype in enumerate(column_dtypes):
+        column = columns[j]
+        if dtype in _NUMERIC_DTYPES:
+            try:
+                out[:, j] = _as_numeric(column, _NUMERIC_DTYPES[dtype])
+            except (ValueError, TypeError) as e:
+                name = feature_order[j] if feature_order else j
+                raise AdapterError(f"Feature {name!r} cannot be converted to {dtype}: {e}")
+        elif dtype in _CATEGORY_DTYPES:
+            out[:, j] = [None if v is None else str(v) for v in column]
+        else:
+            out[:, j] = column
+
+    return out
+
+
+def _records_to_numpy_fast(records: List[Dict], feature_order: List[str],
+                           column_dtypes: Optional[List[str]] = None) -> np.ndarray:
     """Convert records to numpy array with vectorized operations for better performance.
 
     Args:
         records: List of dictionaries containing features
         feature_order: List of feature names in the desired order
+        column_dtypes: Optional per-feature dtypes; when given, numeric payloads are
+            written straight into a typed array instead of a dtype=object array
 
     Returns:
         numpy array with shape (n_records, n_features)
@@ -82,30 +214,34 @@ def _records_to_numpy_fast(records: List[Dict], feature_order: List[str]) -> np.
         return np.empty((0, len(feature_order)), dtype=object)
 
     # Input validation: Check size limits to prevent DoS
-    MAX_RECORDS = 10000
-    MAX_FEATURES = 1000
-
     if len(records) > MAX_RECORDS:
         raise AdapterError(f"Too many records: {len(records)} exceeds limit of {MAX_RECORDS}")
     if len(feature_order) > MAX_FEATURES:
         raise AdapterError(f"Too many features: {len(feature_order)} exceeds limit of {MAX_FEATURES}")
 
-    # Validate that all records have all required features
-    for i, record in enumerate(records):
-        missing_features = [f for f in feature_order if f not in record]
-        if missing_features:
-            raise AdapterError(
-                f"Record {i} is missing required features: {missing_features}"
-            )
+    if not feature_order:
+        return np.empty((len(records), 0), dtype=object)
 
-    # Vectorized approach: Extract all values at once for better performance
-    # This is more efficient than nested loops for larger datasets
-    result = np.array([
-        [record.get(feature, None) for feature in feature_order]
-        for record in records
-    ], dtype=object)
+    # Extract rows with a C-level itemgetter; a KeyError means a missing feature
+    getter = itemgetter(*feature_order)
+    try:
+        if len(feature_order) == 1:
+            rows = [(getter(record),) for record in records]
+        else:
+            rows = [getter(record) for record in records]
+    except (KeyError, TypeError):
+        for i, record in enumerate(records):
+            missing_features = [f for f in feature_order if f not in record]
+            if missing_features:
+                raise AdapterError(
+                    f"Record {i} is missing required features: {missing_features}"
+                )
+        raise
 
-    return result
+    if column_dtypes is not None:
+        return _build_typed_array(rows, column_dtypes, feature_order)
+
+    return np.array(rows, dtype=object)
 
 
 def _infer_adapter_type(payload: dict) -> str:
@@ -121,6 +257,10 @@ def _infer_adapter_type(payload: dict) -> str:
     if "features" in payload and isinstance(payload["features"], dict):
         return "records"
 
+    # Check for columnar format indicators
+    if isinstance(payload.get("columns"), dict):
+        return "columns"
+
     # Check for ndarray format indicators
     if "ndarray" in payload or isinstance(payload.get("inputs"), list):
         return "ndarray"
@@ -129,8 +269,15 @@ def _infer_adapter_type(payload: dict) -> str:
     return "records"
 
 
-def _extract_ndarray_data(payload: dict) -> np.ndarray:
-    """Extract and validate ndarray data from payload."""
+def _extract_ndarray_data(payload: dict, feature_order: Optional[List[str]] = None,
+                          input_dtype: str = "object",
+                          feature_dtypes: Optional[Dict[str, str]] = None) -> np.ndarray:
+    """Extract and validate ndarray data from payload.
+
+    With a numeric ``input_dtype`` the data is converted straight into a typed
+    array; ``"auto"`` keeps the natural numeric dtype of the payload when there is
+    one. ``feature_dtypes`` require ``feature_order`` to map columns to names.
+    """
     # Try different keys for array data
     array_data = payload.get("ndarray")
     if array_data is None:
@@ -149,7 +296,7 @@ def _extract_ndarray_data(payload: dict) -> np.ndarray:
 
     # Convert to numpy array and ensure 2D shape
     try:
-        arr = np.asarray(array_data, dtype=object)
+        arr = _ndarray_with_dtype(array_data, feature_order, input_dtype, feature_dtypes)
     except ValueError as e:
         raise AdapterError(f"Invalid array data: {e}")
 
@@ -159,6 +306,152 @@ def _extract_ndarray_data(payload: dict) -> np.ndarray:
     return arr
 
 
+def _ndarray_with_dtype(array_data: Any, feature_order: Optional[List[str]],
+                        input_dtype: str, feature_dtypes: Optional[Dict[str, str]]) -> np.ndarray:
+    """Convert raw array data using the configured dtype schema."""
+    if feature_dtypes and feature_order:
+        if isinstance(array_data, np.ndarray):
+            array_data = array_data.tolist()
+        rows = array_data if array_data and isinstance(array_data[0], (list, tuple)) else [array_data]
+        if any(len(row) != len(feature_order) for row in rows):
+            raise AdapterError(
+                f"Expected {len(feature_order)} columns per row to match feature_order"
+            )
+        column_dtypes = _resolve_column_dtypes(feature_order, len(feature_order), input_dtype, feature_dtypes)
+        return _build_typed_array(rows, column_dtypes, feature_order)
+
+    if input_dtype in _NUMERIC_DTYPES:
+        try:
+            return _as_numeric(array_data, _NUMERIC_DTYPES[input_dtype])
+        except (ValueError, TypeError) as e:
+            raise AdapterError(f"Array data cannot be converted to {input_dtype}: {e}")
+
+    if input_dtype == "auto":
+        try:
+            arr = np.asarray(array_data)
+        except ValueError:
+            arr = None
+        if arr is not None and arr.dtype.kind in "iuf":
+            return arr.astype(np.float64, copy=False)
+
+    if isinstance(array_data, np.ndarray):
+        return array_data.astype(object)
+    return np.asarray(array_data, dtype=object)
+
+
+def array_to_ndarray(
+    arr: np.ndarray,
+    feature_order: Optional[List[str]] = None,
+    input_dtype: str = "object",
+    feature_dtypes: Optional[Dict[str, str]] = None,
+) -> np.ndarray:
+    """Apply the configured dtype schema to an already decoded 2D array.
+
+    Used for binary request bodies (e.g. raw .npy) so they produce the same
+    array the ndarray adapter would have produced for the equivalent JSON.
+    """
+    if arr.ndim == 0 or arr.size == 0:
+        raise AdapterError("Array data cannot be empty")
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+    if arr.ndim != 2:
+        raise AdapterError(f"Expected a 2D array, got {arr.ndim} dimensions")
+    if arr.shape[0] > MAX_RECORDS:
+        raise AdapterError(f"Too many records: {arr.shape[0]} exceeds limit of {MAX_RECORDS}")
+    return _ndarray_with_dtype(arr, feature_order, input_dtype, feature_dtypes)
+
+
+def _columns_to_array(payload: dict, feature_order: Optional[List[str]] = None,
+                      input_dtype: str = "object",
+                      feature_dtypes: Optional[Dict[str, str]] = None) -> np.ndarray:
+    """Convert a columnar payload ({"columns": {name: [values...]}}) to a 2D array.
+
+    Each column list is converted in one step and written into a preallocated
+    array, so there is no per-row dict iteration or transposition. Lengths are
+    validated once per column.
+    """
+    columns = payload.get("columns")
+    if not isinstance(columns, dict):
+        raise AdapterError("Expected 'columns' field mapping feature names to value lists")
+    return columns_to_ndarray(columns, feature_order, input_dtype, feature_dtypes)
+
+
+def columns_to_ndarray(
+    columns: Dict[str, Any],
+    feature_order: Optional[List[str]] = None,
+    input_dtype: str = "object",
+    feature_dtypes: Optional[Dict[str, str]] = None,
+) -> np.ndarray:
+    """Convert a mapping of feature name to column values into a 2D array.
+
+    Columns may be lists or 1D numpy arrays (e.g. decoded from Arrow).
+    """
+    if not columns:
+        raise AdapterError("Columns cannot be empty")
+
+    # Explicit feature order selects and orders columns; otherwise sorted like records
+    resolved_feature_order = list(feature_order) if feature_order else sorted(columns)
+
+    missing_features = [f for f in resolved_feature_order if f not in columns]
+    if missing_features:
+        raise AdapterError(f"Columns payload is missing required features: {missing_features}")
+    if len(resolved_feature_order) > MAX_FEATURES:
+        raise AdapterError(
+            f"Too many features: {len(resolved_feature_order)} exceeds limit of {MAX_FEATURES}"
+        )
+
+    selected = [columns[f] for f in resolved_feature_order]
+    for name, values in zip(resolved_feature_order, selected):
+        if not isinstance(values, (list, tuple, np.ndarray)):
+            raise AdapterError(f"Column {name!r} must be a list of values")
+
+    n_rows = len(selected[0])
+    for name, values in zip(resolved_feature_order, selected):
+        if len(values) != n_rows:
+            raise AdapterError(
+                f"Column {name!r} has {len(values)} values, expected {n_rows}"
+            )
+    if n_rows == 0:
+        raise AdapterError("Columns cannot be empty")
+    if n_rows > MAX_RECORDS:
+        raise AdapterError(f"Too many records: {n_rows} exceeds limit of {MAX_RECORDS}")
+
+    sample_row = [values[0] for values in selected]
+    column_dtypes = _resolve_column_dtypes(
+        resolved_feature_order, len(resolved_feature_order),
+        input_dtype, feature_dtypes, sample_row
+    )
+
+    if column_dtypes is not None and all(d in _NUMERIC_DTYPES for d in column_dtypes):
+        target = np.result_type(*[_NUMERIC_DTYPES[d] for d in column_dtypes])
+        out = np.empty((n_rows, len(selected)), dtype=target)
+        try:
+            for j, values in enumerate(selected):
+                out[:, j] = _as_numeric(values, target)
+            return out
+        except (ValueError, TypeError) as e:
+            if input_dtype == "auto" and not feature_dtypes:
+                column_dtypes = None  # later batch does not fit the inferred schema
+            else:
+                raise AdapterError(
+                    f"Feature {resolved_feature_order[j]!r} cannot be converted to {column_dtypes[j]}: {e}"
+                )
+
+    out = np.empty((n_rows, len(selected)), dtype=object)
+    for j, values in enumerate(selected):
+        dtype = column_dtypes[j] if column_dtypes is not None else "object"
+        if dtype in _NUMERIC_DTYPES:
+            try:
+                out[:, j] = _as_numeric(values, _NUMERIC_DTYPES[dtype])
+            except (ValueError, TypeError) as e:
+                raise AdapterError(f"Feature {resolved_feature_order[j]!r} cannot be converted to {dtype}: {e}")
+        elif dtype in _CATEGORY_DTYPES:
+            out[:, j] = [None if v is None else str(v) for v in values]
+        else:
+            out[:, j] = values
+    return out
+
+
 def _extract_records_data(payload: dict) -> List[Dict]:
     """Extract records data from various payload formats."""
     # Try different keys for records data
@@ -192,7 +485,9 @@ def _extract_records_data(payload: dict) -> List[Dict]:
     return records
 
 
-def _process_records_to_array(records: List[Dict], feature_order: Optional[List[str]], adapter_type: str = "records") -> np.ndarray:
+def _process_records_to_array(records: List[Dict], feature_order: Optional[List[str]], adapter_type: str = "records",
+                              input_dtype: str = "object",
+                              feature_dtypes: Optional[Dict[str, str]] = None) -> np.ndarray:
     """Convert records list to numpy array.
 
     For records adapter: feature_order is optional - if not provided,
@@ -208,14 +503,31 @@ def _process_records_to_array(records: List[Dict], feature_order: Optional[List[
     # Use cached feature ordering for performance
     resolved_feature_order = _get_cached_feature_order(records, feature_order)
 
+    column_dtypes = None
+    if input_dtype != "object" or feature_dtypes:
+        first = records[0]
+        sample_row = [first.get(f) for f in resolved_feature_order] if isinstance(first, dict) else None
+        column_dtypes = _resolve_column_dtypes(
+            resolved_feature_order, len(resolved_feature_order),
+            input_dtype, feature_dtypes, sample_row
+        )
+
     # Convert directly to numpy for better performance
-    return _records_to_numpy_fast(records, resolved_feature_order)
+    try:
+        return _records_to_numpy_fast(records, resolved_feature_order, column_dtypes)
+    except AdapterError:
+        if input_dtype == "auto" and not feature_dtypes:
+            # Later batch does not fit the inferred schema - use the generic conversion
+            return _records_to_numpy_fast(records, resolved_feature_order)
+        raise
 
 
 def to_ndarray(
     payload: dict,
     adapter: str = "auto",
     feature_order: Optional[List[str]] = None,
+    input_dtype: str = "object",
+    feature_dtypes: Optional[Dict[str, str]] = None,
 ) -> np.ndarray:
     """Convert common JSON payload formats to a numpy 2D array.
 
@@ -225,12 +537,16 @@ def to_ndarray(
     - {"features": {feature: value, ...}}         # single record
     - {"ndarray": [[...], [...]]}
     - {"inputs": [[...], [...]]} or "inputs": [...]
+    - {"columns": {feature: [values...], ...}}    # columnar
     - Direct list/dict payloads
 
     Args:
         payload: Input data in various JSON formats
-        adapter: Conversion strategy ("auto", "records", "ndarray")
+        adapter: Conversion strategy ("auto", "records", "ndarray", "columns")
         feature_order: Optional explicit feature ordering for records
+        input_dtype: "object" (default, values kept as-is), "auto" (numeric schema
+            inferred from the first batch) or a numeric dtype such as "float32"
+        feature_dtypes: Optional per-feature dtypes (float32|float64|int|category)
 
     Returns:
         2D numpy array ready for model prediction
@@ -264,10 +580,18 @@ def to_ndarray(
     if adapter == "auto":
         adapter = _infer_adapter_type(payload)
 
+    if input_dtype not in INPUT_DTYPES:
+        raise AdapterError(f"Unknown input dtype: '{input_dtype}'. Use one of {sorted(INPUT_DTYPES)}.")
+
     if adapter == "ndarray":
-        return _extract_ndarray_data(payload)
+        return _extract_ndarray_data(payload, feature_order, input_dtype, feature_dtypes)
+    elif adapter == "columns":
+        return _columns_to_array(payload, feature_order, input_dtype, feature_dtypes)
     elif adapter == "records":
         records = _extract_records_data(payload)
-        return _process_records_to_array(records, feature_order, adapter_type=adapter)
+        return _process_records_to_array(
+            records, feature_order, adapter_type=adapter,
+            input_dtype=input_dtype, feature_dtypes=feature_dtypes
+        )
     else:
-        raise AdapterError(f"Unknown adapter type: '{adapter}'. Use 'records', 'ndarray', or 'auto'.")
+        raise AdapterError(f"Unknown adapter type: '{adapter}'. Use 'records', 'ndarray', 'columns', or 'auto'.")
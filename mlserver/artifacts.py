@@ -0,0 +1,207 @@
+"""
+Model artifact loading with memory-mapping support.
+
+Artifacts declared under ``predictor.artifacts`` are loaded by the server and
+passed to the predictor constructor as keyword arguments (one per artifact
+name). NumPy-backed artifacts are memory-mapped read-only by default, so they
+page in lazily and their pages are shared with every process (and container)
+on the node that maps the same file.
+
+Supported formats:
+
+- ``npy``: raw NumPy array (``np.load(mmap_mode='r')``)
+- ``joblib``: ``joblib.dump`` output; uncompressed arrays inside are mapped
+  (``joblib.load(mmap_mode='r')``), the rest of the object graph is on the heap
+- ``pickle``: always loaded onto the heap
+
+``predictor.artifacts`` is either an inline mapping or the path of a manifest
+file (YAML or JSON) with an ``artifacts`` mapping::
+
+    artifacts:
+      model: {path: model.joblib, mmap: true}
+      embeddings: embeddings.npy        # format inferred from the extension
+      encoders: {path: encoders.pkl, format: pickle}
+"""
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import yaml
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMATS = ("npy", "joblib", "pickle")
+
+# Formats whose loader can memory-map array data
+MMAP_FORMATS = ("npy", "joblib")
+
+_EXTENSION_FORMATS = {
+    ".npy": "npy",
+    ".joblib": "joblib",
+    ".jbl": "joblib",
+    ".pkl": "pickle",
+    ".pickle": "pickle",
+}
+
+# Artifacts of one predictor loaded concurrently (file reads and decompression release the GIL)
+MAX_PARALLEL_ARTIFACT_LOADS = 4
+
+# Files loaded onto the heap above this size are rejected
+HEAP_FILE_SIZE_LIMIT_MB = 2000
+# ... and above this size produce a warning
+HEAP_FILE_SIZE_WARN_MB = 100
+
+
+class ArtifactError(ValueError):
+    """Raised when an artifact specification or manifest is invalid."""
+    pass
+
+
+def check_heap_file_size(file_path: str) -> None:
+    """Reject files too large to load onto the heap; warn for large ones.
+
+    Raises:
+        ValueError: If the file exceeds HEAP_FILE_SIZE_LIMIT_MB
+    """
+    size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    if size_mb > HEAP_FILE_SIZE_LIMIT_MB:
+        raise ValueError(
+            f"Model file {file_path} is too large: {size_mb:.1f}MB "
+            f"(limit: {HEAP_FILE_SIZE_LIMIT_MB}MB). Consider using a smaller model, "
+            f"a memory-mapped artifact, or increase system resources."
+        )
+    elif size_mb > HEAP_FILE_SIZE_WARN_MB:
+        logger.warning(f"Loading large model file: {file_path} ({size_mb:.1f}MB)")
+
+
+def infer_format(path: str) -> str:
+    """Infer the artifact format from the file extension."""
+    fmt = _EXTENSION_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ArtifactError(
+            f"Cannot infer artifact format of {path!r}; set 'format' to one of {', '.join(ARTIFACT_FORMATS)}"
+        )
+    return fmt
+
+
+def load_artifact(path: str, format: Optional[str] = None, mmap: bool = True) -> Any:
+    """Load a single artifact, memory-mapping its array data when possible.
+
+    Args:
+        path: Artifact file path
+        format: npy|joblib|pickle (inferred from the extension if omitted)
+        mmap: Map array data read-only instead of reading it onto the heap
+
+    Returns:
+        The loaded object (np.memmap-backed arrays for mapped artifacts)
+    """
+    fmt = format or infer_format(path)
+    if fmt not in ARTIFACT_FORMATS:
+        raise ArtifactError(f"Unknown artifact format {fmt!r}; expected one of {', '.join(ARTIFACT_FORMATS)}")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Artifact not found: {path}")
+
+    mapped = mmap and fmt in MMAP_FORMATS
+    if not mapped:
+        check_heap_file_size(path)
+
+    if fmt == "npy":
+        return np.load(path, mmap_mode="r" if mapped else None, allow_pickle=False)
+    if fmt == "joblib":
+        import joblib
+        return joblib.load(path, mmap_mode="r" if mapped else None)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _normalize_spec(spec: Union[str, Dict[str, Any], Any], base_dir: Optional[str]) -> Dict[str, Any]:
+    """Turn an artifact entry (path string, dict or ArtifactConfig) into loader arguments."""
+    if isinstance(spec, str):
+        spec = {"path": spec}
+    elif hasattr(spec, "model_dump"):
+        spec = spec.model_dump()
+    elif not isinstance(spec, dict) or "path" not in spec:
+        raise ArtifactError(f"Invalid artifact specification: {spec!r}")
+
+    path = spec["path"]
+    if base_dir and not os.path.isabs(path):
+        path = os.path.join(base_dir, path)
+    return {"path": path, "format": spec.get("format"), "mmap": spec.get("mmap", True)}
+
+
+def read_manifest(manifest_path: str) -> Dict[str, Any]:
+    """Read an artifact manifest file and return its ``artifacts`` mapping."""
+    with open(manifest_path) as f:
+        document = yaml.safe_load(f) or {}
+    artifacts = document.get("artifacts") if isinstance(document, dict) else None
+    if not isinstance(artifacts, dict):
+        raise ArtifactError(f"Artifact manifest {manifest_path} must contain an 'artifacts' mapping")
+    return artifacts
+
+
+def load_artifacts(artifacts: Union[str, Dict[str, Any], None], config_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Load every declared artifact.
+
+    Args:
+        artifacts: Inline mapping of name -> spec, or path of a manifest file
+        config_dir: Directory relative paths are resolved against (the manifest's
+            own directory for artifacts listed in a manifest)
+
+    Returns:
+        Mapping of artifact name -> loaded object (several artifacts load concurrently)
+    """
+    if not artifacts:
+        return {}
+
+    base_dir = config_dir
+    if isinstance(artifacts, str):
+        manifest_path = artifacts
+        if config_dir and not os.path.isabs(manifest_path):
+            manifest_path = os.path.join(config_dir, manifest_path)
+        artifacts = read_manifest(manifest_path)
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    specs = {name: _normalize_spec(spec, base_dir) for name, spec in artifacts.items()}
+    if len(specs) == 1:
+        return {name: _load_named_artifact(name, kwargs) for name, kwargs in specs.items()}
+
+    # Artifacts are independent: read and deserialize them concurrently
+    workers = min(len(specs), MAX_PARALLEL_ARTIFACT_LOADS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mlserver-artifact") as pool:
+        futures = {name: pool.submit(_load_named_artifact, name, kwargs) for name, kwargs in specs.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _load_named_artifact(name: str, kwargs: Dict[str, Any]) -> Any:
+    started = time.perf_counter()
+    artifact = load_artifact(**kwargs)
+    mapped = kwargs["mmap"] and (kwargs["format"] or infer_format(kwargs["path"])) in MMAP_FORMATS
+    logger.info(
+        f"Loaded artifact '{name}' from {kwargs['path']}{' (memory-mapped)' if mapped else ''} "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return artifact
+
+
+def artifact_paths(artifacts: Union[str, Dict[str, Any], None], config_dir: Optional[str] = None) -> List[str]:
+    """Files behind the declared artifacts (including the manifest file, if any)."""
+    if not artifacts:
+        return []
+
+    paths = []
+    base_dir = config_dir
+    if isinstance(artifacts, str):
+        manifest_path = artifacts
+        if config_dir and not os.path.isabs(manifest_path):
+            manifest_path = os.path.join(config_dir, manifest_path)
+        paths.append(manifest_path)
+        artifacts = read_manifest(manifest_path)
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    paths.extend(_normalize_spec(spec, base_dir)["path"] for spec in artifacts.values())
+    return paths
@@ -6,14 +6,21 @@ This module provides automatic detection of:
 - Deployment timestamps
 - MLServer package version
 - Project name from git or directory
+
+Detection runs git subprocesses and scans installed packages. The server
+captures the results once per loaded model with ``capture_metadata`` and
+serves them from the resulting ``MetadataSnapshot``; request handlers never
+call the detection functions directly.
 """
 
 import os
 import re
 import subprocess
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 import importlib.metadata
 
 
@@ -94,45 +101,32 @@ def get_git_info(project_path: str = ".") -> Dict[str, Any]:
         info["dirty"] = False
         return info
 
-    try:
-        original_cwd = os.getcwd()
-        os.chdir(project_path)
+    def git(*args: str) -> str:
+        # cwd per command instead of os.chdir, which would affect every thread
+        return subprocess.check_output(
+            ['git', *args], cwd=project_path, stderr=subprocess.DEVNULL
+        ).decode().strip()
 
+    try:
         # Get current commit (short hash)
-        info["commit"] = subprocess.check_output(
-            ['git', 'rev-parse', '--short', 'HEAD'],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
+        info["commit"] = git('rev-parse', '--short', 'HEAD')
 
         # Get current branch
-        info["branch"] = subprocess.check_output(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
+        info["branch"] = git('rev-parse', '--abbrev-ref', 'HEAD')
 
         # Check if working directory is dirty
-        status = subprocess.check_output(
-            ['git', 'status', '--porcelain'],
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
-        info["dirty"] = len(status) > 0
+        info["dirty"] = len(git('status', '--porcelain')) > 0
 
         # Get tag at current commit (if any)
         try:
-            info["tag"] = subprocess.check_output(
-                ['git', 'describe', '--tags', '--exact-match', 'HEAD'],
-                stderr=subprocess.DEVNULL
-            ).decode().strip()
+            info["tag"] = git('describe', '--tags', '--exact-match', 'HEAD')
         except subprocess.CalledProcessError:
             # No tag at current commit
             pass
 
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
         # Not a git repository or git not installed
         pass
-    finally:
-        if 'original_cwd' in locals():
-            os.chdir(original_cwd)
 
     return info
 
@@ -296,7 +290,37 @@ def generate_simplified_metadata(config: Dict[str, Any], project_path: str = "."
     return {k: v for k, v in metadata.items() if v is not None}
 
 
-def get_simplified_info_response(config: Dict[str, Any], predictor_class_name: str, project_path: str = ".") -> Dict[str, Any]:
+@dataclass(frozen=True)
+class MetadataSnapshot:
+    """Git and environment metadata captured once and served from memory."""
+    project: str
+    git: Mapping[str, Any]
+    mlserver: Mapping[str, Any]
+    deployed_at: str
+
+
+def capture_metadata(project_path: str = ".") -> MetadataSnapshot:
+    """
+    Detect the classifier and MLServer metadata (runs git subprocesses).
+
+    Args:
+        project_path: Path to the project
+
+    Returns:
+        Immutable snapshot; capture it at startup or model reload, not per request
+    """
+    git_info = get_git_info(project_path)
+    project = git_info.get("repository") or os.path.basename(os.path.abspath(project_path)).lower()
+    return MetadataSnapshot(
+        project=project,
+        git=MappingProxyType(dict(git_info)),
+        mlserver=MappingProxyType(dict(get_mlserver_git_info())),
+        deployed_at=get_deployed_timestamp(),
+    )
+
+
+def get_simplified_info_response(config: Dict[str, Any], predictor_class_name: str, project_path: str = ".",
+                                 snapshot: Optional[MetadataSnapshot] = None) -> Dict[str, Any]:
     """
     Generate simplified /info endpoint response.
 
@@ -304,21 +328,22 @@ def get_simplified_info_response(config: Dict[str, Any], predictor_class_name: s
         config: The loaded configuration dictionary
         predictor_class_name: Name of the predictor class
         project_path: Path to the project
+        snapshot: Previously captured metadata (captured now if omitted)
 
     Returns:
         Simplified info response dict
     """
-    git_info = get_git_info(project_path)
-    mlserver_info = get_mlserver_git_info()
+    snapshot = snapshot or capture_metadata(project_path)
+    git_info = snapshot.git
 
     classifier_config = config.get('classifier', {})
 
     return {
-        "project": git_info.get("repository") or get_project_name(project_path),
+        "project": snapshot.project,
         "classifier": classifier_config.get("name", "unknown"),
         "description": classifier_config.get("description", ""),
         "predictor_class": predictor_class_name,
-        "deployed_at": get_deployed_timestamp(),
+        "deployed_at": snapshot.deployed_at,
         "classifier_repository": {
             "repository": git_info.get("repository"),
             "commit": git_info.get("commit"),
@@ -326,7 +351,7 @@ def get_simplified_info_response(config: Dict[str, Any], predictor_class_name: s
             "branch": git_info.get("branch"),
             "dirty": git_info.get("dirty")
         },
-        "api_service": mlserver_info,
+        "api_service": dict(snapshot.mlserver),
         "endpoints": {
             "predict": "/predict",
             "predict_proba": "/predict_proba",
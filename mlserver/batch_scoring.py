@@ -0,0 +1,296 @@
+"""
+Offline batch scoring of large input files (``mlserver score``).
+
+The input file is read in chunks of ``chunk_size`` rows. Every chunk goes
+through the same adapter settings as the HTTP API (``api.feature_order``,
+``api.input_dtype``, ``api.feature_dtypes``) and is scored by the predictor
+from ``mlserver.yaml``. With more than one worker, chunks are scored in
+separate processes that each load the predictor once; at most two chunks per
+worker are in flight, so memory stays bounded by the chunk size whatever the
+size of the file. Output rows are written in input order.
+
+Supported formats (chosen by file extension):
+
+- ``.csv``
+- ``.ndjson`` / ``.jsonl``: one JSON record per line
+- ``.parquet`` / ``.pq`` (requires pyarrow)
+"""
+import logging
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import process_pool
+from .adapters import AdapterError, MAX_RECORDS, columns_to_ndarray
+from .config import AppConfig
+from .predictor_loader import load_predictor
+
+logger = logging.getLogger(__name__)
+
+SCORE_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+DEFAULT_CHUNK_SIZE = MAX_RECORDS
+
+
+@dataclass
+class ScoringSummary:
+    """Outcome of a batch scoring run."""
+    rows: int
+    chunks: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def detect_format(path: Path) -> str:
+    """Return the file format for a path based on its extension."""
+    fmt = SCORE_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        supported = ", ".join(sorted(SCORE_FORMATS))
+        raise ValueError(f"Unsupported file type: {path} (supported: {supported})")
+    return fmt
+
+
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet files require the 'pyarrow' package. Install with: pip install pyarrow")
+    return pa, pq
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Input and output
+# ─────────────────────────────────────────────────────────────────────────────
+
+def iter_chunks(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read an input file as DataFrames of at most ``chunk_size`` rows."""
+    fmt = detect_format(path)
+    if fmt == "csv":
+        with pd.read_csv(path, chunksize=chunk_size) as reader:
+            yield from reader
+    elif fmt == "ndjson":
+        with pd.read_json(path, lines=True, chunksize=chunk_size) as reader:
+            yield from reader
+    else:
+        _, pq = _import_parquet()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """Append scored chunks to an output file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.format = detect_format(self.path)
+        self._file = None
+        self._parquet_writer = None
+        self._schema = None
+        self._header = True
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.format == "parquet":
+            self._write_parquet(frame)
+            return
+        if self._file is None:
+            self._file = open(self.path, "w", newline="")
+        if self.format == "csv":
+            frame.to_csv(self._file, header=self._header, index=False)
+            self._header = False
+        else:
+            text = frame.to_json(orient="records", lines=True)
+            self._file.write(text if text.endswith("\n") else text + "\n")
+
+    def _write_parquet(self, frame: pd.DataFrame) -> None:
+        pa, pq = _import_parquet()
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._parquet_writer is None:
+            self._schema = table.schema
+            self._parquet_writer = pq.ParquetWriter(self.path, self._schema)
+        elif table.schema != self._schema:
+            table = table.cast(self._schema)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Chunk scoring
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ChunkScorer:
+    """Picklable chunk scoring settings shared by the parent and worker processes."""
+
+    def __init__(self, method: str = "predict", feature_order: Optional[List[str]] = None,
+                 input_dtype: str = "object", feature_dtypes: Optional[Dict[str, str]] = None,
+                 keep_columns: Optional[List[str]] = None):
+        if method not in ("predict", "predict_proba"):
+            raise ValueError(f"Unknown prediction method: {method}")
+        self.method = method
+        self.feature_order = feature_order
+        self.input_dtype = input_dtype
+        self.feature_dtypes = feature_dtypes
+        self.keep_columns = list(keep_columns or [])
+
+    def to_ndarray(self, frame: pd.DataFrame) -> np.ndarray:
+        """Convert a chunk to the model input array using the API adapter settings."""
+        missing = [c for c in self.keep_columns if c not in frame.columns]
+        if missing:
+            raise AdapterError(f"Input is missing columns to keep: {missing}")
+        # Without an explicit feature order every column except the kept ones is a feature,
+        # sorted by name like the records adapter of the API does
+        names = self.feature_order or sorted(c for c in frame.columns if c not in self.keep_columns)
+        columns = {name: frame[name].to_numpy() for name in names if name in frame.columns}
+        return columns_to_ndarray(
+            columns,
+            feature_order=names,
+            input_dtype=self.input_dtype,
+            feature_dtypes=self.feature_dtypes,
+        )
+
+    def __call__(self, predictor: Any, frame: pd.DataFrame) -> pd.DataFrame:
+        """Score one chunk and build its output rows."""
+        if self.method == "predict_proba" and not hasattr(predictor, "predict_proba"):
+            raise AttributeError("Predictor does not support predict_proba")
+        result = np.asarray(getattr(predictor, self.method)(self.to_ndarray(frame)))
+        if result.ndim == 0 or len(result) != len(frame):
+            raise ValueError(
+                f"{self.method} returned {result.size} values for a chunk of {len(frame)} rows"
+            )
+
+        prefix = "probability" if self.method == "predict_proba" else "prediction"
+        if result.ndim == 1:
+            scored = pd.DataFrame({prefix: result})
+        else:
+            result = result.reshape(len(result), -1)
+            scored = pd.DataFrame(result, columns=[f"{prefix}_{i}" for i in range(result.shape[1])])
+        if self.keep_columns:
+            kept = frame[self.keep_columns].reset_index(drop=True)
+            scored = pd.concat([kept, scored], axis=1)
+        return scored
+
+
+def _score_in_worker(scorer: ChunkScorer, frame: pd.DataFrame) -> pd.DataFrame:
+    return scorer(process_pool.worker_predictor(), frame)
+
+
+def score_file(
+    config: AppConfig,
+    input_path: Path,
+    output_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    method: str = "predict",
+    keep_columns: Optional[List[str]] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> ScoringSummary:
+    """
+    Score every row of an input file and write the results to an output file.
+
+    Args:
+        config: Application configuration (predictor and API adapter settings)
+        input_path: File to score
+        output_path: File to write; its extension selects the output format
+        chunk_size: Rows read, converted and scored at a time
+        workers: Number of scoring processes (1 scores in this process)
+        method: "predict" or "predict_proba"
+        keep_columns: Input columns copied to the output next to the predictions
+        progress: Optional callback receiving the row count of every written chunk
+
+    Returns:
+        ScoringSummary with the row count and elapsed time
+
+    Raises:
+        ValueError: For unsupported file types, bad settings or invalid input rows
+    """
+    if not 1 <= chunk_size <= MAX_RECORDS:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_RECORDS}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    detect_format(input_path)
+    writer = ChunkWriter(output_path)
+
+    base_path = Path(config.project_path_internal) if config.project_path_internal else Path.cwd()
+    scorer = ChunkScorer(
+        method=method,
+        feature_order=config.api.get_resolved_feature_order(base_path=base_path),
+        input_dtype=config.api.input_dtype,
+        feature_dtypes=config.api.feature_dtypes,
+        keep_columns=keep_columns,
+    )
+    config_dir = config.project_path if config.project_path else None
+    predictor_args = (
+        config.predictor.module, config.predictor.class_name,
+        config.predictor.init_kwargs or {}, config_dir, config.predictor.artifacts,
+    )
+
+    rows = chunks = 0
+    started = time.perf_counter()
+
+    def emit(scored: pd.DataFrame) -> None:
+        nonlocal rows, chunks
+        writer.write(scored)
+        rows += len(scored)
+        chunks += 1
+        if progress is not None:
+            progress(len(scored))
+
+    try:
+        if workers == 1:
+            predictor = load_predictor(
+                config.predictor.module, config.predictor.class_name, config.predictor.init_kwargs or {},
+                config_dir=config_dir, artifacts=config.predictor.artifacts
+            )
+            for frame in iter_chunks(input_path, chunk_size):
+                emit(scorer(predictor, frame))
+        else:
+            # spawn: the workers must not inherit the parent's open files and threads
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=process_pool._init_worker,
+                initargs=predictor_args,
+            ) as pool:
+                pending = deque()
+                try:
+                    for frame in iter_chunks(input_path, chunk_size):
+                        # Two chunks per worker keep the pool busy while bounding memory
+                        if len(pending) >= 2 * workers:
+                            emit(pending.popleft().result())
+                        pending.append(pool.submit(_score_in_worker, scorer, frame))
+                    while pending:
+                        emit(pending.popleft().result())
+                except BaseException:
+                    for future in pending:
+                        future.cancel()
+                    raise
+    finally:
+        writer.close()
+
+    summary = ScoringSummary(rows=rows, chunks=chunks, seconds=time.perf_counter() - started)
+    logger.info(
+        f"Scored {summary.rows} rows in {summary.chunks} chunks "
+        f"({summary.seconds:.2f}s, {summary.rows_per_second:.0f} rows/s)"
+    )
+    return summary
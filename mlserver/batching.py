@@ -0,0 +1,204 @@
+"""
+Dynamic micro-batching for prediction requests.
+
+Concurrent single-record requests are collected for a short window, stacked
+into one matrix and sent to the predictor in a single call. The rows of the
+result are then scattered back to the waiting callers. This amortizes the
+per-call overhead of libraries such as CatBoost and scikit-learn.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class BatchingError(RuntimeError):
+    """Raised when a batched prediction result cannot be split back into per-request results."""
+    pass
+
+
+class _BatchItem:
+    """A single request waiting in the batching queue."""
+
+    __slots__ = ("method", "X", "rows", "enqueued_at", "future")
+
+    def __init__(self, method: str, X: np.ndarray):
+        self.method = method
+        self.X = X
+        self.rows = X.shape[0]
+        self.enqueued_at = time.perf_counter()
+        self.future: Future = Future()
+
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collect concurrent prediction calls and dispatch them as one batch.
+
+    A single background thread owns the predictor calls. The first request of a
+    batch waits at most ``max_wait_ms`` for further requests; the batch is sent
+    as soon as ``max_batch_size`` rows are collected. Under low load a batch
+    therefore holds a single request, and under high load batches grow towards
+    the configured maximum.
+    """
+
+    def __init__(self, predictor: Any, max_batch_size: int = 64, max_wait_ms: float = 5.0,
+                 metrics_getter: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the batcher.
+
+        Args:
+            predictor: Object exposing ``predict`` and optionally ``predict_proba``
+            max_batch_size: Maximum number of rows per predictor call
+            max_wait_ms: Maximum time the first request of a batch waits for others
+            metrics_getter: Callable returning the active MetricsCollector (or None)
+        """
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._metrics_getter = metrics_getter
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._carry: Optional[_BatchItem] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="mlserver-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, method: str, X: np.ndarray) -> Any:
+        """Enqueue ``X`` for ``predictor.<method>`` and block until its rows are predicted."""
+        return self.submit_async(method, X).result()
+
+    def submit_async(self, method: str, X: np.ndarray) -> Future:
+        """Enqueue ``X`` for ``predictor.<method>`` and return a future for its result."""
+        if self._closed:
+            raise RuntimeError("Batcher is closed")
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        item = _BatchItem(method, X)
+        self._queue.put(item)
+        return item.future
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the background thread after the queued requests are dispatched."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Background loop
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._carry if self._carry is not None else self._queue.get()
+            self._carry = None
+            if first is _STOP:
+                break
+
+            batch = [first]
+            rows = first.rows
+            deadline = first.enqueued_at + self.max_wait
+
+            while rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    nxt = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _STOP:
+                    stopping = True
+                    break
+                if rows + nxt.rows > self.max_batch_size:
+                    # Does not fit - start the next batch with it
+                    self._carry = nxt
+                    break
+                batch.append(nxt)
+                rows += nxt.rows
+
+            self._dispatch(batch)
+
+        # Dispatch anything still queued when close() was called
+        if self._carry is not None:
+            self._dispatch([self._carry])
+            self._carry = None
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._dispatch([item])
+
+    def _dispatch(self, batch: List[_BatchItem]) -> None:
+        # Requests for different methods or feature counts cannot share a matrix
+        groups: Dict[Tuple[str, int], List[_BatchItem]] = {}
+        for item in batch:
+            n_cols = item.X.shape[1] if item.X.ndim > 1 else 0
+            groups.setdefault((item.method, n_cols), []).append(item)
+
+        for (method, _), items in groups.items():
+            self._dispatch_group(method, items)
+
+    def _dispatch_group(self, method: str, items: List[_BatchItem]) -> None:
+        dispatched_at = time.perf_counter()
+        try:
+            if len(items) == 1:
+                X = items[0].X
+            else:
+                X = np.concatenate([item.X for item in items], axis=0)
+
+            result = getattr(self.predictor, method)(X)
+            parts = _split_rows(result, [item.rows for item in items])
+        except Exception as e:  # propagate to every caller in the batch
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        for item, part in zip(items, parts):
+            item.future.set_result(part)
+
+        metrics = self._metrics_getter() if self._metrics_getter else None
+        if metrics:
+            metrics.track_batch(
+                method,
+                sum(item.rows for item in items),
+                [dispatched_at - item.enqueued_at for item in items]
+            )
+
+
+def _split_rows(result: Any, row_counts: List[int]) -> List[Any]:
+    """Split a batched predictor result into per-request slices along the first axis."""
+    if len(row_counts) == 1:
+        return [result]
+
+    total = sum(row_counts)
+    if isinstance(result, (list, tuple)):
+        if len(result) != total:
+            raise BatchingError(
+                f"Predictor returned {len(result)} results for a batch of {total} rows"
+            )
+    elif hasattr(result, "shape") and len(result.shape) > 0:
+        if result.shape[0] != total:
+            raise BatchingError(
+                f"Predictor returned {result.shape[0]} results for a batch of {total} rows"
+            )
+    else:
+        raise BatchingError(
+            f"Cannot split predictor output of type {type(result).__name__} into per-request results"
+        )
+
+    parts = []
+    start = 0
+    for count in row_counts:
+        parts.append(result[start:start + count])
+        start += count
+    return parts
@@ -0,0 +1,415 @@
+"""
+Benchmark of the prediction endpoints (``mlserver bench``).
+
+Every case sends ``requests`` prediction requests of ``batch_size`` synthetic
+all-zero rows (built from ``api.feature_order``) to the app built from
+``mlserver.yaml`` with ``concurrency`` requests in flight, and reports
+throughput and latency percentiles. Cases sweep:
+
+- transport: ``asgi`` calls the app in-process through its ASGI interface (no
+  network, no HTTP parsing), ``http`` goes through uvicorn on a loopback
+  socket; the difference between the two is the cost of the HTTP layer
+- adapter (``api.adapter``): one app per adapter, all sharing one predictor
+- batch size
+- response format, chosen with the Accept header (``json``, ``msgpack``,
+  ``npy``, ``arrow``)
+
+The client runs in the same event loop as the app, so the numbers are meant to
+be compared between runs on the same machine rather than read as the capacity
+of a deployment. Server-Timing is enabled for the run, and the mean time of
+each stage (``predict`` being the model itself) is recorded with every case.
+The prediction cache and the artifact file watcher are turned off: the
+synthetic rows are identical, so cached responses would not measure the model.
+The predictor is loaded once and called on the inference threads of every
+app, so ``api.inference_backend: process`` is not benchmarked.
+
+Results are saved as JSON; ``compare_results`` checks them against a
+previously saved baseline and lists the cases whose throughput dropped or
+whose p99 latency grew by more than a tolerance.
+"""
+import asyncio
+import json
+import logging
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from . import codecs
+from .adapters import MAX_RECORDS
+from .config import AppConfig
+from .metrics import init_metrics
+from .observability import SERVER_TIMING_HEADER
+from .predictor_loader import load_predictor
+from .server import create_app
+from .warmup import synthetic_payload
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("asgi", "http")
+ADAPTERS = ("records", "ndarray", "columns", "auto")
+RESPONSE_FORMATS = {
+    "json": codecs.JSON,
+    "msgpack": codecs.MSGPACK,
+    "npy": codecs.NPY,
+    "arrow": codecs.ARROW_STREAM,
+}
+
+DEFAULT_TRANSPORTS = ["asgi", "http"]
+DEFAULT_ADAPTERS = ["records", "ndarray", "auto"]
+DEFAULT_BATCH_SIZES = [1, 100]
+DEFAULT_RESPONSE_FORMATS = ["json"]
+
+
+@dataclass
+class BenchResult:
+    """Throughput and latency of one benchmark case."""
+    transport: str
+    adapter: str
+    response_format: str
+    batch_size: int
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_second: float
+    rows_per_second: float
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+    stages_ms: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Identifies the case across runs."""
+        return f"{self.transport}/{self.adapter}/{self.response_format}/batch={self.batch_size}"
+
+
+@dataclass
+class Regression:
+    """A case that got worse than the baseline by more than the tolerance."""
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (negative when the value dropped)."""
+        return (self.current - self.baseline) / self.baseline
+
+
+def bench_payload(feature_order: List[str], adapter: str, rows: int,
+                  feature_dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Synthetic request payload of ``rows`` all-zero rows in the format of ``adapter``."""
+    if adapter == "columns":
+        records = synthetic_payload(feature_order, "records", 1, feature_dtypes)["records"][0]
+        return {"columns": {name: [value] * rows for name, value in records.items()}}
+    # The auto adapter is sent records, the format clients use most
+    return synthetic_payload(feature_order, adapter, rows, feature_dtypes)
+
+
+def summarize(transport: str, adapter: str, response_format: str, batch_size: int,
+              latencies: List[float], errors: int, seconds: float,
+              stage_totals: Dict[str, float]) -> BenchResult:
+    """
+    Build the result of a case from its raw measurements.
+
+    Args:
+        latencies: Seconds taken by every request, failed ones included
+        errors: Number of requests that did not return HTTP 200
+        seconds: Wall-clock duration of the case
+        stage_totals: Server-Timing milliseconds summed over the requests, per stage
+    """
+    requests = len(latencies)
+    if requests:
+        p50, p99, p999 = np.percentile(np.asarray(latencies) * 1000, [50, 99, 99.9])
+    else:
+        p50 = p99 = p999 = 0.0
+    completed = requests - errors
+    rate = completed / seconds if seconds > 0 else 0.0
+    return BenchResult(
+        transport=transport,
+        adapter=adapter,
+        response_format=response_format,
+        batch_size=batch_size,
+        requests=requests,
+        errors=errors,
+        seconds=round(seconds, 4),
+        requests_per_second=round(rate, 2),
+        rows_per_second=round(rate * batch_size, 2),
+        p50_ms=round(float(p50), 4),
+        p99_ms=round(float(p99), 4),
+        p999_ms=round(float(p999), 4),
+        stages_ms={stage: round(total / completed, 4) for stage, total in stage_totals.items()} if completed else {},
+    )
+
+
+def _add_server_timing(header: Optional[str], totals: Dict[str, float]) -> None:
+    if not header:
+        return
+    for entry in header.split(","):
+        name, _, duration = entry.strip().partition(";dur=")
+        if duration:
+            totals[name] = totals.get(name, 0.0) + float(duration)
+
+
+async def run_case(client: httpx.AsyncClient, path: str, body: bytes, accept: str,
+                   requests: int, concurrency: int, warmup: int) -> tuple:
+    """
+    Send ``warmup`` unmeasured requests, then ``requests`` measured ones.
+
+    Returns:
+        (latencies in seconds, errors, wall-clock seconds, Server-Timing totals per stage)
+    """
+    headers = {"Content-Type": codecs.JSON, "Accept": accept}
+    for _ in range(warmup):
+        await client.post(path, content=body, headers=headers)
+
+    latencies: List[float] = []
+    stage_totals: Dict[str, float] = {}
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, content=body, headers=headers)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                response, ok = None, False
+            latencies.append(time.perf_counter() - started)
+            if ok:
+                _add_server_timing(response.headers.get(SERVER_TIMING_HEADER), stage_totals)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    return latencies, errors, time.perf_counter() - started, stage_totals
+
+
+async def _serve_http(app, ready_timeout: float = 10.0):
+    """Start uvicorn for ``app`` on a free loopback port; returns (server, task, base URL)."""
+    import uvicorn
+
+    # The app's lifespan is run by the benchmark, which shares it between transports
+    server = uvicorn.Server(uvicorn.Config(
+        app, host="127.0.0.1", port=0, lifespan="off", access_log=False, log_config=None
+    ))
+    # Signal handlers belong to the CLI process, not to this embedded server
+    server.install_signal_handlers = lambda: None
+    task = asyncio.create_task(server.serve())
+    deadline = time.monotonic() + ready_timeout
+    while not server.started:
+        if task.done() or time.monotonic() > deadline:
+            server.should_exit = True
+            await asyncio.gather(task, return_exceptions=True)
+            raise RuntimeError("Benchmark HTTP server failed to start")
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, f"http://127.0.0.1:{port}"
+
+
+async def _bench_app(app, config: AppConfig, adapter: str, feature_order: List[str],
+                     endpoint: str, transports: List[str], batch_sizes: List[int],
+                     response_formats: List[str], requests: int, concurrency: int, warmup: int,
+                     progress: Optional[Callable[[BenchResult], None]]) -> List[BenchResult]:
+    base_path = config.get_base_path()
+    path = f"{base_path}/{endpoint}" if base_path else f"/{endpoint}"
+    bodies = {
+        batch_size: json.dumps({
+            "payload": bench_payload(feature_order, adapter, batch_size, config.api.feature_dtypes)
+        }).encode()
+        for batch_size in batch_sizes
+    }
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    results = []
+    for transport in transports:
+        server = task = None
+        if transport == "http":
+            server, task, base_url = await _serve_http(app)
+            client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0)
+        else:
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://bench")
+        try:
+            for batch_size in batch_sizes:
+                for response_format in response_formats:
+                    latencies, errors, seconds, stage_totals = await run_case(
+                        client, path, bodies[batch_size], RESPONSE_FORMATS[response_format],
+                        requests, concurrency, warmup
+                    )
+                    result = summarize(
+                        transport, adapter, response_format, batch_size,
+                        latencies, errors, seconds, stage_totals
+                    )
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+        finally:
+            await client.aclose()
+            if server is not None:
+                server.should_exit = True
+                await task
+    return results
+
+
+async def run_benchmark(config: AppConfig,
+                        transports: List[str] = DEFAULT_TRANSPORTS,
+                        adapters: List[str] = DEFAULT_ADAPTERS,
+                        batch_sizes: List[int] = DEFAULT_BATCH_SIZES,
+                        response_formats: List[str] = DEFAULT_RESPONSE_FORMATS,
+                        requests: int = 1000,
+                        concurrency: int = 1,
+                        warmup: int = 50,
+                        endpoint: str = "predict",
+                        predictor: Any = None,
+                        progress: Optional[Callable[[BenchResult], None]] = None) -> List[BenchResult]:
+    """
+    Run every combination of transport, adapter, batch size and response format.
+
+    Args:
+        config: Application configuration (its ``api.adapter`` is replaced per case;
+            ``api.cache`` and ``api.reload.watch`` are turned off)
+        endpoint: ``predict`` or ``predict_proba``
+        predictor: Predictor instance; loaded from ``config.predictor`` (and closed
+            at the end) when omitted
+        progress: Called with the result of every case as soon as it is done
+
+    Returns:
+        One result per case
+    """
+    _check_cases(config, transports, adapters, batch_sizes, response_formats, endpoint)
+    feature_order = config.api.get_resolved_feature_order(
+        base_path=Path(config.project_path_internal) if config.project_path_internal else Path.cwd()
+    )
+    if not feature_order:
+        raise ValueError("Benchmarking needs api.feature_order to build request payloads")
+
+    owns_predictor = predictor is None
+    if owns_predictor:
+        predictor = await asyncio.to_thread(
+            load_predictor,
+            config.predictor.module,
+            config.predictor.class_name,
+            config.predictor.init_kwargs or {},
+            config_dir=config.project_path if config.project_path else None,
+            artifacts=config.predictor.artifacts,
+        )
+    # One collector for all the apps, which would otherwise each register the metrics again
+    metrics = init_metrics(type(predictor).__name__) if config.observability.metrics else None
+
+    results: List[BenchResult] = []
+    try:
+        for adapter in adapters:
+            results.extend(await _bench_adapter(
+                config, adapter, predictor, metrics, feature_order, endpoint, transports, batch_sizes,
+                response_formats, requests, concurrency, warmup, progress
+            ))
+    finally:
+        # The apps share the predictor and leave closing it to its owner
+        if owns_predictor and hasattr(predictor, "close"):
+            predictor.close()
+    return results
+
+
+async def _bench_adapter(config: AppConfig, adapter: str, predictor: Any, metrics, feature_order: List[str],
+                         endpoint: str, transports: List[str], batch_sizes: List[int],
+                         response_formats: List[str], requests: int, concurrency: int, warmup: int,
+                         progress: Optional[Callable[[BenchResult], None]]) -> List[BenchResult]:
+    """Run every case of one adapter against its own app."""
+    # Every request of a case sends the same rows, so the prediction cache would answer
+    # all but the first without calling the model; a file watcher would reload the model
+    # mid-run
+    app_config = config.model_copy(update={
+        "api": config.api.model_copy(update={
+            "adapter": adapter,
+            "cache": config.api.cache.model_copy(update={"enabled": False}),
+            "reload": config.api.reload.model_copy(update={"watch": False}),
+        }),
+        "observability": config.observability.model_copy(update={"server_timing": True}),
+    })
+    app = create_app(app_config, preloaded_predictor=predictor, metrics_getter=lambda: metrics)
+    logger.info(f"Benchmarking the {adapter} adapter")
+    async with app.router.lifespan_context(app):
+        return await _bench_app(
+            app, app_config, adapter, feature_order, endpoint, transports, batch_sizes,
+            response_formats, requests, concurrency, warmup, progress
+        )
+
+
+def _check_cases(config: AppConfig, transports: List[str], adapters: List[str], batch_sizes: List[int],
+                 response_formats: List[str], endpoint: str) -> None:
+    for name, values, allowed in (
+        ("transport", transports, TRANSPORTS),
+        ("adapter", adapters, ADAPTERS),
+        ("response format", response_formats, RESPONSE_FORMATS),
+    ):
+        unknown = [value for value in values if value not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown {name} {', '.join(unknown)} (expected one of {', '.join(allowed)})")
+    for batch_size in batch_sizes:
+        if not 1 <= batch_size <= MAX_RECORDS:
+            raise ValueError(f"Batch size must be between 1 and {MAX_RECORDS}, got {batch_size}")
+    for response_format in response_formats:
+        codecs.ensure_codec_available(RESPONSE_FORMATS[response_format])
+    if not config.is_endpoint_enabled(endpoint):
+        raise ValueError(f"Endpoint {endpoint} is disabled in the configuration")
+
+
+def results_document(results: List[BenchResult], config: AppConfig, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON document of a benchmark run, as saved with ``--output``."""
+    from . import __version__
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mlserver_version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "classifier": config.classifier.get("name"),
+        "predictor": config.predictor.class_name,
+        "settings": settings,
+        "results": [{"key": result.key, **asdict(result)} for result in results],
+    }
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a document saved with ``--output``."""
+    with open(path) as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or not isinstance(document.get("results"), list):
+        raise ValueError(f"Not a benchmark results file: {path}")
+    return document
+
+
+def compare_results(results: List[BenchResult], baseline: Dict[str, Any],
+                    tolerance: float = 0.10) -> List[Regression]:
+    """
+    Compare results with a baseline document.
+
+    A case regressed when its throughput is more than ``tolerance`` (a fraction)
+    below the baseline, or its p99 latency more than ``tolerance`` above it.
+    Cases missing from either side are not compared.
+    """
+    previous = {entry["key"]: entry for entry in baseline["results"]}
+    regressions = []
+    for result in results:
+        entry = previous.get(result.key)
+        if entry is None:
+            continue
+        if entry["requests_per_second"] > 0 and (
+                result.requests_per_second < entry["requests_per_second"] * (1 - tolerance)):
+            regressions.append(Regression(
+                result.key, "requests_per_second", entry["requests_per_second"], result.requests_per_second
+            ))
+        if entry["p99_ms"] > 0 and result.p99_ms > entry["p99_ms"] * (1 + tolerance):
+            regressions.append(Regression(result.key, "p99_ms", entry["p99_ms"], result.p99_ms))
+    return regressions
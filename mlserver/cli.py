@@ -1,5 +1,6 @@
 """Modern CLI for ML Server using Typer."""
 
+import asyncio
 import os
 import sys
 import json
@@ -17,7 +18,10 @@ from rich.panel import Panel
 
 from .config import AppConfig
 from .server import create_app
+from .adapters import MAX_RECORDS
+from .batch_scoring import DEFAULT_CHUNK_SIZE, score_file
 from .logging_conf import configure_logging
+from .metrics import setup_multiprocess_metrics
 from .version import get_version_info
 from .container import (
     build_container,
@@ -153,6 +157,16 @@ def serve(
         "--reload",
         help="Enable auto-reload for development"
     ),
+    preload: bool = typer.Option(
+        False,
+        "--preload",
+        help="Load the model once before forking workers (shared copy-on-write memory)"
+    ),
+    all_classifiers: bool = typer.Option(
+        False,
+        "--all",
+        help="Serve every classifier of a multi-classifier config in one process (/{classifier}/predict)"
+    ),
     log_level: LogLevel = typer.Option(
         LogLevel.INFO,
         "--log-level", "-l",
@@ -176,6 +190,10 @@ def serve(
             # Load multi-classifier config
             multi_config = load_multi_classifier_config(str(config_file))
 
+            if all_classifiers:
+                _serve_all_classifiers(config_file, multi_config, host, port, workers, log_level)
+                return
+
             # Determine which classifier to use
             if not classifier:
                 classifier = get_default_classifier(str(config_file))
@@ -213,6 +231,10 @@ def serve(
                     cfg.predictor.init_kwargs, str(config_dir)
                 )
         else:
+            if all_classifiers:
+                console.print("[red]✗[/red] --all requires a multi-classifier configuration", style="bold red")
+                raise typer.Exit(1)
+
             # Single classifier configuration
             with open(config_file, "r") as f:
                 raw = yaml.safe_load(f)
@@ -235,6 +257,8 @@ def serve(
             cfg.server.port = port
         if workers:
             cfg.server.workers = workers
+        if preload:
+            cfg.server.preload = True
 
         # Override log level if specified
         cfg.server.log_level = log_level.value
@@ -270,8 +294,16 @@ def serve(
         ))
 
         # Run the server
+        if cfg.server.workers > 1 and cfg.observability.metrics and not reload:
+            # Every worker records its own metrics; /metrics aggregates them
+            setup_multiprocess_metrics(cfg.observability.multiprocess_dir)
+
+        if cfg.server.workers > 1 and cfg.server.preload and not reload:
+            # Load the model once in this process and fork the workers from it
+            from .prefork import serve_preloaded
+            serve_preloaded(cfg, config_file_name=config_file_name)
         # For multi-worker support, we need to use the factory function
-        if cfg.server.workers > 1 and not reload:
+        elif cfg.server.workers > 1 and not reload:
             # Set environment variables for the factory function
             import os
             os.environ['MLSERVER_CONFIG_PATH'] = str(config_file)
@@ -306,6 +338,375 @@ def serve(
         raise typer.Exit(1)
 
 
+def _serve_all_classifiers(config_file: Path, multi_config, host: Optional[str], port: Optional[int],
+                           workers: Optional[int], log_level: LogLevel) -> None:
+    """Serve every classifier of a multi-classifier config from one server."""
+    from .multi_model import build_model_configs, create_multi_model_app
+
+    server = multi_config.server
+    if host:
+        server.host = host
+    if port:
+        server.port = port
+    if workers:
+        server.workers = workers
+    server.log_level = log_level.value
+
+    if server.logger:
+        configure_logging(
+            level=server.log_level,
+            structured=server.logger.structured,
+            include_timestamp=server.logger.timestamp,
+            show_tasks=server.logger.show_tasks,
+            custom_format=server.logger.format
+        )
+    else:
+        configure_logging(server.log_level, multi_config.observability.structured_logging)
+
+    configs = build_model_configs(multi_config, str(config_file.resolve().parent), resolve_relative_paths)
+    serving = multi_config.serving
+    console.print(Panel.fit(
+        f"[bold cyan]ML Server Starting (multi-model)[/bold cyan]\n\n"
+        f"[yellow]→[/yellow] Host: [cyan]{server.host}:{server.port}[/cyan]\n"
+        f"[yellow]→[/yellow] Workers: [cyan]{server.workers}[/cyan]\n"
+        f"[yellow]→[/yellow] Models: [cyan]{', '.join(configs)}[/cyan]\n"
+        f"[yellow]→[/yellow] Loading: [cyan]{'lazy' if serving.lazy_loading else 'at startup'}[/cyan]\n"
+        f"[yellow]→[/yellow] API: [cyan]http://{server.host}:{server.port}/{{classifier}}/predict[/cyan]",
+        title="🚀 Server Info",
+        border_style="cyan"
+    ))
+
+    if server.workers > 1:
+        if multi_config.observability.metrics:
+            setup_multiprocess_metrics(multi_config.observability.multiprocess_dir)
+        os.environ['MLSERVER_CONFIG_PATH'] = str(config_file)
+        os.environ['MLSERVER_ALL_CLASSIFIERS'] = "1"
+        uvicorn.run(
+            "mlserver.server:app",
+            host=server.host,
+            port=server.port,
+            log_level=server.log_level.lower(),
+            workers=server.workers,
+            factory=True,
+        )
+    else:
+        uvicorn.run(
+            create_multi_model_app(multi_config, configs, config_file_name=config_file.name),
+            host=server.host,
+            port=server.port,
+            log_level=server.log_level.lower(),
+            workers=1,
+        )
+
+
+def load_app_config(config_file: Path, classifier: Optional[str] = None) -> AppConfig:
+    """Load a single or multi-classifier config file with paths resolved to its directory."""
+    config_dir = str(config_file.resolve().parent)
+
+    if detect_multi_classifier_config(str(config_file)):
+        classifier = classifier or get_default_classifier(str(config_file))
+        if not classifier:
+            available = ", ".join(list_available_classifiers(str(config_file)))
+            raise ValueError(f"No classifier specified and no default configured (available: {available})")
+        cfg = extract_single_classifier_config(load_multi_classifier_config(str(config_file)), classifier)
+        if cfg.predictor.init_kwargs:
+            cfg.predictor.init_kwargs = resolve_relative_paths(cfg.predictor.init_kwargs, config_dir)
+    else:
+        with open(config_file, "r") as f:
+            raw = yaml.safe_load(f)
+        if "predictor" in raw and "init_kwargs" in raw["predictor"]:
+            raw["predictor"]["init_kwargs"] = resolve_relative_paths(raw["predictor"]["init_kwargs"], config_dir)
+        cfg = AppConfig.model_validate(raw)
+
+    cfg.set_project_path(config_dir)
+    return cfg
+
+
+@app.command()
+def score(
+    input_file: Path = typer.Argument(
+        ...,
+        help="File to score (.csv, .ndjson/.jsonl or .parquet)",
+        exists=True,
+        dir_okay=False,
+    ),
+    output_file: Path = typer.Argument(
+        ...,
+        help="Output file; the extension selects the format",
+    ),
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        help="Path to config file (defaults to mlserver.yaml)"
+    ),
+    classifier: Optional[str] = typer.Option(
+        None,
+        "--classifier", "-c",
+        help="Classifier to use (for multi-classifier configs)"
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        max=MAX_RECORDS,
+        help="Rows read and scored at a time (bounds memory use)"
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        min=1,
+        help="Number of scoring processes"
+    ),
+    proba: bool = typer.Option(
+        False,
+        "--proba",
+        help="Write predict_proba output instead of predict"
+    ),
+    keep: Optional[List[str]] = typer.Option(
+        None,
+        "--keep", "-k",
+        help="Input column to copy to the output (repeatable, e.g. an ID column)"
+    ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.WARNING,
+        "--log-level", "-l",
+        help="Set log level"
+    ),
+):
+    """📊 Score a large input file offline with the configured predictor.
+
+    The file is processed in chunks of --chunk-size rows using the feature_order
+    and dtype settings from the config, so memory stays bounded regardless of
+    file size. Use --workers to score chunks in parallel processes.
+    """
+    try:
+        config_file = detect_config_file(config)
+        cfg = load_app_config(config_file, classifier)
+        configure_logging(log_level.value, cfg.observability.structured_logging)
+        if input_file.resolve() == output_file.resolve():
+            raise ValueError("Output file must differ from the input file")
+
+        console.print(f"[green]✓[/green] Using configuration: [cyan]{config_file}[/cyan]")
+        console.print(
+            f"[yellow]→[/yellow] Scoring [cyan]{input_file}[/cyan] with {cfg.predictor.class_name} "
+            f"({workers} worker(s), chunks of {chunk_size} rows)"
+        )
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        with Progress(
+            SpinnerColumn(), TextColumn("{task.description}"), console=console, transient=True
+        ) as progress:
+            task = progress.add_task("0 rows scored", total=None)
+            scored = 0
+
+            def advance(rows: int) -> None:
+                nonlocal scored
+                scored += rows
+                progress.update(task, description=f"{scored:,} rows scored")
+
+            summary = score_file(
+                cfg, input_file, output_file,
+                chunk_size=chunk_size,
+                workers=workers,
+                method="predict_proba" if proba else "predict",
+                keep_columns=keep,
+                progress=advance,
+            )
+
+        console.print(
+            f"[green]✓[/green] Scored [cyan]{summary.rows:,}[/cyan] rows in {summary.seconds:.2f}s "
+            f"([cyan]{summary.rows_per_second:,.0f}[/cyan] rows/sec) → [cyan]{output_file}[/cyan]"
+        )
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠[/yellow] Scoring stopped by user")
+        raise typer.Exit(130)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Error: {e}", style="bold red")
+        raise typer.Exit(1)
+
+
+@app.command()
+def bench(
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        help="Path to config file (defaults to mlserver.yaml)"
+    ),
+    classifier: Optional[str] = typer.Option(
+        None,
+        "--classifier", "-c",
+        help="Classifier to use (for multi-classifier configs)"
+    ),
+    transport: Optional[List[str]] = typer.Option(
+        None,
+        "--transport", "-t",
+        help="asgi (in-process) or http (uvicorn on loopback); repeatable [default: both]"
+    ),
+    adapter: Optional[List[str]] = typer.Option(
+        None,
+        "--adapter", "-a",
+        help="records, ndarray, columns or auto; repeatable [default: records, ndarray, auto]"
+    ),
+    batch_size: Optional[List[int]] = typer.Option(
+        None,
+        "--batch-size", "-b",
+        min=1,
+        max=MAX_RECORDS,
+        help="Rows per request; repeatable [default: 1, 100]"
+    ),
+    response_format: Optional[List[str]] = typer.Option(
+        None,
+        "--format", "-f",
+        help="Response format requested with Accept: json, msgpack, npy or arrow; repeatable [default: json]"
+    ),
+    requests: int = typer.Option(
+        1000,
+        "--requests", "-n",
+        min=1,
+        help="Measured requests per case"
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        min=1,
+        help="Requests in flight (above api.max_concurrent_predictions, the excess is rejected with 503)"
+    ),
+    warmup: int = typer.Option(
+        50,
+        "--warmup",
+        min=0,
+        help="Unmeasured requests sent before each case"
+    ),
+    proba: bool = typer.Option(
+        False,
+        "--proba",
+        help="Benchmark /predict_proba instead of /predict"
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output", "-o",
+        help="Save the results as JSON (usable as a later --baseline)"
+    ),
+    baseline: Optional[Path] = typer.Option(
+        None,
+        "--baseline",
+        help="Results file to compare against; exits with code 1 on a regression",
+        exists=True,
+        dir_okay=False,
+    ),
+    tolerance: float = typer.Option(
+        0.10,
+        "--tolerance",
+        min=0.0,
+        help="Allowed throughput drop and p99 increase relative to the baseline (0.10 = 10%)"
+    ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.WARNING,
+        "--log-level", "-l",
+        help="Set log level"
+    ),
+):
+    """⏱️ Benchmark the prediction endpoints and check for regressions.
+
+    Sends synthetic requests built from api.feature_order to the configured
+    model, in-process through ASGI and over HTTP, for every combination of
+    adapter, batch size and response format. Reports throughput and
+    p50/p99/p999 latency; the mean model time comes from Server-Timing.
+    Save a run with --output and pass it as --baseline to a later run to
+    fail on throughput or latency regressions.
+    """
+    from .bench import (
+        DEFAULT_ADAPTERS, DEFAULT_BATCH_SIZES, DEFAULT_RESPONSE_FORMATS, DEFAULT_TRANSPORTS,
+        compare_results, load_results, results_document, run_benchmark
+    )
+
+    try:
+        config_file = detect_config_file(config)
+        cfg = load_app_config(config_file, classifier)
+        configure_logging(log_level.value, cfg.observability.structured_logging)
+        previous = load_results(baseline) if baseline else None
+
+        settings = {
+            "transports": transport or DEFAULT_TRANSPORTS,
+            "adapters": adapter or DEFAULT_ADAPTERS,
+            "batch_sizes": batch_size or DEFAULT_BATCH_SIZES,
+            "response_formats": response_format or DEFAULT_RESPONSE_FORMATS,
+            "requests": requests,
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "endpoint": "predict_proba" if proba else "predict",
+        }
+        console.print(f"[green]✓[/green] Using configuration: [cyan]{config_file}[/cyan]")
+        console.print(
+            f"[yellow]→[/yellow] Benchmarking {cfg.predictor.class_name} /{settings['endpoint']} "
+            f"({requests} requests per case, concurrency {concurrency})"
+        )
+
+        def report(result) -> None:
+            note = f" [red]({result.errors} errors)[/red]" if result.errors else ""
+            console.print(
+                f"  {result.key}: {result.requests_per_second:,.0f} req/s, "
+                f"p99 {result.p99_ms:.2f} ms{note}"
+            )
+
+        results = asyncio.run(run_benchmark(
+            cfg,
+            transports=settings["transports"],
+            adapters=settings["adapters"],
+            batch_sizes=settings["batch_sizes"],
+            response_formats=settings["response_formats"],
+            requests=requests,
+            concurrency=concurrency,
+            warmup=warmup,
+            endpoint=settings["endpoint"],
+            progress=report,
+        ))
+
+        table = Table(title="⏱️ Benchmark Results", title_style="bold cyan")
+        table.add_column("Case", style="yellow", no_wrap=True)
+        for column in ("Req/s", "p50 ms", "p99 ms", "p99.9 ms", "Model ms"):
+            table.add_column(column, style="cyan", justify="right")
+        for result in results:
+            table.add_row(
+                result.key, f"{result.requests_per_second:,.0f}",
+                f"{result.p50_ms:.2f}", f"{result.p99_ms:.2f}", f"{result.p999_ms:.2f}",
+                f"{result.stages_ms.get('predict', 0.0):.2f}",
+            )
+        console.print(table)
+
+        if output:
+            output.write_text(json.dumps(results_document(results, cfg, settings), indent=2) + "\n")
+            console.print(f"[green]✓[/green] Results saved to [cyan]{output}[/cyan]")
+
+        if any(result.errors for result in results):
+            console.print("[yellow]⚠[/yellow] Some requests failed; their cases are not comparable")
+
+        if previous is not None:
+            if previous.get("settings", {}).get("requests") != requests or \
+                    previous.get("settings", {}).get("concurrency") != concurrency:
+                console.print("[yellow]⚠[/yellow] Baseline was run with different --requests/--concurrency")
+            regressions = compare_results(results, previous, tolerance)
+            if regressions:
+                console.print(f"[red]✗[/red] {len(regressions)} regression(s) against [cyan]{baseline}[/cyan]:")
+                for regression in regressions:
+                    console.print(
+                        f"  {regression.key} {regression.metric}: {regression.baseline:,.2f} → "
+                        f"{regression.current:,.2f} ({regression.change:+.1%})"
+                    )
+                raise typer.Exit(1)
+            console.print(f"[green]✓[/green] No regression against [cyan]{baseline}[/cyan] (tolerance {tolerance:.0%})")
+
+    except typer.Exit:
+        raise
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠[/yellow] Benchmark stopped by user")
+        raise typer.Exit(130)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Error: {e}", style="bold red")
+        raise typer.Exit(1)
+
+
 @app.command()
 def version(
     path: str = typer.Option(".", "--path", "-p", help="Path to classifier project"),
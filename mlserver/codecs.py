@@ -0,0 +1,264 @@
+"""
+Binary request/response codecs for the prediction endpoints.
+
+Besides JSON, the predict endpoints accept and produce:
+
+- ``application/x-npy``: a raw NumPy ``.npy`` array (no extra dependency)
+- ``application/x-msgpack``: the JSON document structure encoded with msgpack
+- ``application/vnd.apache.arrow.stream``: an Arrow IPC stream with one column per feature
+
+msgpack and pyarrow are optional dependencies (``pip install mlserver-fastapi-wrapper[binary]``);
+when they are missing, requests using those formats are rejected with HTTP 415.
+"""
+from __future__ import annotations
+import io
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from .adapters import AdapterError, array_to_ndarray, columns_to_ndarray, to_ndarray
+
+JSON = "application/json"
+NPY = "application/x-npy"
+MSGPACK = "application/x-msgpack"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+BINARY_MEDIA_TYPES = (NPY, MSGPACK, ARROW_STREAM)
+# Formats whose encoder works on the raw prediction array rather than the response document
+ARRAY_MEDIA_TYPES = (NPY, ARROW_STREAM)
+
+# Header carrying time_ms for formats that only encode the prediction array
+TIMING_HEADER = "X-Prediction-Time-Ms"
+
+
+class UnsupportedMediaType(Exception):
+    """Raised when a media type is not supported or its codec is not installed."""
+    pass
+
+
+class BinaryRequest:
+    """Undecoded binary request body.
+
+    Decoding is deferred to the prediction worker so that the event loop only
+    reads bytes.
+    """
+
+    __slots__ = ("body", "content_type")
+
+    def __init__(self, body: bytes, content_type: str):
+        self.body = body
+        self.content_type = content_type
+
+    @property
+    def media_type(self) -> str:
+        return _media_type(self.content_type)
+
+
+def _media_type(header_value: Optional[str]) -> str:
+    """Strip parameters (e.g. charset) and normalize a Content-Type value."""
+    if not header_value:
+        return JSON
+    return header_value.split(";", 1)[0].strip().lower()
+
+
+def is_binary_content_type(content_type: Optional[str]) -> bool:
+    """Check whether a Content-Type header names one of the binary request formats."""
+    return _media_type(content_type) in BINARY_MEDIA_TYPES
+
+
+def negotiate_response_type(accept: Optional[str], supported: Optional[Iterable[str]] = None,
+                            default: str = JSON) -> str:
+    """Pick the response media type from an Accept header.
+
+    The first supported type in client preference order wins (q-values respected;
+    ``q=0`` marks a type as not acceptable). Wildcards and unknown types fall
+    back to ``default``.
+
+    Args:
+        accept: Accept header value
+        supported: Media types to choose from (default: JSON and the binary formats)
+        default: Media type used when no supported type is acceptable
+    """
+    if not accept:
+        return default
+    supported = set(supported) if supported is not None else {JSON, *BINARY_MEDIA_TYPES}
+
+    candidates = []
+    for position, part in enumerate(accept.split(",")):
+        pieces = [p.strip() for p in part.split(";")]
+        media = pieces[0].lower()
+        quality = 1.0
+        for param in pieces[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media))
+
+    for _, _, media in sorted(candidates):
+        if media in supported:
+            return media
+    return default
+
+
+def ensure_codec_available(media_type: str) -> None:
+    """Raise UnsupportedMediaType if the optional package for ``media_type`` is missing."""
+    if media_type == MSGPACK:
+        _import_msgpack()
+    elif media_type == ARROW_STREAM:
+        _import_pyarrow()
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise UnsupportedMediaType(
+            f"{MSGPACK} requires the 'msgpack' package. Install with: pip install msgpack"
+        )
+    return msgpack
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise UnsupportedMediaType(
+            f"{ARROW_STREAM} requires the 'pyarrow' package. Install with: pip install pyarrow"
+        )
+    return pa
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Request decoding
+# ─────────────────────────────────────────────────────────────────────────────
+
+def decode_msgpack_payload(body: bytes) -> Dict[str, Any]:
+    """Decode a msgpack body into the same payload dict a JSON request would carry.
+
+    Both ``{"payload": {...}}`` documents and bare payloads are accepted.
+    """
+    msgpack = _import_msgpack()
+    try:
+        document = msgpack.unpackb(body, raw=False)
+    except Exception as e:
+        raise AdapterError(f"Invalid msgpack body: {e}")
+    if not isinstance(document, dict):
+        raise AdapterError("msgpack body must encode a map")
+    payload = document.get("payload", document)
+    if not isinstance(payload, dict):
+        raise AdapterError("msgpack 'payload' must be a map")
+    return payload
+
+
+def decode_array_body(
+    body: bytes,
+    content_type: str,
+    feature_order=None,
+    input_dtype: str = "object",
+    feature_dtypes=None,
+) -> np.ndarray:
+    """Decode an .npy or Arrow IPC body straight into the 2D model input array."""
+    media_type = _media_type(content_type)
+
+    if media_type == NPY:
+        try:
+            arr = np.load(io.BytesIO(body), allow_pickle=False)
+        except Exception as e:
+            raise AdapterError(f"Invalid .npy body: {e}")
+        return array_to_ndarray(arr, feature_order, input_dtype, feature_dtypes)
+
+    if media_type == ARROW_STREAM:
+        return table_to_ndarray(read_arrow_table(body), feature_order, input_dtype, feature_dtypes)
+
+    raise UnsupportedMediaType(f"Unsupported request content type: {content_type}")
+
+
+def read_arrow_table(body: bytes):
+    """Read an Arrow IPC stream body into a pyarrow Table."""
+    pa = _import_pyarrow()
+    try:
+        return pa.ipc.open_stream(pa.BufferReader(body)).read_all()
+    except Exception as e:
+        raise AdapterError(f"Invalid Arrow IPC stream: {e}")
+
+
+def table_to_ndarray(table, feature_order=None, input_dtype: str = "object", feature_dtypes=None) -> np.ndarray:
+    """Convert a pyarrow Table into the 2D model input array (as the columns adapter would)."""
+    columns = {
+        name: table.column(name).to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+    return columns_to_ndarray(columns, feature_order, input_dtype, feature_dtypes)
+
+
+def decode_binary_request(
+    req: BinaryRequest,
+    adapter: str = "auto",
+    feature_order=None,
+    input_dtype: str = "object",
+    feature_dtypes=None,
+) -> np.ndarray:
+    """Decode a binary request into the array ``to_ndarray`` would produce for the JSON equivalent."""
+    if req.media_type == MSGPACK:
+        payload = decode_msgpack_payload(req.body)
+        return to_ndarray(
+            payload,
+            adapter=adapter,
+            feature_order=feature_order,
+            input_dtype=input_dtype,
+            feature_dtypes=feature_dtypes,
+        )
+    return decode_array_body(req.body, req.content_type, feature_order, input_dtype, feature_dtypes)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Response encoding
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _concrete_array(values: Any) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        # Object arrays cannot be written without pickling; try a concrete dtype
+        try:
+            arr = arr.astype(np.float64)
+        except (ValueError, TypeError):
+            arr = arr.astype(str)
+    return arr
+
+
+def array_to_table(values: Any):
+    """Build the Arrow table used to return predictions (one column per output)."""
+    pa = _import_pyarrow()
+    arr = _concrete_array(values)
+    if arr.ndim <= 1:
+        return pa.table({"predictions": np.atleast_1d(arr)})
+    return pa.table({str(i): arr[:, i] for i in range(arr.shape[1])})
+
+
+def encode_array(values: Any, media_type: str) -> bytes:
+    """Encode raw predictions/probabilities as .npy or an Arrow IPC stream."""
+    if media_type == NPY:
+        buffer = io.BytesIO()
+        np.save(buffer, _concrete_array(values), allow_pickle=False)
+        return buffer.getvalue()
+
+    if media_type == ARROW_STREAM:
+        pa = _import_pyarrow()
+        table = array_to_table(values)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    raise UnsupportedMediaType(f"Cannot encode predictions as {media_type}")
+
+
+def encode_document(document: Dict[str, Any], media_type: str) -> bytes:
+    """Encode a JSON-compatible response document as msgpack."""
+    if media_type == MSGPACK:
+        return _import_msgpack().packb(document, use_bin_type=True)
+    raise UnsupportedMediaType(f"Cannot encode response document as {media_type}")
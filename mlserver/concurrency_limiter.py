@@ -3,10 +3,129 @@ Concurrency limiter for protecting compute-intensive model predictions.
 Designed for Kubernetes pod deployment where scaling happens across pods.
 """
 import asyncio
+import heapq
+import itertools
+import math
 import threading
-from typing import Optional
+import time
+from typing import Callable, Optional
 from fastapi import HTTPException
 
+# Smoothing factor of the prediction latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+# Bounds of the Retry-After hint sent with 503 responses (seconds)
+RETRY_AFTER_MIN = 1
+RETRY_AFTER_MAX = 60
+
+QUEUE_ORDERINGS = ("fifo", "priority")
+
+ADAPTIVE_ALGORITHMS = ("gradient", "aimd")
+
+_DEFAULT_REJECTION_MESSAGE = "Server is currently processing another prediction. Please retry later."
+
+
+class AdaptiveLimit:
+    """
+    Concurrency limit that adapts to observed prediction latency.
+
+    Modelled on Netflix's concurrency-limits. Each completed prediction
+    reports its latency; the limit moves towards the concurrency at which
+    latency starts to rise (queueing inside the model or on the CPU), which is
+    where throughput stops improving.
+
+    - ``gradient``: ``limit = limit * gradient + sqrt(limit)`` where ``gradient``
+      compares the long-term latency baseline to the latest sample, clamped to
+      [0.5, 1.0]; smoothed and bounded to [min_limit, max_limit]
+    - ``aimd``: additive increase by one while latency stays within
+      ``tolerance`` times the baseline, multiplicative decrease otherwise
+
+    The limit only grows while at least half of it is in use, so an idle pod
+    does not drift to max_limit.
+    """
+
+    def __init__(self, initial_limit: int = 1, min_limit: int = 1, max_limit: int = 64,
+                 algorithm: str = "gradient", tolerance: float = 1.5, smoothing: float = 0.2,
+                 backoff_ratio: float = 0.9, baseline_window: int = 600,
+                 metrics_getter: Optional[Callable[[], object]] = None):
+        """
+        Initialize the limit.
+
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit: Lower bound of the limit
+            max_limit: Upper bound of the limit
+            algorithm: 'gradient' or 'aimd'
+            tolerance: Latency increase over the baseline tolerated before backing off
+            smoothing: Weight of each new gradient estimate
+            backoff_ratio: Multiplicative decrease applied by aimd
+            baseline_window: Number of samples the long-term latency baseline averages over
+            metrics_getter: Callable returning the active MetricsCollector (or None)
+        """
+        if algorithm not in ADAPTIVE_ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {', '.join(ADAPTIVE_ALGORITHMS)}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.algorithm = algorithm
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff_ratio = backoff_ratio
+        self._baseline_alpha = 2.0 / (baseline_window + 1)
+        self._baseline: Optional[float] = None
+        self._estimate = float(min(max(initial_limit, min_limit), max_limit))
+        self._metrics_getter = metrics_getter
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._estimate)
+
+    def update(self, latency: float, inflight: int) -> int:
+        """Feed one latency sample; returns the new limit.
+
+        Args:
+            latency: Duration of the completed prediction in seconds
+            inflight: Predictions in progress when it completed (including itself)
+        """
+        if latency <= 0:
+            return self.limit
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline += self._baseline_alpha * (latency - self._baseline)
+            # Let the baseline recover quickly after a latency spike has passed
+            if self._baseline > 2 * latency:
+                self._baseline *= 0.95
+
+        previous = self.limit
+        if self.algorithm == "gradient":
+            self._update_gradient(latency, inflight)
+        else:
+            self._update_aimd(latency, inflight)
+
+        if self.limit != previous:
+            metrics = self._metrics_getter() if self._metrics_getter else None
+            if metrics:
+                metrics.set_concurrency_limit(self.limit)
+        return self.limit
+
+    def _update_gradient(self, latency: float, inflight: int) -> None:
+        gradient = max(0.5, min(1.0, self.tolerance * self._baseline / latency))
+        if gradient >= 1.0 and inflight < self._estimate / 2:
+            return
+        target = self._estimate * gradient + math.sqrt(self._estimate)
+        estimate = self._estimate * (1 - self.smoothing) + target * self.smoothing
+        self._estimate = min(max(estimate, self.min_limit), self.max_limit)
+
+    def _update_aimd(self, latency: float, inflight: int) -> None:
+        if latency > self.tolerance * self._baseline:
+            estimate = self._estimate * self.backoff_ratio
+        elif inflight * 2 >= self._estimate:
+            estimate = self._estimate + 1
+        else:
+            return
+        self._estimate = min(max(estimate, self.min_limit), self.max_limit)
+
 
 class PredictionSemaphore:
     """
@@ -14,34 +133,37 @@ class PredictionSemaphore:
 
     In Kubernetes deployments, each pod handles one prediction at a time,
     with scaling happening by adding more pods rather than handling concurrent
-    requests within a single pod.
+    requests within a single pod. With an AdaptiveLimit the number of slots
+    follows observed prediction latency instead of staying at max_concurrent.
     """
 
-    def __init__(self, max_concurrent: int = 1, timeout: float = 0):
+    def __init__(self, max_concurrent: int = 1, timeout: float = 0,
+                 adaptive: Optional[AdaptiveLimit] = None):
         """
         Initialize the prediction semaphore.
 
         Args:
             max_concurrent: Maximum concurrent predictions (default 1 for single model protection)
             timeout: How long to wait for semaphore (0 = immediate rejection)
+            adaptive: Adjust the number of slots from prediction latency (None = fixed)
         """
-        self._semaphore = threading.Semaphore(max_concurrent)
         self._max_concurrent = max_concurrent
         self._timeout = timeout
+        self._adaptive = adaptive
         self._active_predictions = 0
+        self._latency_ewma: Optional[float] = None
         self._lock = threading.Lock()
 
     def acquire_nowait(self) -> bool:
         """Try to acquire semaphore without waiting."""
-        acquired = self._semaphore.acquire(blocking=False)
-        if acquired:
-            with self._lock:
-                self._active_predictions += 1
-        return acquired
+        with self._lock:
+            if self._active_predictions >= self.limit:
+                return False
+            self._active_predictions += 1
+            return True
 
     def release(self):
         """Release the semaphore."""
-        self._semaphore.release()
         with self._lock:
             self._active_predictions -= 1
 
@@ -54,7 +176,49 @@ class PredictionSemaphore:
     @property
     def is_available(self) -> bool:
         """Check if prediction slot is available."""
-        return self._active_predictions < self._max_concurrent
+        return self._active_predictions < self.limit
+
+    @property
+    def max_concurrent(self) -> int:
+        """Configured number of prediction slots."""
+        return self._max_concurrent
+
+    @property
+    def limit(self) -> int:
+        """Number of prediction slots currently permitted."""
+        return self._adaptive.limit if self._adaptive else self._max_concurrent
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the limit adapts to prediction latency."""
+        return self._adaptive is not None
+
+    def record_latency(self, seconds: float) -> None:
+        """Record how long a slot was held, for wait-time estimates and the adaptive limit."""
+        with self._lock:
+            if self._latency_ewma is None:
+                self._latency_ewma = seconds
+            else:
+                self._latency_ewma += LATENCY_EWMA_ALPHA * (seconds - self._latency_ewma)
+            if self._adaptive is not None:
+                self._adaptive.update(seconds, self._active_predictions)
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        """Moving average of slot hold time in seconds (None before the first prediction)."""
+        return self._latency_ewma
+
+    def estimated_wait(self, queued: int = 0) -> float:
+        """Estimate how long a new request would wait for a slot behind ``queued`` others."""
+        latency = self._latency_ewma
+        if latency is None:
+            return 0.0
+        return (queued + 1) * latency / self.limit
+
+    def retry_after(self, queued: int = 0) -> str:
+        """Retry-After header value derived from the estimated wait."""
+        seconds = math.ceil(self.estimated_wait(queued))
+        return str(min(max(seconds, RETRY_AFTER_MIN), RETRY_AFTER_MAX))
 
 
 class PredictionLimiter:
@@ -63,10 +227,11 @@ class PredictionLimiter:
     """
 
     def __init__(self, semaphore: PredictionSemaphore,
-                 rejection_message: str = "Server is currently processing another prediction. Please retry later."):
+                 rejection_message: str = _DEFAULT_REJECTION_MESSAGE):
         self._semaphore = semaphore
         self._rejection_message = rejection_message
         self._acquired = False
+        self._acquired_at = 0.0
 
     def __enter__(self):
         """Acquire semaphore or raise HTTP 503 if busy."""
@@ -75,13 +240,15 @@ class PredictionLimiter:
             raise HTTPException(
                 status_code=503,  # Service Unavailable
                 detail=self._rejection_message,
-                headers={"Retry-After": "5"}  # Suggest retry after 5 seconds
+                headers={"Retry-After": self._semaphore.retry_after()}
             )
+        self._acquired_at = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Release semaphore if acquired."""
         if self._acquired:
+            self._semaphore.record_latency(time.perf_counter() - self._acquired_at)
             self._semaphore.release()
             self._acquired = False
 
@@ -89,41 +256,174 @@ class PredictionLimiter:
 class AsyncPredictionLimiter:
     """
     Async context manager for limiting concurrent predictions.
+
+    Shares the thread-safe PredictionSemaphore with PredictionLimiter, so
+    ``/status`` reports the same slot counts whichever limiter is in use.
+    Acquisition never blocks the event loop. With an AdmissionQueue, busy
+    requests wait for a slot instead of being rejected immediately.
     """
 
-    def __init__(self, semaphore: asyncio.Semaphore, max_concurrent: int = 1,
-                 rejection_message: str = "Server is currently processing another prediction. Please retry later."):
+    def __init__(self, semaphore: PredictionSemaphore,
+                 rejection_message: str = _DEFAULT_REJECTION_MESSAGE,
+                 queue: Optional["AdmissionQueue"] = None, priority: int = 0,
+                 record_latency: bool = True):
         self._semaphore = semaphore
-        self._max_concurrent = max_concurrent
         self._rejection_message = rejection_message
+        self._queue = queue
+        self._priority = priority
+        self._record_latency = record_latency
         self._acquired = False
+        self._acquired_at = 0.0
 
     async def __aenter__(self):
-        """Try to acquire semaphore without waiting."""
-        try:
-            # Try to acquire with zero timeout
-            self._acquired = await asyncio.wait_for(
-                self._semaphore.acquire(),
-                timeout=0.001  # Near-instant timeout
-            )
-        except asyncio.TimeoutError:
-            self._acquired = False
-
-        if not self._acquired:
-            raise HTTPException(
-                status_code=503,
-                detail=self._rejection_message,
-                headers={"Retry-After": "5"}
-            )
+        """Acquire a slot (waiting in the queue if configured) or raise HTTP 503."""
+        if self._queue is not None:
+            await self._queue.acquire(self._priority)
+            self._acquired = True
+        else:
+            self._acquired = self._semaphore.acquire_nowait()
+            if not self._acquired:
+                raise HTTPException(
+                    status_code=503,
+                    detail=self._rejection_message,
+                    headers={"Retry-After": self._semaphore.retry_after()}
+                )
+        self._acquired_at = time.perf_counter()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Release semaphore if acquired."""
+        """Release the slot if acquired."""
         if self._acquired:
-            self._semaphore.release()
+            if self._record_latency:
+                self._semaphore.record_latency(time.perf_counter() - self._acquired_at)
+            if self._queue is not None:
+                self._queue.release()
+            else:
+                self._semaphore.release()
             self._acquired = False
 
 
+class AdmissionQueue:
+    """
+    Bounded wait queue in front of a PredictionSemaphore.
+
+    Requests that find every slot busy wait (on the event loop) until a slot
+    frees up (or an adaptive limit grows), in FIFO or priority order, or until their deadline passes.
+    Requests are shed with 503 up front when the queue is full or the wait
+    estimated from recent prediction latency exceeds ``max_estimated_wait``.
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, semaphore: PredictionSemaphore, max_depth: int = 100, timeout: float = 30.0,
+                 ordering: str = "fifo", max_estimated_wait: Optional[float] = None,
+                 metrics_getter: Optional[Callable[[], object]] = None,
+                 rejection_message: str = _DEFAULT_REJECTION_MESSAGE):
+        """
+        Initialize the queue.
+
+        Args:
+            semaphore: Prediction slots handed out by the queue
+            max_depth: Maximum number of waiting requests
+            timeout: Maximum time a request waits for a slot (seconds)
+            ordering: 'fifo' or 'priority' (higher priority first, FIFO within a priority)
+            max_estimated_wait: Shed requests whose estimated wait exceeds this (None = never)
+            metrics_getter: Callable returning the active MetricsCollector (or None)
+            rejection_message: Detail of 503 responses
+        """
+        if ordering not in QUEUE_ORDERINGS:
+            raise ValueError(f"ordering must be one of {', '.join(QUEUE_ORDERINGS)}")
+        self._semaphore = semaphore
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.ordering = ordering
+        self.max_estimated_wait = max_estimated_wait
+        self._metrics_getter = metrics_getter
+        self._rejection_message = rejection_message
+        self._waiters = []  # heap of (sort key, future)
+        self._sequence = itertools.count()
+        self._depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return self._depth
+
+    def estimated_wait(self) -> float:
+        """Estimated wait of a request joining the queue now (seconds)."""
+        return self._semaphore.estimated_wait(self._depth)
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Wait for a prediction slot.
+
+        Raises:
+            HTTPException: 503 when the request is shed or its deadline passes
+        """
+        if self._depth == 0 and self._semaphore.acquire_nowait():
+            self._track_wait(0.0)
+            return
+
+        if self._depth >= self.max_depth:
+            self._reject("queue_full")
+        if self.max_estimated_wait is not None and self.estimated_wait() > self.max_estimated_wait:
+            self._reject("estimated_wait")
+
+        future = asyncio.get_running_loop().create_future()
+        sequence = next(self._sequence)
+        key = (-priority, sequence) if self.ordering == "priority" else (sequence,)
+        heapq.heappush(self._waiters, (key, future))
+        self._set_depth(self._depth + 1)
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self.release()
+            else:
+                future.cancel()
+                self._set_depth(self._depth - 1)
+            if isinstance(e, asyncio.TimeoutError):
+                self._reject("timeout")
+            raise
+        self._track_wait(time.perf_counter() - started)
+
+    def release(self) -> None:
+        """Free a slot and admit as many waiting requests as the limit allows."""
+        self._semaphore.release()
+        while self._waiters:
+            _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._semaphore.acquire_nowait():
+                return
+            heapq.heappop(self._waiters)
+            self._set_depth(self._depth - 1)
+            future.set_result(None)
+
+    def _reject(self, reason: str) -> None:
+        metrics = self._metrics_getter() if self._metrics_getter else None
+        if metrics:
+            metrics.track_shed(reason)
+        raise HTTPException(
+            status_code=503,
+            detail=self._rejection_message,
+            headers={"Retry-After": self._semaphore.retry_after(self._depth)}
+        )
+
+    def _set_depth(self, depth: int) -> None:
+        self._depth = depth
+        metrics = self._metrics_getter() if self._metrics_getter else None
+        if metrics:
+            metrics.set_queue_depth(depth)
+
+    def _track_wait(self, seconds: float) -> None:
+        metrics = self._metrics_getter() if self._metrics_getter else None
+        if metrics:
+            metrics.track_queue_wait(seconds)
+
+
 def create_prediction_limiter(max_concurrent_predictions: int = 1,
                              async_mode: bool = False) -> tuple:
     """
@@ -136,9 +436,8 @@ def create_prediction_limiter(max_concurrent_predictions: int = 1,
     Returns:
         Tuple of (semaphore, limiter_class)
     """
+    semaphore = PredictionSemaphore(max_concurrent_predictions)
     if async_mode:
-        semaphore = asyncio.Semaphore(max_concurrent_predictions)
-        return semaphore, lambda: AsyncPredictionLimiter(semaphore, max_concurrent_predictions)
+        return semaphore, lambda: AsyncPredictionLimiter(semaphore)
     else:
-        semaphore = PredictionSemaphore(max_concurrent_predictions)
         return semaphore, lambda: PredictionLimiter(semaphore)
\ No newline at end of file
@@ -4,10 +4,14 @@ from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 import json
 import logging
-from pydantic import BaseModel, Field, field_validator
+import os
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .version import ClassifierMetadata, load_classifier_metadata
 from .settings import get_settings
+from .adapters import INPUT_DTYPES, FEATURE_DTYPES, MAX_RECORDS
+from .artifacts import ARTIFACT_FORMATS
+from .concurrency_limiter import ADAPTIVE_ALGORITHMS, QUEUE_ORDERINGS
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +41,10 @@ class ServerConfig(BaseModel):
     workers: int = Field(default_factory=lambda: get_settings().server.default_workers if hasattr(get_settings().server, 'default_workers') else 1)
     cors: Optional[CORSConfig] = None
     logger: Optional[LoggerConfig] = Field(default=None, description="Logger configuration")
+    preload: bool = Field(
+        default=False,
+        description="Load the predictor once before forking workers so they share model memory copy-on-write"
+    )
 
     @field_validator('port')
     @classmethod
@@ -53,10 +61,29 @@ class ServerConfig(BaseModel):
         return v
 
 
+class ArtifactConfig(BaseModel):
+    """A model artifact loaded by the server and passed to the predictor constructor."""
+    path: str = Field(description="Artifact file path (relative to the config file)")
+    format: Optional[str] = Field(default=None, description="npy|joblib|pickle (default: inferred from extension)")
+    mmap: bool = Field(default=True, description="Memory-map array data read-only instead of loading it onto the heap")
+
+    @field_validator('format')
+    @classmethod
+    def validate_format(cls, v):
+        if v is not None and v not in ARTIFACT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(ARTIFACT_FORMATS)}")
+        return v
+
+
 class PredictorConfig(BaseModel):
     module: str  # e.g., "examples.predictor_catboost"
     class_name: str  # e.g., "CatBoostPredictor"
     init_kwargs: Dict[str, Any] = Field(default_factory=dict)
+    artifacts: Optional[Union[str, Dict[str, Union[str, ArtifactConfig]]]] = Field(
+        default=None,
+        description="Artifacts passed to the predictor as keyword arguments: "
+                    "a mapping of name -> path/spec, or the path of an artifact manifest file"
+    )
 
     @field_validator('module', 'class_name')
     @classmethod
@@ -72,9 +99,172 @@ class ObservabilityConfig(BaseModel):
     structured_logging: bool = Field(default=True, description="Enable structured JSON logging")
     log_payloads: bool = Field(default=False, description="Log request/response payloads")
     correlation_ids: bool = Field(default=True, description="Generate correlation IDs for request tracing")
+    request_id_header: str = Field(
+        default="X-Request-ID",
+        description="Incoming header whose value is used as correlation ID (echoed on the response)"
+    )
+    log_sample_rate: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        description="Fraction of successful requests that are logged; errors (status >= 400) are always logged"
+    )
+    server_timing: bool = Field(
+        default=False,
+        description="Add a Server-Timing header with the duration of each stage to prediction responses"
+    )
+    multiprocess_dir: Optional[str] = Field(
+        default=None,
+        description="Shared directory for per-worker metric files when server.workers > 1 "
+                    "(default: $PROMETHEUS_MULTIPROC_DIR or a temporary directory)"
+    )
+
 
+class BatchingConfig(BaseModel):
+    """Dynamic micro-batching of concurrent prediction requests."""
+    enabled: bool = Field(default=False, description="Collect concurrent requests into a single predictor call")
+    max_batch_size: int = Field(default=64, ge=1, description="Maximum number of rows per batched predictor call")
+    max_wait_ms: float = Field(default=5.0, ge=0, description="Maximum time the first request in a batch waits for others")
 
 
+class QueueConfig(BaseModel):
+    """Admission queue for requests that find every prediction slot busy."""
+    enabled: bool = Field(default=False, description="Wait for a prediction slot instead of rejecting with 503")
+    max_depth: int = Field(default=100, ge=1, description="Maximum number of waiting requests")
+    timeout_seconds: float = Field(default=30.0, gt=0, description="Maximum time a request waits for a slot")
+    ordering: str = Field(default="fifo", description="fifo|priority (priority read from priority_header)")
+    priority_header: str = Field(default="X-Priority", description="Request header carrying an integer priority")
+    max_estimated_wait_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Shed requests whose wait, estimated from recent prediction latency, exceeds this"
+    )
+
+    @field_validator('ordering')
+    @classmethod
+    def validate_ordering(cls, v):
+        if v not in QUEUE_ORDERINGS:
+            raise ValueError(f"ordering must be one of {', '.join(QUEUE_ORDERINGS)}")
+        return v
+
+
+class AdaptiveConcurrencyConfig(BaseModel):
+    """Concurrency limit adjusted from observed prediction latency."""
+    enabled: bool = Field(default=False, description="Adapt the limit instead of using max_concurrent_predictions")
+    algorithm: str = Field(default="gradient", description="gradient|aimd")
+    min_limit: int = Field(default=1, ge=1, description="Lower bound of the limit")
+    max_limit: int = Field(default=64, ge=1, description="Upper bound of the limit")
+    tolerance: float = Field(default=1.5, ge=1.0, description="Latency increase over the baseline tolerated")
+    smoothing: float = Field(default=0.2, gt=0, le=1.0, description="Weight of each new gradient estimate")
+
+    @field_validator('algorithm')
+    @classmethod
+    def validate_algorithm(cls, v):
+        if v not in ADAPTIVE_ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {', '.join(ADAPTIVE_ALGORITHMS)}")
+        return v
+
+    @model_validator(mode='after')
+    def validate_bounds(self):
+        if self.min_limit > self.max_limit:
+            raise ValueError("min_limit must not exceed max_limit")
+        return self
+
+
+class StreamingConfig(BaseModel):
+    """Streaming scoring endpoints (/predict/stream, /predict_proba/stream)."""
+    enabled: bool = Field(default=False, description="Register the streaming endpoints")
+    chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        le=MAX_RECORDS,
+        description="Rows per model call; the response carries one line (or Arrow batch) per chunk"
+    )
+    max_message_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=1024,
+        description="Largest NDJSON line or Arrow IPC message (record batch) accepted; larger ones get 413"
+    )
+
+
+class CacheConfig(BaseModel):
+    """Row-level cache of predictor outputs."""
+    enabled: bool = Field(default=False, description="Answer repeated input rows from memory instead of the model")
+    max_entries: int = Field(default=100_000, ge=1, description="Maximum number of cached rows")
+    max_memory_mb: float = Field(default=256, gt=0, description="Approximate memory bound for cached rows")
+    ttl_seconds: Optional[float] = Field(default=None, gt=0, description="Entry lifetime (default: until evicted)")
+
+
+class AdminConfig(BaseModel):
+    """Access to the /admin endpoints."""
+    token: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("MLSERVER_ADMIN_TOKEN"),
+        description="Bearer token required by /admin endpoints (default: MLSERVER_ADMIN_TOKEN); "
+                    "admin endpoints reject every request without one"
+    )
+
+
+class ProfilerConfig(BaseModel):
+    """On-demand sampling profiler (``POST /admin/profile``)."""
+    enabled: bool = Field(default=False, description="Register POST /admin/profile")
+    max_seconds: float = Field(default=60.0, gt=0, description="Longest profile a request may ask for")
+    interval_ms: float = Field(
+        default=10.0,
+        ge=1,
+        description="Default time between stack samples in milliseconds"
+    )
+
+
+class ReloadConfig(BaseModel):
+    """Replacing the model without restarting the server."""
+    enabled: bool = Field(default=False, description="Register POST /admin/reload")
+    watch: bool = Field(default=False, description="Reload when the predictor's artifact files change")
+    poll_interval_seconds: float = Field(default=5.0, gt=0, description="How often watched files are checked")
+    drain_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Maximum wait for in-flight predictions on the old model before it is closed"
+    )
+
+
+class WarmupConfig(BaseModel):
+    """Sample predictions run at startup before /readyz reports ready."""
+    enabled: bool = Field(default=False, description="Run warm-up predictions after the model is loaded")
+    samples: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Recorded request payloads, e.g. {'records': [...]} (default: synthetic rows)"
+    )
+    samples_file: Optional[str] = Field(
+        default=None,
+        description="JSON list or NDJSON file of request payloads, relative to mlserver.yaml"
+    )
+    synthetic_rows: int = Field(
+        default=8,
+        ge=1,
+        le=MAX_RECORDS,
+        description="Rows of the synthetic payload built from feature_order when no samples are given"
+    )
+    iterations: int = Field(default=3, ge=1, description="Times every payload is run per prediction method")
+    fail_on_error: bool = Field(
+        default=False,
+        description="Stay not ready when a warm-up prediction fails (default: log it and report ready)"
+    )
+
+
+class MultiModelConfig(BaseModel):
+    """Serving every classifier of a multi-classifier config from one process."""
+    lazy_loading: bool = Field(default=False, description="Load each model on its first request instead of at startup")
+    max_loaded_models: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Unload the least recently used idle models above this count"
+    )
+    memory_budget_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Unload the least recently used idle models while loaded models exceed this estimate"
+    )
+
 
 class ApiConfig(BaseModel):
     """Unified API configuration from mlserver.yaml"""
@@ -87,15 +277,69 @@ class ApiConfig(BaseModel):
         },
         description="Enabled endpoints"
     )
-    adapter: str = Field(default="records", description="records|ndarray|auto")
+    adapter: str = Field(default="records", description="records|ndarray|columns|auto")
     feature_order: Optional[Union[List[str], str]] = None  # Can be List[str] or str (file path)
     _resolved_feature_order: Optional[List[str]] = None  # Cached resolved value
+    input_dtype: str = Field(
+        default="object",
+        description="Input array dtype: 'object' (values as sent), 'auto' (numeric schema inferred from first batch), "
+                    "or a numeric dtype (float32|float64|int)"
+    )
+    feature_dtypes: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="Per-feature dtype (float32|float64|int|category); requires feature_order for ndarray payloads"
+    )
     thread_safe_predict: bool = False
     max_concurrent_predictions: int = Field(
         default=1,
         description="Maximum concurrent predictions (1 for single model protection in K8s)",
         ge=1
     )
+    inference_workers: Optional[int] = Field(
+        default=None,
+        description="Threads in the dedicated inference executor (default: max_concurrent_predictions)",
+        ge=1
+    )
+    inference_backend: str = Field(
+        default="thread",
+        description="Where predictions run: 'thread' (in-process) or 'process' (one predictor per worker process)"
+    )
+    batching: BatchingConfig = Field(
+        default_factory=BatchingConfig,
+        description="Micro-batching (requires max_concurrent_predictions >= expected concurrent callers)"
+    )
+    adaptive_concurrency: AdaptiveConcurrencyConfig = Field(
+        default_factory=AdaptiveConcurrencyConfig,
+        description="Adaptive concurrency limit (starts at max_concurrent_predictions)"
+    )
+    queue: QueueConfig = Field(
+        default_factory=QueueConfig,
+        description="Admission queue in front of max_concurrent_predictions (default: immediate 503)"
+    )
+    streaming: StreamingConfig = Field(
+        default_factory=StreamingConfig,
+        description="NDJSON / Arrow streaming endpoints for inputs of any size"
+    )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig,
+        description="Prediction cache keyed by input row and model identity"
+    )
+    warmup: WarmupConfig = Field(
+        default_factory=WarmupConfig,
+        description="Startup warm-up predictions gating /readyz"
+    )
+    reload: ReloadConfig = Field(
+        default_factory=ReloadConfig,
+        description="Hot model reload via admin endpoint or artifact file watch"
+    )
+    admin: AdminConfig = Field(
+        default_factory=AdminConfig,
+        description="Authentication of the /admin endpoints"
+    )
+    profiler: ProfilerConfig = Field(
+        default_factory=ProfilerConfig,
+        description="On-demand stack sampling profiler via admin endpoint"
+    )
     # Response format configuration
     response_format: str = Field(
         default="standard",
@@ -110,6 +354,30 @@ class ApiConfig(BaseModel):
         description="For dict responses, extract values into predictions list"
     )
 
+    @field_validator('inference_backend')
+    @classmethod
+    def validate_inference_backend(cls, v):
+        if v not in ("thread", "process"):
+            raise ValueError("inference_backend must be 'thread' or 'process'")
+        return v
+
+    @field_validator('input_dtype')
+    @classmethod
+    def validate_input_dtype(cls, v):
+        if v not in INPUT_DTYPES:
+            raise ValueError(f"input_dtype must be one of {sorted(INPUT_DTYPES)}")
+        return v
+
+    @field_validator('feature_dtypes')
+    @classmethod
+    def validate_feature_dtypes(cls, v):
+        if v is None:
+            return v
+        invalid = {name: dtype for name, dtype in v.items() if dtype not in FEATURE_DTYPES}
+        if invalid:
+            raise ValueError(f"Unsupported feature dtypes {invalid}; use one of {sorted(FEATURE_DTYPES)}")
+        return v
+
     def get_resolved_feature_order(self, base_path: Optional[Path] = None) -> Optional[List[str]]:
         """Resolve feature_order, loading from file if it's a path.
 
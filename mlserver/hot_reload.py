@@ -0,0 +1,271 @@
+"""
+Hot model reload (``api.reload``).
+
+A reload builds a complete new model state (predictor, micro-batcher,
+prediction cache, metadata) in the background while the current one keeps
+serving, warms it up, and swaps it into ``app.state`` in one step. Every
+prediction holds a lease on the state it started with, so the old predictor is
+closed only after the predictions already running on it have finished.
+
+A new model is warmed up with synthetic all-zero rows built from
+``api.feature_order`` (like the startup warm-up), never with request data.
+
+Reloads are triggered by ``POST /admin/reload`` or, with ``watch: true``, by a
+change to the predictor's files (file-path ``init_kwargs`` and
+``predictor.artifacts``). A watched change triggers a reload once the files
+have been stable for one poll interval, so a file that is still being copied
+is not loaded half-written. Replace artifacts by writing a new file and
+renaming it over the old one: memory-mapped artifacts of the running model
+must not be modified in place.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .adapters import to_ndarray
+from .artifacts import artifact_paths
+from .config import AppConfig
+from .warmup import synthetic_payload
+
+logger = logging.getLogger(__name__)
+
+# Synthetic rows predicted by a new model before it is swapped in
+WARMUP_ROWS = 16
+
+
+def watched_paths(config: AppConfig) -> List[str]:
+    """Files that make up the model: file-path init_kwargs and declared artifacts."""
+    config_dir = config.project_path or None
+    paths = []
+    for value in (config.predictor.init_kwargs or {}).values():
+        if isinstance(value, str):
+            path = value if os.path.isabs(value) or not config_dir else os.path.join(config_dir, value)
+            if os.path.isfile(path):
+                paths.append(path)
+    try:
+        paths.extend(artifact_paths(config.predictor.artifacts, config_dir))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot list artifact files for reload watching: {e}")
+    return paths
+
+
+def file_fingerprint(paths: List[str]) -> str:
+    """Digest of the size and modification time of every file (missing files included)."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{path}|missing\n".encode())
+    return digest.hexdigest()
+
+
+class _Generation:
+    """One installed model state and the predictions running on it."""
+
+    __slots__ = ("state", "active")
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+        self.active = 0
+
+
+class ModelGenerations:
+    """Tracks which model state each prediction uses, so a replaced state can be drained."""
+
+    def __init__(self, state: Dict[str, Any]):
+        self._condition = threading.Condition()
+        self._current = _Generation(state)
+
+    @contextmanager
+    def lease(self):
+        """Hold the current model state for the duration of one prediction."""
+        with self._condition:
+            generation = self._current
+            generation.active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                generation.active -= 1
+                if generation.active == 0:
+                    self._condition.notify_all()
+
+    def swap(self, state: Dict[str, Any], install: Callable[[Dict[str, Any]], None]) -> _Generation:
+        """Install a new state; returns the replaced generation.
+
+        ``install`` runs under the same lock as ``lease``: a prediction either
+        leases the old generation before the swap (and is drained) or reads the
+        new state after it.
+        """
+        with self._condition:
+            old = self._current
+            install(state)
+            self._current = _Generation(state)
+        return old
+
+    def drain(self, generation: _Generation, timeout: float) -> bool:
+        """Wait until no prediction uses a replaced generation; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: generation.active == 0, timeout=timeout)
+
+
+class ModelReloader:
+    """Builds, warms up and swaps in a new model state on request or on file change."""
+
+    def __init__(self, config: AppConfig, build: Callable[[], Dict[str, Any]],
+                 install: Callable[[Dict[str, Any]], None], close: Callable[[Dict[str, Any]], None],
+                 state: Dict[str, Any], metrics_getter: Optional[Callable] = None,
+                 feature_order: Optional[List[str]] = None):
+        """
+        Args:
+            config: Application configuration
+            build: Loads a new model state (runs on a background thread)
+            install: Puts a model state on ``app.state``
+            close: Releases a model state that is no longer used
+            state: The model state installed at startup
+            metrics_getter: Returns the metrics collector, or None when metrics are disabled
+            feature_order: Resolved feature order; a new model is warmed up with
+                synthetic rows in this order (no warm-up without it)
+        """
+        self.config = config
+        self.reload_config = config.api.reload
+        self.generations = ModelGenerations(state)
+        self._build = build
+        self._install = install
+        self._close = close
+        self._metrics_getter = metrics_getter
+        self._lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._sample = self._warmup_rows(feature_order)
+
+        self.paths = watched_paths(config)
+        self.fingerprint = file_fingerprint(self.paths)
+        self.version = self._version()
+        self.reloads = 0
+        self.last_reload: Optional[Dict[str, Any]] = None
+        self._report_version()
+
+    def _version(self) -> str:
+        version = str(self.config.classifier.get("version", "unknown"))
+        return f"{version}+{self.fingerprint}" if self.paths else version
+
+    def _metrics(self):
+        return self._metrics_getter() if self._metrics_getter else None
+
+    def _report_version(self) -> None:
+        metrics = self._metrics()
+        if metrics:
+            metrics.set_model_version(self.version)
+
+    def _warmup_rows(self, feature_order: Optional[List[str]]) -> Optional[np.ndarray]:
+        """All-zero rows converted like a request body, or None without a feature order."""
+        if not feature_order:
+            return None
+        api = self.config.api
+        payload = synthetic_payload(feature_order, "records", WARMUP_ROWS, api.feature_dtypes)
+        try:
+            # Every adapter yields the same array for the same rows; records is always accepted
+            return to_ndarray(payload, adapter="records", feature_order=feature_order,
+                              input_dtype=api.input_dtype, feature_dtypes=api.feature_dtypes)
+        except Exception as e:
+            logger.warning(f"Cannot build reload warm-up rows, reloads will not be warmed up: {e}")
+            return None
+
+    def _build_and_warm_up(self) -> Dict[str, Any]:
+        state = self._build()
+        if self._sample is not None:
+            try:
+                state["predictor"].predict(self._sample)
+            except Exception:
+                self._close(state)
+                raise
+        return state
+
+    async def reload(self, reason: str = "admin") -> Dict[str, Any]:
+        """Load the model again and swap it in; concurrent calls run one after another.
+
+        Raises:
+            Exception: If the new model fails to load or to warm up; the current
+                model keeps serving
+        """
+        async with self._lock:
+            started = time.perf_counter()
+            fingerprint = file_fingerprint(self.paths)
+            metrics = self._metrics()
+            try:
+                state = await asyncio.to_thread(self._build_and_warm_up)
+            except Exception as e:
+                logger.error(f"Model reload ({reason}) failed, keeping the current model: {e}", exc_info=True)
+                if metrics:
+                    metrics.track_reload("failure")
+                self.last_reload = {"reason": reason, "result": "failure", "error": str(e), "at": time.time()}
+                raise
+
+            old = self.generations.swap(state, self._install)
+            self.fingerprint = fingerprint
+            self.version = self._version()
+            self.reloads += 1
+            self._report_version()
+            if metrics:
+                metrics.track_reload("success")
+
+            # The old model finishes the predictions it already started before it is closed
+            drained = await asyncio.to_thread(
+                self.generations.drain, old, self.reload_config.drain_timeout_seconds
+            )
+            if not drained:
+                logger.warning("Predictions on the previous model did not finish in time; closing it anyway")
+            await asyncio.to_thread(self._close, old.state)
+
+            duration = time.perf_counter() - started
+            self.last_reload = {
+                "reason": reason, "result": "success", "version": self.version,
+                "duration_seconds": round(duration, 3), "drained": drained, "at": time.time(),
+            }
+            logger.info(f"Model reloaded ({reason}) in {duration:.2f}s, version {self.version}")
+            return self.last_reload
+
+    def start_watching(self) -> None:
+        """Start polling the watched files (call from the event loop)."""
+        if not self.paths:
+            logger.warning("Reload watching is enabled but the predictor has no artifact files to watch")
+            return
+        self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    async def _watch(self) -> None:
+        pending = None
+        failed = None
+        while True:
+            await asyncio.sleep(self.reload_config.poll_interval_seconds)
+            current = file_fingerprint(self.paths)
+            if current == self.fingerprint or current == failed:
+                pending = None
+                continue
+            if current != pending:
+                # Changed since the last poll: wait until the files are stable
+                pending = current
+                continue
+            pending = None
+            try:
+                await self.reload(reason="watch")
+                failed = None
+            except Exception:
+                failed = current
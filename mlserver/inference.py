@@ -0,0 +1,66 @@
+"""
+Dedicated executor for running model inference off the event loop.
+
+Predict handlers are ``async`` and hand the blocking predictor call to this
+executor instead of Starlette's shared threadpool. Control endpoints such as
+``/healthz``, ``/info`` and ``/metrics`` therefore keep their own threads even
+when every inference worker is busy.
+"""
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+
+class InferenceExecutor:
+    """
+    Thread pool reserved for prediction work.
+
+    The pool is sized to the number of predictions allowed to run at once, so
+    threads are never created that the concurrency limiter would not admit.
+    """
+
+    def __init__(self, max_workers: int = 1, thread_name_prefix: str = "mlserver-inference"):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of inference threads
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` on an inference thread and await its result.
+
+        Context variables (e.g. the request correlation id) are propagated to the
+        worker thread. If the awaiting request is cancelled, the call still runs to
+        completion before the cancellation is re-raised, so that callers holding a
+        concurrency slot only release it once the thread is actually free.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        future = loop.run_in_executor(self._executor, functools.partial(context.run, fn, *args))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait({future})
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads, by default after in-flight predictions finish."""
+        self._executor.shutdown(wait=wait)
+
+
+async def run_inference(executor: Optional[InferenceExecutor], fn: Callable[..., Any], *args: Any) -> Any:
+    """Run ``fn`` on ``executor``, or on Starlette's threadpool when no executor is active.
+
+    The fallback covers apps served without running the lifespan (e.g. in tests).
+    """
+    if executor is None:
+        return await run_in_threadpool(fn, *args)
+    return await executor.run(fn, *args)
@@ -1,9 +1,36 @@
 from __future__ import annotations
+import atexit
+import copy
+import glob
+import os
+import shutil
+import tempfile
 import time
-from typing import Optional
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from typing import Dict, Iterable, List, Optional, Tuple
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, Gauge, generate_latest, multiprocess, values, CONTENT_TYPE_LATEST
+)
 from fastapi import Request, Response
 
+# Shared directory of per-process metric files (prometheus_client multiprocess mode)
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Request label values are bounded: unmatched paths and unknown methods are
+# reported as "other", status codes without their own series by class ("3xx")
+OTHER_LABEL = "other"
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+STATUS_CODES = frozenset({200, 201, 204, 400, 401, 403, 404, 405, 408, 413, 415, 422, 429, 500, 502, 503, 504})
+
+# Stages of a prediction request, in order
+STAGES = {
+    "parse": "Reading and parsing the request body",
+    "adapt": "Converting the payload to the model input (input adapter)",
+    "predict": "Predictor call, including the prediction cache and micro-batching",
+    "format": "Converting predictions to the response structure",
+    "validate": "Building the Pydantic response model",
+    "encode": "Encoding the response body",
+}
+
 
 class MetricsCollector:
     def __init__(self, model_name: Optional[str] = None):
@@ -38,39 +65,174 @@ class MetricsCollector:
             ["model", "endpoint"]
         )
 
+        # Prediction request stages (one histogram family each)
+        self.stage_duration = {
+            stage: Histogram(
+                f"mlserver_stage_{stage}_seconds",
+                f"{description} (seconds)",
+                ["model", "endpoint"],
+                buckets=[0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
+            )
+            for stage, description in STAGES.items()
+        }
+
+        # Micro-batching metrics
+        self.batch_size = Histogram(
+            "mlserver_batch_size",
+            "Number of rows per batched predictor call",
+            ["model", "method"],
+            buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+        )
+
+        self.batch_queue_wait = Histogram(
+            "mlserver_batch_queue_wait_seconds",
+            "Time a request waited in the batching queue before dispatch",
+            ["model", "method"],
+            buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25]
+        )
+
+        # Concurrency limit (static or adaptive)
+        self.concurrency_limit = Gauge(
+            "mlserver_concurrency_limit",
+            "Number of predictions permitted to run concurrently",
+            ["model"],
+            multiprocess_mode="livesum"
+        )
+
+        # Admission queue metrics
+        self.queue_depth = Gauge(
+            "mlserver_queue_depth",
+            "Requests waiting for a prediction slot",
+            ["model"],
+            multiprocess_mode="livesum"
+        )
+
+        self.queue_wait = Histogram(
+            "mlserver_queue_wait_seconds",
+            "Time a request waited for a prediction slot",
+            ["model"],
+            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+        )
+
+        self.requests_shed = Counter(
+            "mlserver_requests_shed_total",
+            "Requests rejected by the admission queue",
+            ["model", "reason"]
+        )
+
+        # Prediction cache metrics
+        self.cache_hits = Counter(
+            "mlserver_cache_hits_total",
+            "Input rows answered from the prediction cache",
+            ["model", "method"]
+        )
+
+        self.cache_misses = Counter(
+            "mlserver_cache_misses_total",
+            "Input rows that missed the prediction cache",
+            ["model", "method"]
+        )
+
+        self.cache_evictions = Counter(
+            "mlserver_cache_evictions_total",
+            "Prediction cache entries evicted (LRU, memory bound or TTL)",
+            ["model", "method"]
+        )
+
         # System metrics
         self.active_requests = Gauge(
             "mlserver_active_requests",
             "Number of active requests",
-            ["model"]
+            ["model"],
+            multiprocess_mode="livesum"
+        )
+
+        # Multi-model serving
+        self.model_loaded = Gauge(
+            "mlserver_model_loaded",
+            "Whether the model is loaded (1) or unloaded (0)",
+            ["model"],
+            multiprocess_mode="livemax"
+        )
+
+        self.model_reloads = Counter(
+            "mlserver_model_reloads_total",
+            "Hot model reloads",
+            ["model", "result"]
         )
 
         # Model info
         self.model_info = Gauge(
             "mlserver_model_info",
             "Model information",
-            ["model", "version"]
+            ["model", "version"],
+            multiprocess_mode="livemax"
         )
-        self.model_info.labels(model=self.model_name, version="1.0").set(1)
+        self.model_version = "1.0"
+        self.model_info.labels(model=self.model_name, version=self.model_version).set(1)
+
+        # (method, endpoint, status code) -> bound request counter and duration histogram
+        self._request_series: Dict[Tuple[str, str, int], Tuple[Counter, Histogram]] = {}
+        # (stage, endpoint) -> bound stage histogram
+        self._stage_series: Dict[Tuple[str, str], Histogram] = {}
+
+    def for_model(self, model_name: str) -> MetricsCollector:
+        """Return a collector recording into the same metric families under another model label"""
+        bound = copy.copy(self)
+        bound.model_name = model_name
+        bound._request_series = {}
+        bound._stage_series = {}
+        bound.model_info.labels(model=model_name, version=bound.model_version).set(1)
+        return bound
 
     def track_request(self, request: Request, response: Response, duration: float):
         """Track general request metrics"""
-        endpoint = request.url.path
-        method = request.method
-        status_code = str(response.status_code)
-
-        self.request_count.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=status_code,
-            model=self.model_name
-        ).inc()
-
-        self.request_duration.labels(
-            method=method,
-            endpoint=endpoint,
-            model=self.model_name
-        ).observe(duration)
+        self.observe_request(request.method, request.url.path, response.status_code, duration)
+
+    def observe_request(self, method: str, endpoint: str, status_code: int, duration: float):
+        """Track general request metrics from plain values (used by the ASGI middleware)
+
+        ``endpoint`` must come from a bounded set (a route template or
+        ``OTHER_LABEL``). The labelled children are bound once per series, so a
+        request costs one dict lookup plus the counter and histogram updates.
+        """
+        if method not in HTTP_METHODS:
+            method = OTHER_LABEL
+        series = self._request_series.get((method, endpoint, status_code))
+        if series is None:
+            series = self._bind_request_series(method, endpoint, status_code)
+        counter, histogram = series
+        counter.inc()
+        histogram.observe(duration)
+
+    def _bind_request_series(self, method: str, endpoint: str, status_code: int) -> Tuple[Counter, Histogram]:
+        status_label = str(status_code) if status_code in STATUS_CODES else f"{status_code // 100}xx"
+        series = (
+            self.request_count.labels(
+                method=method,
+                endpoint=endpoint,
+                status_code=status_label,
+                model=self.model_name
+            ),
+            self.request_duration.labels(
+                method=method,
+                endpoint=endpoint,
+                model=self.model_name
+            )
+        )
+        self._request_series[(method, endpoint, status_code)] = series
+        return series
+
+    def bind_endpoints(self, endpoints: Iterable[Tuple[str, Iterable[str]]]):
+        """Pre-bind the request series of the app's routes (status 200) and of unmatched requests (404)
+
+        Args:
+            endpoints: (route template, HTTP methods) pairs
+        """
+        for endpoint, methods in endpoints:
+            for method in methods:
+                self._bind_request_series(method if method in HTTP_METHODS else OTHER_LABEL, endpoint, 200)
+        self._bind_request_series("GET", OTHER_LABEL, 404)
 
     def track_prediction(self, endpoint: str, duration: float, sample_count: int = 1):
         """Track prediction-specific metrics"""
@@ -84,6 +246,69 @@ class MetricsCollector:
             endpoint=endpoint
         ).inc(sample_count)
 
+    def track_stages(self, endpoint: str, durations: Dict[str, float]):
+        """Track the duration of each stage of one prediction request"""
+        for stage, seconds in durations.items():
+            histogram = self._stage_series.get((stage, endpoint))
+            if histogram is None:
+                histogram = self.stage_duration[stage].labels(model=self.model_name, endpoint=endpoint)
+                self._stage_series[(stage, endpoint)] = histogram
+            histogram.observe(seconds)
+
+    def track_batch(self, method: str, batch_size: int, queue_waits: List[float]):
+        """Track size of a dispatched batch and the queue wait of each request in it"""
+        self.batch_size.labels(model=self.model_name, method=method).observe(batch_size)
+
+        wait_histogram = self.batch_queue_wait.labels(model=self.model_name, method=method)
+        for wait in queue_waits:
+            wait_histogram.observe(wait)
+
+    def set_concurrency_limit(self, limit: int):
+        """Set the current concurrency limit"""
+        self.concurrency_limit.labels(model=self.model_name).set(limit)
+
+    def set_queue_depth(self, depth: int):
+        """Set the number of requests waiting for a prediction slot"""
+        self.queue_depth.labels(model=self.model_name).set(depth)
+
+    def track_queue_wait(self, duration: float):
+        """Track how long a request waited for a prediction slot"""
+        self.queue_wait.labels(model=self.model_name).observe(duration)
+
+    def track_shed(self, reason: str):
+        """Track a request rejected by the admission queue (queue_full|estimated_wait|timeout)"""
+        self.requests_shed.labels(model=self.model_name, reason=reason).inc()
+
+    def track_cache(self, method: str, hits: int, misses: int, evictions: int = 0):
+        """Track prediction cache lookups for one request"""
+        if hits:
+            self.cache_hits.labels(model=self.model_name, method=method).inc(hits)
+        if misses:
+            self.cache_misses.labels(model=self.model_name, method=method).inc(misses)
+        if evictions:
+            self.cache_evictions.labels(model=self.model_name, method=method).inc(evictions)
+
+    def set_model_loaded(self, loaded: bool):
+        """Set whether the model is currently loaded"""
+        self.model_loaded.labels(model=self.model_name).set(1 if loaded else 0)
+
+    def set_model_version(self, version: str):
+        """Replace the version label of the model info metric"""
+        if version == self.model_version:
+            return
+        # Zero the old series first: in multiprocess mode it lives on in this worker's file
+        self.model_info.labels(model=self.model_name, version=self.model_version).set(0)
+        try:
+            self.model_info.remove(self.model_name, self.model_version)
+        except KeyError:
+            pass
+        self.model_version = version
+        self.model_info.labels(model=self.model_name, version=version).set(1)
+
+    def track_reload(self, result: str):
+        """Track a hot reload attempt (success|failure)"""
+        self.model_reloads.labels(model=self.model_name, result=result).inc()
+
     def inc_active_requests(self):
         """Increment active requests counter"""
         self.active_requests.labels(model=self.model_name).inc()
@@ -93,7 +318,11 @@ class MetricsCollector:
         self.active_requests.labels(model=self.model_name).dec()
 
     def generate_metrics(self) -> str:
-        """Generate Prometheus metrics in text format"""
+        """Generate Prometheus metrics in text format (aggregated across workers in multiprocess mode)"""
+        if multiprocess_enabled():
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry)
         return generate_latest()
 
     def get_content_type(self) -> str:
@@ -114,4 +343,47 @@ def init_metrics(model_name: Optional[str] = None) -> MetricsCollector:
 
 def get_metrics() -> Optional[MetricsCollector]:
     """Get global metrics collector instance"""
-    return _metrics_collector
\ No newline at end of file
+    return _metrics_collector
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are recorded in per-process files and aggregated on collection"""
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def setup_multiprocess_metrics(directory: Optional[str] = None) -> str:
+    """
+    Aggregate metrics across worker processes (prometheus_client multiprocess mode).
+
+    Call in the parent process before the workers start and before any metric
+    is created. Every worker then writes its samples to its own files in the
+    shared directory and ``/metrics`` merges the files of all workers, so a
+    scrape reports the whole server whichever worker answers it. Metric files
+    left over from a previous run are removed.
+
+    Args:
+        directory: Shared directory for the metric files; defaults to
+            ``$PROMETHEUS_MULTIPROC_DIR`` or a temporary directory removed at exit
+
+    Returns:
+        The directory in use
+    """
+    directory = directory or os.environ.get(MULTIPROC_DIR_ENV)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+    else:
+        directory = tempfile.mkdtemp(prefix="mlserver-metrics-")
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    os.environ[MULTIPROC_DIR_ENV] = directory
+    # prometheus_client picks the value storage when it is imported; switch the
+    # metrics created from now on (and in forked workers) to per-process files
+    values.ValueClass = values.get_value_class()
+    return directory
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop the live gauges (active requests, queue depth, ...) of a worker that exited"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
@@ -11,7 +11,7 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 from pydantic import BaseModel, Field
 
-from .config import AppConfig, ServerConfig, ObservabilityConfig
+from .config import AppConfig, ServerConfig, ObservabilityConfig, MultiModelConfig
 
 
 class MultiClassifierConfig(BaseModel):
@@ -33,6 +33,9 @@ class MultiClassifierConfig(BaseModel):
     # Deployment configuration
     deployment: Optional[Dict[str, Any]] = None
 
+    # Serving all classifiers from one process (mlserver serve --all)
+    serving: MultiModelConfig = MultiModelConfig()
+
 
 def load_multi_classifier_config(config_file: str) -> MultiClassifierConfig:
     """Load a multi-classifier configuration file.
@@ -156,15 +159,20 @@ def detect_multi_classifier_config(config_file: str) -> bool:
         with open(config_file, 'r') as f:
             raw_config = yaml.safe_load(f)
 
-        # Check for multi-classifier structure (supports both dict and list formats)
-        return "classifiers" in raw_config and (
-            isinstance(raw_config["classifiers"], dict) or
-            isinstance(raw_config["classifiers"], list)
-        )
+        return is_multi_classifier_document(raw_config)
     except Exception:
         return False
 
 
+def is_multi_classifier_document(raw_config: Any) -> bool:
+    """Check whether an already parsed configuration document is multi-classifier format."""
+    # Check for multi-classifier structure (supports both dict and list formats)
+    return isinstance(raw_config, dict) and "classifiers" in raw_config and (
+        isinstance(raw_config["classifiers"], dict) or
+        isinstance(raw_config["classifiers"], list)
+    )
+
+
 def get_default_classifier(config_file: str) -> Optional[str]:
     """Get the default classifier from a multi-classifier config.
 
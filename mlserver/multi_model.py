@@ -0,0 +1,351 @@
+"""
+Multi-model serving: every classifier of a multi-classifier config in one process.
+
+Each classifier gets its own app built by ``create_app`` (its own concurrency
+limiter, admission queue, micro-batcher, prediction cache and inference
+threads) mounted under ``/{classifier}``, so ``/{classifier}/predict`` behaves
+exactly like ``/predict`` of a single-classifier server. Metrics of all models
+go to one registry, labelled with the classifier name.
+
+The ``serving`` section of the multi-classifier YAML controls loading:
+
+- ``lazy_loading``: load a model on its first request instead of at startup
+- ``max_loaded_models`` / ``memory_budget_mb``: unload the least recently used
+  idle models when a load exceeds the bound. Model memory is estimated from
+  the process USS before and after loading (Linux only). A model with requests
+  in flight is never unloaded; it is reloaded on its next request.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+
+from .config import AppConfig, MultiModelConfig
+from .metrics import get_metrics, init_metrics, mark_worker_dead
+from .multi_classifier import MultiClassifierConfig, extract_single_classifier_config
+from .prefork import process_memory
+from .startup import StartupTimings
+from .server import create_app
+
+logger = logging.getLogger(__name__)
+
+
+class _ModelEntry:
+    """Loading state of one classifier."""
+
+    def __init__(self, name: str, config: AppConfig):
+        self.name = name
+        self.config = config
+        self.app: Optional[FastAPI] = None
+        self.lifespan = None
+        self.inflight = 0
+        self.memory_bytes = 0
+        self.load_seconds: Optional[float] = None
+        self.last_used: Optional[float] = None
+        self.loads = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self.app is not None
+
+
+def _unique_memory() -> Optional[int]:
+    usage = process_memory()
+    return usage["uss"] if usage else None
+
+
+class ModelRegistry:
+    """
+    Loads, routes to and unloads the per-classifier apps.
+
+    Loads are serialized (one at a time, off the event loop) so the memory
+    estimate of each model is not mixed up with another load; requests for
+    models that are already loaded never wait for them.
+    """
+
+    def __init__(self, configs: Dict[str, AppConfig], serving: Optional[MultiModelConfig] = None,
+                 config_file_name: Optional[str] = None, metrics_getter: Optional[Callable] = None):
+        """
+        Args:
+            configs: Classifier name to its application configuration
+            serving: Loading and unloading settings
+            config_file_name: Name of the configuration file (reported in metadata)
+            metrics_getter: Returns the process-wide metrics collector, or None
+                when metrics are disabled
+        """
+        self.serving = serving or MultiModelConfig()
+        self.config_file_name = config_file_name
+        self.metrics_getter = metrics_getter
+        self._entries = {name: _ModelEntry(name, config) for name, config in configs.items()}
+        # Loaded models, least recently used first
+        self._loaded: "OrderedDict[str, _ModelEntry]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    @property
+    def loaded_names(self) -> List[str]:
+        return list(self._loaded)
+
+    @property
+    def loaded_memory_bytes(self) -> int:
+        return sum(entry.memory_bytes for entry in self._loaded.values())
+
+    async def acquire(self, name: str) -> FastAPI:
+        """Return the app of a classifier for one request, loading it if needed.
+
+        Every successful call must be paired with ``release``.
+        """
+        entry = self._entries[name]
+        if not entry.loaded:
+            async with self._lock:
+                if not entry.loaded:
+                    await self._evict(exclude=entry, reserve=1)
+                    await self._load(entry)
+                    await self._evict(exclude=entry)
+        entry.inflight += 1
+        entry.last_used = time.time()
+        self._loaded.move_to_end(name)
+        return entry.app
+
+    def release(self, name: str) -> None:
+        self._entries[name].inflight -= 1
+
+    async def load_all(self) -> None:
+        """Load every classifier (startup without lazy loading)."""
+        for name in self._entries:
+            await self.acquire(name)
+            self.release(name)
+
+    async def close(self) -> None:
+        """Unload every model (server shutdown)."""
+        async with self._lock:
+            for entry in list(self._loaded.values()):
+                await self._unload(entry)
+
+    async def _load(self, entry: _ModelEntry) -> None:
+        config = entry.config
+        started = time.perf_counter()
+        memory_before = _unique_memory()
+
+        timings = StartupTimings()
+        metrics = self.metrics_getter() if self.metrics_getter else None
+        model_metrics = metrics.for_model(entry.name) if metrics else None
+        app = create_app(
+            config,
+            config_file_name=self.config_file_name,
+            metrics_getter=lambda: model_metrics,
+            startup_timings=timings
+        )
+        # Deserializing the model and capturing git metadata can take seconds; keep serving
+        # the loaded models meanwhile and only run the rest of the startup on the event loop
+        app.state.prebuilt_model_state = await asyncio.to_thread(app.state.build_model_state, None, timings)
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+
+        memory_after = _unique_memory()
+        if memory_before is not None and memory_after is not None:
+            entry.memory_bytes = max(memory_after - memory_before, 0)
+        entry.app, entry.lifespan = app, lifespan
+        entry.load_seconds = time.perf_counter() - started
+        entry.loads += 1
+        self._loaded[entry.name] = entry
+        if model_metrics:
+            model_metrics.set_model_loaded(True)
+        logger.info(
+            f"Loaded model '{entry.name}' in {entry.load_seconds:.2f}s "
+            f"(~{entry.memory_bytes / 1024 / 1024:.1f} MB)"
+        )
+
+    async def _unload(self, entry: _ModelEntry) -> None:
+        lifespan = entry.lifespan
+        # New requests see the model as unloaded from here on and wait for a reload
+        entry.app, entry.lifespan = None, None
+        self._loaded.pop(entry.name, None)
+        entry.memory_bytes = 0
+        await lifespan.__aexit__(None, None, None)
+
+        metrics = self.metrics_getter() if self.metrics_getter else None
+        if metrics:
+            metrics.for_model(entry.name).set_model_loaded(False)
+        logger.info(f"Unloaded model '{entry.name}'")
+
+    def _over_budget(self, reserve: int) -> bool:
+        max_loaded = self.serving.max_loaded_models
+        if max_loaded is not None and len(self._loaded) + reserve > max_loaded:
+            return True
+        budget_mb = self.serving.memory_budget_mb
+        return budget_mb is not None and self.loaded_memory_bytes > budget_mb * 1024 * 1024
+
+    async def _evict(self, exclude: _ModelEntry, reserve: int = 0) -> None:
+        """Unload least recently used idle models until the loaded models fit the bounds.
+
+        Args:
+            exclude: Model being loaded, never evicted
+            reserve: Slots to free for models about to be loaded
+        """
+        while self._over_budget(reserve):
+            victim = next(
+                (e for e in self._loaded.values() if e is not exclude and e.inflight == 0), None
+            )
+            if victim is None:
+                logger.warning(
+                    "Loaded models exceed the multi-model serving bounds but all of them are busy"
+                )
+                return
+            await self._unload(victim)
+
+    def status(self) -> Dict[str, Any]:
+        """Loading state of every classifier."""
+        return {
+            entry.name: {
+                "loaded": entry.loaded,
+                "active_requests": entry.inflight,
+                "memory_mb": round(entry.memory_bytes / 1024 / 1024, 1),
+                "load_seconds": round(entry.load_seconds, 3) if entry.load_seconds is not None else None,
+                "loads": entry.loads,
+                "last_used": entry.last_used,
+            }
+            for entry in self._entries.values()
+        }
+
+
+class _ModelMount:
+    """ASGI app serving ``/{classifier}/...`` through the classifier's own app."""
+
+    def __init__(self, registry: ModelRegistry, name: str):
+        self.registry = registry
+        self.name = name
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            app = await self.registry.acquire(self.name)
+        except Exception as e:
+            logger.error(f"Failed to load model '{self.name}': {e}", exc_info=True)
+            response = JSONResponse(status_code=503, content={"detail": f"Model '{self.name}' is not available."})
+            await response(scope, receive, send)
+            return
+        try:
+            await app(scope, receive, send)
+        finally:
+            self.registry.release(self.name)
+
+
+def build_model_configs(multi_config: MultiClassifierConfig, config_dir: str,
+                        path_resolver: Optional[Callable[[dict, str], dict]] = None) -> Dict[str, AppConfig]:
+    """Extract the AppConfig of every classifier, with paths relative to the config file.
+
+    Args:
+        multi_config: The multi-classifier configuration
+        config_dir: Directory containing the configuration file
+        path_resolver: Resolves relative file paths in predictor init_kwargs
+    """
+    configs = {}
+    for name in multi_config.classifiers:
+        cfg = extract_single_classifier_config(multi_config, name)
+        if path_resolver and cfg.predictor.init_kwargs:
+            cfg.predictor.init_kwargs = path_resolver(cfg.predictor.init_kwargs, config_dir)
+        cfg.set_project_path(config_dir)
+        configs[name] = cfg
+    return configs
+
+
+def create_multi_model_app(multi_config: MultiClassifierConfig, configs: Dict[str, AppConfig],
+                           config_file_name: Optional[str] = None) -> FastAPI:
+    """Create one FastAPI application serving every classifier under ``/{classifier}``.
+
+    Args:
+        multi_config: The multi-classifier configuration (server, observability
+            and serving settings)
+        configs: Classifier name to its application configuration
+        config_file_name: Name of the configuration file (reported in metadata)
+    """
+    observability = multi_config.observability
+    registry = ModelRegistry(
+        configs,
+        serving=multi_config.serving,
+        config_file_name=config_file_name,
+        metrics_getter=get_metrics if observability.metrics else None
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if observability.metrics:
+            metrics = init_metrics(multi_config.repository.get("name", "multi-model"))
+            for name in registry.names:
+                metrics.for_model(name).set_model_loaded(False)
+        if not multi_config.serving.lazy_loading:
+            await registry.load_all()
+        yield
+        await registry.close()
+        mark_worker_dead(os.getpid())
+
+    app = FastAPI(title=multi_config.server.title, lifespan=lifespan)
+    app.state.registry = registry
+
+    @app.get("/healthz")
+    def health():
+        return {"status": "ok", "models": registry.loaded_names}
+
+    @app.get("/info")
+    def info():
+        """List the served classifiers and their endpoints."""
+        classifiers = {}
+        for name, cfg in configs.items():
+            classifiers[name] = {
+                "version": cfg.classifier.get("version"),
+                "predictor": cfg.predictor.class_name,
+                "loaded": name in registry.loaded_names,
+                "endpoints": {
+                    endpoint: f"/{name}/{endpoint}"
+                    for endpoint in ("predict", "predict_proba") if cfg.is_endpoint_enabled(endpoint)
+                },
+            }
+        return {
+            "repository": multi_config.repository.get("name"),
+            "default_classifier": multi_config.default_classifier,
+            "lazy_loading": multi_config.serving.lazy_loading,
+            "classifiers": classifiers,
+        }
+
+    @app.get("/status")
+    def status():
+        """Loading state of every model and memory of this worker."""
+        return {
+            "models": registry.status(),
+            "loaded_models": len(registry.loaded_names),
+            "loaded_memory_mb": round(registry.loaded_memory_bytes / 1024 / 1024, 1),
+            "worker_pid": os.getpid(),
+            "memory": process_memory(),
+        }
+
+    if observability.metrics:
+        # Cache metrics for 5 seconds to reduce CPU load during monitoring scrapes
+        @lru_cache(maxsize=1)
+        def _get_cached_metrics(timestamp_key: int):
+            metrics_collector = get_metrics()
+            if metrics_collector:
+                return Response(
+                    content=metrics_collector.generate_metrics(),
+                    media_type=metrics_collector.get_content_type()
+                )
+            return Response(content="# No metrics available\n", media_type="text/plain")
+
+        @app.get(observability.metrics_endpoint)
+        def metrics():
+            return _get_cached_metrics(int(time.time() // 5))
+
+    # Registered after the routes above, so those names take precedence over classifiers
+    for name in configs:
+        app.mount(f"/{name}", _ModelMount(registry, name))
+
+    return app
@@ -0,0 +1,174 @@
+"""
+Request observability as a pure ASGI middleware.
+
+``RequestObservabilityMiddleware`` records request metrics and structured
+request/response logs without ``BaseHTTPMiddleware``'s per-request task and
+response stream wrapping: it only intercepts the ``http.response.start`` message to read the
+status code (and add the request ID header).
+
+- Correlation IDs: an incoming ``X-Request-ID`` (``request_id_header``) is
+  reused instead of minting a new UUID, and the ID is echoed on the response.
+- Log sampling: with ``log_sample_rate`` below 1, only that fraction of
+  successful requests is logged; requests answered with status >= 400 (or
+  failing with an exception) are always logged, with method and path on the
+  completion line so an unsampled error is still self-contained.
+
+Request duration covers the whole response, including a streamed body.
+Requests are labelled by the template of the matched route
+(``/v1/{name}/predict``, not the requested path) and unmatched requests by
+``other``, so a client requesting random paths cannot create new series.
+
+``RequestStages`` breaks a prediction request down into stages
+(``metrics.STAGES``: parse, adapt, predict, format, validate, encode); each
+stage has its own histogram and, with ``server_timing`` enabled, the
+durations are returned in a ``Server-Timing`` header.
+"""
+import random
+import re
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import AppConfig
+from .logging_conf import correlation_id_var, log_request, log_response, set_correlation_id
+from .metrics import OTHER_LABEL, get_metrics
+
+# Incoming request IDs are logged and echoed, so only accept short printable tokens
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._:/+=@-]{1,128}")
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class _Stage:
+    """Times one stage; a plain class because it runs several times per request."""
+
+    __slots__ = ("stages", "name", "started")
+
+    def __init__(self, stages: "RequestStages", name: str):
+        self.stages = stages
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stages.record(self.name, time.perf_counter() - self.started)
+
+
+class RequestStages:
+    """Wall-clock duration of each stage of one prediction request."""
+
+    __slots__ = ("durations",)
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+
+    def stage(self, name: str) -> _Stage:
+        """Time a ``with`` block as the named stage (repeated stages add up)."""
+        return _Stage(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value (durations in milliseconds)."""
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.durations.items())
+
+
+_UNTIMED = nullcontext()
+
+
+def timed_stage(stages: Optional[RequestStages], name: str):
+    """``stages.stage(name)``, or nothing when the request is not being timed."""
+    return _UNTIMED if stages is None else _Stage(stages, name)
+
+
+def untracked_paths(config: AppConfig) -> frozenset:
+    """Probe and scrape paths that are not recorded in the request metrics."""
+    return frozenset(("/healthz", "/readyz", config.observability.metrics_endpoint))
+
+
+def route_endpoints(routes: Iterable, exclude: Iterable[str] = ()) -> List[Tuple[str, Iterable[str]]]:
+    """(route template, HTTP methods) of every HTTP route, for ``MetricsCollector.bind_endpoints``"""
+    exclude = set(exclude)
+    return [
+        (route.path, route.methods) for route in routes
+        if getattr(route, "methods", None) and route.path not in exclude
+    ]
+
+
+class RequestObservabilityMiddleware:
+    """Pure ASGI middleware: request metrics, correlation IDs and sampled request logs."""
+
+    def __init__(self, app, config: AppConfig, metrics_getter: Optional[Callable] = None):
+        self.app = app
+        self.config = config
+        observability = config.observability
+        # Resolved per request: the stack is built before the lifespan creates the collector
+        self.metrics_getter = (metrics_getter or get_metrics) if observability.metrics else None
+        self.skip_paths = untracked_paths(config)
+        self.structured_logging = observability.structured_logging
+        self.correlation_ids = observability.correlation_ids
+        self.sample_rate = observability.log_sample_rate
+        self.request_id_header = observability.request_id_header.lower().encode("latin-1")
+        self._response_header = observability.request_id_header.encode("latin-1")
+
+    def _request_id(self, scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == self.request_id_header:
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.fullmatch(candidate):
+                    correlation_id_var.set(candidate)
+                    return candidate
+                break
+        return set_correlation_id()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        method = scope["method"]
+        metrics = self.metrics_getter() if self.metrics_getter and path not in self.skip_paths else None
+        correlation_id = self._request_id(scope) if self.correlation_ids else None
+        sampled = self.structured_logging and (
+            self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        )
+
+        start_time = time.perf_counter()
+        if metrics:
+            metrics.inc_active_requests()
+        if sampled:
+            log_request(method=method, path=path, correlation_id=correlation_id)
+
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if correlation_id is not None:
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (self._response_header, correlation_id.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            if metrics:
+                metrics.dec_active_requests()
+            if self.structured_logging:
+                log_response(status_code=500, duration_ms=duration * 1000, method=method, path=path, error=str(e))
+            raise
+
+        duration = time.perf_counter() - start_time
+        if metrics:
+            route = scope.get("route")
+            metrics.observe_request(method, route.path if route is not None else OTHER_LABEL, status_code, duration)
+            metrics.dec_active_requests()
+        if sampled or (self.structured_logging and status_code >= 400):
+            log_response(status_code=status_code, duration_ms=duration * 1000, method=method, path=path)
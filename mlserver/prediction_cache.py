@@ -0,0 +1,214 @@
+"""
+Row-level prediction cache.
+
+Repeated requests for the same entities (client retries, repeated lookups)
+are answered from memory instead of the model. Entries are keyed per input row
+by a BLAKE2 digest of the row after adapter conversion, so the same features
+hit the cache whether they arrived as records, ndarray, columns or a binary
+body. For a partially cached batch only the missing rows are sent to the model.
+
+Eviction is LRU, bounded by entry count and approximate memory, with an
+optional TTL.
+"""
+import hashlib
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Per-entry bookkeeping overhead (key, OrderedDict node, tuple) in bytes
+_ENTRY_OVERHEAD = 200
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU/TTL cache of per-row predictor outputs.
+    """
+
+    def __init__(self, max_entries: int = 100_000, max_memory_mb: float = 256,
+                 ttl_seconds: Optional[float] = None, model_identity: str = "",
+                 metrics_getter: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached rows
+            max_memory_mb: Approximate memory bound for cached rows
+            ttl_seconds: Entry lifetime (None = until evicted)
+            model_identity: Model identity mixed into every key, so a different
+                model version never serves another version's results
+            metrics_getter: Callable returning the active MetricsCollector (or None)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.ttl = ttl_seconds
+        self.model_identity = model_identity
+        self._metrics_getter = metrics_getter
+        self._entries: "OrderedDict[bytes, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Whether each method's output splits per row; learnt from its first call
+        self._row_aligned: Dict[str, bool] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by cached rows."""
+        return self._bytes
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def predict(self, method: str, X: Any, compute: Callable[[Any], Any]) -> Any:
+        """Return ``compute(X)``, answering cached rows from memory.
+
+        Only the rows of ``X`` that miss the cache are passed to ``compute``.
+        The first call of a method computes the whole batch to find out whether
+        its output splits per row; a method whose output does not (e.g. a dict)
+        bypasses the cache from then on, without any lookups.
+        """
+        if not isinstance(X, np.ndarray) or X.ndim != 2 or len(X) == 0:
+            return compute(X)
+        aligned = self._row_aligned.get(method)
+        if aligned is False:
+            return compute(X)
+        if aligned is None:
+            return self._probe(method, X, compute)
+
+        keys = self._row_keys(method, X)
+        now = time.monotonic()
+        cached: List[Any] = [None] * len(keys)
+        missing: List[int] = []
+        evictions = 0
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl is not None and now - entry[1] > self.ttl:
+                    self._remove(key)
+                    evictions += 1
+                    entry = None
+                if entry is None:
+                    missing.append(i)
+                else:
+                    self._entries.move_to_end(key)
+                    cached[i] = entry[0]
+
+        hits = len(keys) - len(missing)
+        if not missing:
+            self._track(method, hits, 0, evictions)
+            return _assemble(cached)
+
+        miss_X = X if hits == 0 else X[missing]
+        result = compute(miss_X)
+
+        if not _is_row_aligned(result, len(missing)):
+            # Split per row when probed, but not now (e.g. a scalar for a single row):
+            # the cached rows cannot be combined with it, so only this once the whole
+            # batch is predicted again
+            self._disable(method, result)
+            self._track(method, 0, len(keys), evictions)
+            return result if hits == 0 else compute(X)
+
+        with self._lock:
+            for position, i in enumerate(missing):
+                row = _copy_row(result[position])
+                cached[i] = row
+                evictions += self._store(keys[i], row, now)
+
+        self._track(method, hits, len(missing), evictions)
+        return result if hits == 0 else _assemble(cached, like=result)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _probe(self, method: str, X: np.ndarray, compute: Callable[[Any], Any]) -> Any:
+        """Predict a method's first batch and learn whether its output splits per row."""
+        result = compute(X)
+        if not _is_row_aligned(result, len(X)):
+            self._disable(method, result)
+            return result
+        self._row_aligned[method] = True
+
+        keys = self._row_keys(method, X)
+        now = time.monotonic()
+        evictions = 0
+        with self._lock:
+            for i, key in enumerate(keys):
+                evictions += self._store(key, _copy_row(result[i]), now)
+        self._track(method, 0, len(keys), evictions)
+        return result
+
+    def _disable(self, method: str, result: Any) -> None:
+        logger.warning(
+            f"{method} output of type {type(result).__name__} cannot be split per row; "
+            f"disabling the prediction cache for {method}"
+        )
+        self._row_aligned[method] = False
+
+    def _row_keys(self, method: str, X: np.ndarray) -> List[bytes]:
+        prefix = f"{self.model_identity}|{method}|{X.dtype.str}|{X.shape[1]}|".encode()
+        if X.dtype.hasobject:
+            rows = (repr(tuple(row)).encode() for row in X)
+        else:
+            X = np.ascontiguousarray(X)
+            rows = (row.tobytes() for row in X)
+        return [hashlib.blake2b(prefix + row, digest_size=16).digest() for row in rows]
+
+    def _store(self, key: bytes, value: Any, now: float) -> int:
+        """Insert an entry and evict LRU entries until within bounds; returns evictions."""
+        if key in self._entries:
+            self._remove(key)
+        size = _ENTRY_OVERHEAD + (value.nbytes if isinstance(value, np.ndarray) else sys.getsizeof(value))
+        self._entries[key] = (value, now, size)
+        self._bytes += size
+
+        evictions = 0
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            evictions += 1
+        return evictions
+
+    def _remove(self, key: bytes) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _track(self, method: str, hits: int, misses: int, evictions: int) -> None:
+        metrics = self._metrics_getter() if self._metrics_getter else None
+        if metrics:
+            metrics.track_cache(method, hits, misses, evictions)
+
+
+def _is_row_aligned(result: Any, rows: int) -> bool:
+    if isinstance(result, np.ndarray):
+        return result.ndim > 0 and result.shape[0] == rows
+    if isinstance(result, (list, tuple)):
+        return len(result) == rows
+    return False
+
+
+def _copy_row(row: Any) -> Any:
+    # Copy array rows so a cached entry does not keep the whole batch alive
+    return row.copy() if isinstance(row, np.ndarray) else row
+
+
+def _assemble(rows: List[Any], like: Any = None) -> Any:
+    """Rebuild a batch result from per-row values."""
+    if isinstance(like, (list, tuple)):
+        return list(rows)
+    if all(isinstance(row, (np.ndarray, np.generic)) for row in rows):
+        return np.stack(rows)
+    return list(rows)
@@ -1,18 +1,25 @@
 
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 import os
 import sys
 import logging
 from pathlib import Path
 
+from .artifacts import check_heap_file_size, load_artifacts
+from .startup import StartupTimings, timed
+
 logger = logging.getLogger(__name__)
 
 
 def _validate_model_files(init_kwargs: dict) -> None:
-    """Validate model file sizes before loading to prevent memory issues."""
-    file_size_limit_mb = 2000  # 2GB limit
+    """Validate model file sizes before loading to prevent memory issues.
 
+    Files passed through init_kwargs are loaded by the predictor itself, so they
+    are assumed to end up on the heap. Memory-mapped artifacts declared under
+    ``predictor.artifacts`` are not subject to the size limit.
+    """
     # Common model file parameters to check
     file_params = ['model_path', 'preprocessor_path', 'weights_path', 'checkpoint_path']
 
@@ -20,17 +27,22 @@ def _validate_model_files(init_kwargs: dict) -> None:
         if param in init_kwargs:
             file_path = init_kwargs[param]
             if isinstance(file_path, str) and os.path.exists(file_path):
-                size_bytes = os.path.getsize(file_path)
-                size_mb = size_bytes / (1024 * 1024)
+                check_heap_file_size(file_path)
 
-                if size_mb > file_size_limit_mb:
-                    raise ValueError(
-                        f"Model file {file_path} is too large: {size_mb:.1f}MB "
-                        f"(limit: {file_size_limit_mb}MB). Consider using a smaller model "
-                        f"or increase system resources."
-                    )
-                elif size_mb > 100:  # Warn for files > 100MB
-                    logger.warning(f"Loading large model file: {file_path} ({size_mb:.1f}MB)")
+
+def _add_local_module_dir(module_spec: str, config_dir: Optional[str]) -> Optional[str]:
+    """Put ``config_dir`` on sys.path if the module is a file there; returns its module name."""
+    if not config_dir or ('.' in module_spec and not module_spec.endswith('.py')):
+        return None
+    module_name = module_spec.replace('.py', '')
+    if not (Path(config_dir) / f"{module_name}.py").exists():
+        return None
+    # Add at the beginning to prioritize local modules
+    config_dir_abs = str(Path(config_dir).resolve())
+    if config_dir_abs not in sys.path:
+        sys.path.insert(0, config_dir_abs)
+        logger.info(f"Added '{config_dir_abs}' to Python path")
+    return module_name
 
 
 def resolve_module_path(module_spec: str, config_dir: Optional[str] = None) -> str:
@@ -54,19 +66,9 @@ def resolve_module_path(module_spec: str, config_dir: Optional[str] = None) -> s
 
     # Case 2 & 3: Simple name or filename - try to resolve relative to config
     if config_dir:
-        # Remove .py extension if present
-        module_name = module_spec.replace('.py', '')
-
-        # Check if the file exists in the config directory
-        module_file = Path(config_dir) / f"{module_name}.py"
-        if module_file.exists():
-            # Add config directory to Python path if not already there
-            # Add at the beginning to prioritize local modules
-            config_dir_abs = str(Path(config_dir).resolve())
-            if config_dir_abs not in sys.path:
-                sys.path.insert(0, config_dir_abs)
-                logger.info(f"Added '{config_dir_abs}' to Python path")
-
+        # Check if the file exists in the config directory (and add the directory to the path)
+        module_name = _add_local_module_dir(module_spec, config_dir)
+        if module_name is not None:
             # Try to import it directly by name after adding to path
             try:
                 # Force reimport in case module was previously loaded
@@ -109,18 +111,56 @@ def resolve_module_path(module_spec: str, config_dir: Optional[str] = None) -> s
     return module_spec
 
 
-def load_predictor(module: str, class_name: str, init_kwargs: dict, config_dir: Optional[str] = None) -> Any:
+def _load_artifacts_timed(artifacts: Any, config_dir: Optional[str], timings: Optional[StartupTimings]):
+    with timed(timings, "artifacts"):
+        return load_artifacts(artifacts, config_dir)
+
+
+def load_predictor(module: str, class_name: str, init_kwargs: dict, config_dir: Optional[str] = None,
+                   artifacts: Any = None, timings: Optional[StartupTimings] = None) -> Any:
     """Load a predictor class with intelligent module resolution.
 
+    Declared artifacts are loaded on a background thread while the predictor
+    module is imported.
+
     Args:
         module: Module specification (can be full path, filename, or simple name)
         class_name: Name of the predictor class
         init_kwargs: Keyword arguments for the predictor constructor
         config_dir: Directory containing the configuration file (for relative imports)
+        artifacts: Artifact mapping or manifest path; each loaded artifact is passed
+            to the constructor as a keyword argument named after it
+        timings: Records the import, artifacts and predictor_init phases
     """
     # Validate model file sizes before loading
     _validate_model_files(init_kwargs or {})
 
+    if not artifacts:
+        return _import_and_init(module, class_name, init_kwargs, config_dir, dict, timings)
+    # Pickled artifacts may reference classes from the project directory (e.g. a custom
+    # transformer), so it goes on sys.path before they are unpickled rather than during the import
+    _add_local_module_dir(module, config_dir)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlserver-artifacts") as pool:
+        loading = pool.submit(_load_artifacts_timed, artifacts, config_dir, timings)
+        return _import_and_init(module, class_name, init_kwargs, config_dir, loading.result, timings)
+
+
+def _import_and_init(module: str, class_name: str, init_kwargs: dict, config_dir: Optional[str],
+                     loaded_artifacts: Callable[[], Dict[str, Any]], timings: Optional[StartupTimings]) -> Any:
+    """Import the predictor class and construct it with init_kwargs plus the loaded artifacts."""
+    with timed(timings, "import"):
+        cls = _import_predictor_class(module, class_name, config_dir)
+
+    kwargs = dict(init_kwargs or {})
+    # Waits for artifacts still loading in the background
+    kwargs.update(loaded_artifacts())
+
+    # Instantiate the predictor
+    with timed(timings, "predictor_init"):
+        return cls(**kwargs)
+
+
+def _import_predictor_class(module: str, class_name: str, config_dir: Optional[str]) -> Any:
     # Resolve the module path
     resolved_module = resolve_module_path(module, config_dir)
 
@@ -145,9 +185,6 @@ def load_predictor(module: str, class_name: str, init_kwargs: dict, config_dir:
 
     # Get the class from the module
     try:
-        cls = getattr(mod, class_name)
+        return getattr(mod, class_name)
     except AttributeError as e:
         raise ImportError(f"Class {class_name!r} not found in module {resolved_module!r}") from e
-
-    # Instantiate the predictor
-    return cls(**(init_kwargs or {}))
@@ -0,0 +1,247 @@
+"""
+Pre-fork multi-worker serving (``server.preload``).
+
+uvicorn starts its workers with the ``spawn`` method, so every worker imports
+the app and loads its own copy of the model. In preload mode the master process
+loads the predictor and binds the listening socket once, then forks the
+workers with ``os.fork()``. Model memory that is only read after loading stays
+shared between workers copy-on-write; per-worker USS shows how much each worker
+really owns.
+"""
+import gc
+import logging
+import os
+import signal
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+from .config import AppConfig
+from .metrics import mark_worker_dead, multiprocess_enabled, setup_multiprocess_metrics
+from .predictor_loader import load_predictor
+from .startup import StartupTimings
+
+logger = logging.getLogger(__name__)
+
+# Fields of /proc/<pid>/smaps_rollup summed into each reported figure
+_SMAPS_FIELDS = {
+    "rss": ("Rss",),
+    "pss": ("Pss",),
+    "uss": ("Private_Clean", "Private_Dirty"),
+}
+
+
+def process_memory(pid: Optional[int] = None) -> Optional[Dict[str, int]]:
+    """Return RSS, PSS and USS of a process in bytes, or None if unavailable.
+
+    USS (unique set size) is the memory that would be freed if the process
+    exited; pages shared copy-on-write with other workers are not included.
+    Only Linux is supported (via /proc/<pid>/smaps_rollup).
+    """
+    path = f"/proc/{pid or os.getpid()}/smaps_rollup"
+    try:
+        with open(path) as f:
+            values = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(":"):
+                    values[parts[0][:-1]] = int(parts[1]) * 1024
+    except (OSError, ValueError):
+        return None
+    return {key: sum(values.get(field, 0) for field in fields) for key, fields in _SMAPS_FIELDS.items()}
+
+
+def log_worker_memory(pids: List[int]) -> None:
+    """Log RSS/PSS/USS of the master and every worker process."""
+    master = process_memory()
+    if master is None:
+        logger.info("Per-worker memory reporting is not available on this platform")
+        return
+    logger.info(_format_memory("master", os.getpid(), master))
+    for pid in pids:
+        usage = process_memory(pid)
+        if usage:
+            logger.info(_format_memory("worker", pid, usage))
+
+
+def _format_memory(role: str, pid: int, usage: Dict[str, int]) -> str:
+    mb = 1024 * 1024
+    return (
+        f"{role} pid={pid} rss={usage['rss'] / mb:.1f}MB "
+        f"pss={usage['pss'] / mb:.1f}MB uss={usage['uss'] / mb:.1f}MB"
+    )
+
+
+class PreforkServer:
+    """
+    Minimal pre-fork supervisor: preload, bind, fork, and restart crashed workers.
+
+    Crashed workers are restarted after an exponential backoff; if more than
+    ``max_restarts`` crashes happen within ``restart_window`` seconds the
+    supervisor stops all workers and exits with ``failed`` set, rather than
+    re-forking a worker that crashes on startup in a tight loop.
+    """
+
+    def __init__(self, config: AppConfig, config_file_name: Optional[str] = None,
+                 memory_report_delay: float = 10.0, max_restarts: int = 5,
+                 restart_window: float = 60.0, restart_backoff: float = 0.5,
+                 max_restart_backoff: float = 30.0):
+        """
+        Initialize the supervisor.
+
+        Args:
+            config: Application configuration (server.workers sets the worker count)
+            config_file_name: Name of the configuration file (reported in metadata)
+            memory_report_delay: Seconds after startup to log per-worker memory (0 disables)
+            max_restarts: Worker crashes tolerated within restart_window before giving up
+            restart_window: Seconds over which worker crashes are counted
+            restart_backoff: Delay before restarting after the first crash; doubles per crash in the window
+            max_restart_backoff: Upper bound for the restart delay in seconds
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("server.preload requires a platform with os.fork()")
+        if config.api.inference_backend == "process":
+            raise ValueError("server.preload cannot be combined with inference_backend: process")
+
+        self.config = config
+        self.config_file_name = config_file_name
+        self.memory_report_delay = memory_report_delay
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.workers: Dict[int, int] = {}  # pid -> worker index
+        self.failed = False
+        self._crashes: List[float] = []  # monotonic times of recent worker crashes
+        self._stopping = False
+
+    def run(self) -> None:
+        """Load the predictor, fork the workers and supervise them until stopped."""
+        from .server import create_app
+
+        cfg = self.config
+        if cfg.observability.metrics and not multiprocess_enabled():
+            setup_multiprocess_metrics(cfg.observability.multiprocess_dir)
+        start = time.perf_counter()
+        timings = StartupTimings()
+        predictor = load_predictor(
+            cfg.predictor.module,
+            cfg.predictor.class_name,
+            cfg.predictor.init_kwargs,
+            config_dir=cfg.project_path or None,
+            artifacts=cfg.predictor.artifacts,
+            timings=timings
+        )
+        logger.info(
+            f"Preloaded {type(predictor).__name__} in {time.perf_counter() - start:.2f}s; "
+            f"forking {cfg.server.workers} workers"
+        )
+
+        app = create_app(cfg, config_file_name=self.config_file_name, preloaded_predictor=predictor,
+                         startup_timings=timings)
+        uvicorn_config = uvicorn.Config(
+            app,
+            host=cfg.server.host,
+            port=cfg.server.port,
+            log_level=cfg.server.log_level.lower(),
+        )
+        sock = uvicorn_config.bind_socket()
+
+        # Move everything allocated so far out of the collector's reach, so that
+        # garbage collection in the workers does not touch (and copy) those pages
+        gc.freeze()
+
+        for index in range(cfg.server.workers):
+            self._spawn(index, uvicorn_config, sock)
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        report_at = time.monotonic() + self.memory_report_delay if self.memory_report_delay > 0 else None
+        pending: Dict[int, float] = {}  # worker index -> monotonic time to restart it
+
+        try:
+            while self.workers or pending:
+                now = time.monotonic()
+                if report_at is not None and now >= report_at:
+                    log_worker_memory(list(self.workers))
+                    report_at = None
+                if self._stopping:
+                    pending.clear()
+                for index, restart_at in list(pending.items()):
+                    if now >= restart_at:
+                        del pending[index]
+                        self._spawn(index, uvicorn_config, sock)
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    if not pending:
+                        break
+                    pid = 0
+                if pid == 0:
+                    time.sleep(0.5)
+                    continue
+                index = self.workers.pop(pid, None)
+                mark_worker_dead(pid)
+                if index is None or self._stopping:
+                    continue
+                delay = self._record_crash(time.monotonic())
+                if delay is None:
+                    logger.error(
+                        f"Worker {pid} exited with status {status}; {len(self._crashes)} worker crashes "
+                        f"within {self.restart_window:g}s, stopping the server"
+                    )
+                    self.failed = True
+                    self._handle_stop(signal.SIGTERM, None)
+                else:
+                    logger.warning(f"Worker {pid} exited with status {status}; restarting in {delay:.1f}s")
+                    pending[index] = time.monotonic() + delay
+        finally:
+            sock.close()
+
+    def _record_crash(self, now: float) -> Optional[float]:
+        """Record a worker crash and return the delay before restarting the worker.
+
+        Returns None once more than ``max_restarts`` crashes fall within ``restart_window``.
+        """
+        self._crashes = [t for t in self._crashes if now - t < self.restart_window]
+        self._crashes.append(now)
+        if len(self._crashes) > self.max_restarts:
+            return None
+        return min(self.restart_backoff * 2 ** (len(self._crashes) - 1), self.max_restart_backoff)
+
+    def _spawn(self, index: int, uvicorn_config: uvicorn.Config, sock) -> None:
+        pid = os.fork()
+        if pid == 0:  # worker
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            exit_code = 0
+            try:
+                uvicorn.Server(uvicorn_config).run(sockets=[sock])
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.workers[pid] = index
+        logger.info(f"Started worker {index} (pid {pid})")
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def serve_preloaded(config: AppConfig, config_file_name: Optional[str] = None) -> None:
+    """Serve ``config`` with ``server.workers`` forked workers sharing a preloaded predictor.
+
+    Raises:
+        SystemExit: With status 1 if workers kept crashing
+    """
+    server = PreforkServer(config, config_file_name)
+    server.run()
+    if server.failed:
+        raise SystemExit(1)
@@ -0,0 +1,264 @@
+"""
+Process-pool inference backend (``api.inference_backend: process``).
+
+Each worker process loads its own predictor instance once, so pure-Python
+preprocessing that holds the GIL runs in parallel across cores. Numeric input
+and output arrays travel through ``multiprocessing.shared_memory`` blocks;
+only a small descriptor (block name, shape, dtype) is pickled. Object arrays
+and non-array results fall back to regular pickling.
+
+If a worker process dies, the call it was running fails and the pool is
+restarted (after an exponential backoff when it keeps happening); after
+``max_restarts`` restarts within ``restart_window`` seconds the backend stops
+restarting and every call fails.
+"""
+import logging
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .predictor_loader import load_predictor
+
+logger = logging.getLogger(__name__)
+
+# Arrays smaller than this are pickled: creating and unlinking a shared memory
+# block costs more than copying a few KB through the pipe
+SHARED_MEMORY_MIN_BYTES = 64 * 1024
+
+# Delay before restarting the pool after a second death within the window; doubles per death
+RESTART_BACKOFF_SECONDS = 0.5
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+
+# Predictor instance owned by the current worker process
+_worker_predictor: Any = None
+
+
+class _SharedArray:
+    """Picklable descriptor of an ndarray stored in a shared memory block."""
+
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype = state
+
+
+def _export(arr: Any) -> Tuple[Any, Optional[SharedMemory]]:
+    """Copy a numeric array into a new shared memory block.
+
+    Returns:
+        Tuple of (descriptor or the original object, owning SharedMemory or None)
+    """
+    if not isinstance(arr, np.ndarray) or arr.dtype.hasobject or arr.nbytes < SHARED_MEMORY_MIN_BYTES:
+        return arr, None
+    shm = SharedMemory(create=True, size=arr.nbytes)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return _SharedArray(shm.name, arr.shape, arr.dtype.str), shm
+
+
+def _attach(name: str) -> SharedMemory:
+    """Open an existing block without registering it with the resource tracker.
+
+    Before Python 3.13 opening a block always registers it; worker processes
+    are spawned and share the server's resource tracker, whose registrations
+    are a set, so the block is still unlinked exactly once, by its owner.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _import(obj: Any, unlink: bool = False) -> Any:
+    """Copy an array out of the shared memory block named by a descriptor.
+
+    Args:
+        unlink: Take ownership of the block and unlink it once copied
+    """
+    if not isinstance(obj, _SharedArray):
+        return obj
+    # An owner keeps the block tracked so that unlink() also unregisters it
+    shm = SharedMemory(name=obj.name) if unlink else _attach(obj.name)
+    try:
+        return np.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Worker process side
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _init_worker(module: str, class_name: str, init_kwargs: Dict[str, Any], config_dir: Optional[str],
+                 artifacts: Any) -> None:
+    global _worker_predictor
+    _worker_predictor = load_predictor(module, class_name, init_kwargs, config_dir=config_dir, artifacts=artifacts)
+
+
+def worker_predictor() -> Any:
+    """Predictor loaded in the current worker process by the pool initializer (None elsewhere)."""
+    return _worker_predictor
+
+
+def _worker_name() -> str:
+    return type(_worker_predictor).__name__
+
+
+def _worker_call(method: str, X: Any) -> Any:
+    if method == "predict_proba" and not hasattr(_worker_predictor, "predict_proba"):
+        raise AttributeError("predictor has no predict_proba")
+
+    result = getattr(_worker_predictor, method)(_import(X))
+    if isinstance(result, np.ndarray):
+        result = np.ascontiguousarray(result)
+    exported, shm = _export(result)
+    if shm is not None:
+        # The parent unlinks the block after copying the result out
+        shm.close()
+    return exported
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Server side
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ProcessPoolPredictor:
+    """
+    Predictor facade that runs ``predict``/``predict_proba`` in a process pool.
+
+    Exposes the same interface as ``PredictorWrapper`` so the rest of the server
+    (limiter, micro-batcher, metrics) is unchanged. Each call blocks the calling
+    inference thread until a worker process returns, so the pool should be sized
+    like the inference executor.
+    """
+
+    def __init__(self, module: str, class_name: str, init_kwargs: Optional[Dict[str, Any]] = None,
+                 config_dir: Optional[str] = None, workers: int = 1, artifacts: Any = None,
+                 max_restarts: int = 5, restart_window: float = 60.0):
+        """
+        Start the worker processes and load the predictor in each of them.
+
+        Args:
+            module: Predictor module specification
+            class_name: Predictor class name
+            init_kwargs: Keyword arguments for the predictor constructor
+            config_dir: Directory containing the configuration file
+            workers: Number of worker processes
+            artifacts: Artifact mapping or manifest path (memory-mapped artifacts
+                share their pages between the worker processes)
+            max_restarts: Pool restarts tolerated within restart_window before giving up
+            restart_window: Seconds over which pool restarts are counted
+
+        Raises:
+            Exception: If the predictor cannot be loaded in a worker process
+        """
+        self.workers = workers
+        self._initargs = (module, class_name, init_kwargs or {}, config_dir, artifacts)
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self._lock = threading.Lock()
+        self._restart_times = []  # monotonic times of recent restarts
+        self.restarts = 0
+        self._pool = self._start_pool()
+        logger.info(f"Started {workers} inference worker process(es) for {self._name}")
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        # spawn avoids forking a process that already runs server threads
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+        try:
+            # Workers are spawned on demand; one call per worker starts them all now
+            # so that model loading happens at startup rather than on the first requests
+            names = [f.result() for f in [pool.submit(_worker_name) for _ in range(self.workers)]]
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        self._name = names[0]
+        return pool
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a pool that lost a worker process (unless another thread already did).
+
+        Raises:
+            RuntimeError: If the pool was already restarted ``max_restarts`` times
+                within ``restart_window`` seconds
+        """
+        with self._lock:
+            if self._pool is not broken:
+                return
+            broken.shutdown(wait=False, cancel_futures=True)
+            now = time.monotonic()
+            self._restart_times = [t for t in self._restart_times if now - t < self.restart_window]
+            recent = len(self._restart_times)
+            if recent >= self.max_restarts:
+                raise RuntimeError(
+                    f"Inference worker processes died {recent + 1} times within {self.restart_window:g}s; "
+                    f"not restarting them again"
+                )
+            delay = min(RESTART_BACKOFF_SECONDS * 2 ** (recent - 1), MAX_RESTART_BACKOFF_SECONDS) if recent else 0.0
+            logger.error(f"An inference worker process died; restarting the worker pool in {delay:.1f}s")
+            # Callers waiting for the lock see the new pool once it is up
+            time.sleep(delay)
+            self._pool = self._start_pool()
+            self._restart_times.append(time.monotonic())
+            self.restarts += 1
+
+    def predict(self, X):
+        return self._call("predict", X)
+
+    def predict_proba(self, X):
+        return self._call("predict_proba", X)
+
+    def _call(self, method: str, X) -> Any:
+        if isinstance(X, np.ndarray):
+            X = np.ascontiguousarray(X)
+        payload, shm = _export(X)
+        try:
+            pool = self._pool
+            try:
+                future = pool.submit(_worker_call, method, payload)
+            except BrokenProcessPool:
+                # Broken by an earlier call, which reported it; this one runs on a new pool
+                self._restart(pool)
+                pool = self._pool
+                future = pool.submit(_worker_call, method, payload)
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                # A worker died (e.g. killed for running out of memory), possibly because of
+                # this very input: fail the call rather than feeding it to the new pool
+                self._restart(pool)
+                raise RuntimeError(
+                    "An inference worker process died during the prediction; the worker pool was restarted"
+                ) from e
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        return _import(result, unlink=True)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
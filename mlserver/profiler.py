@@ -0,0 +1,198 @@
+"""
+On-demand statistical profiler (``api.profiler``, ``POST /admin/profile``).
+
+``StackSampler`` runs a background thread that, every ``interval`` seconds,
+reads the current Python stack of every other thread with
+``sys._current_frames()``: the event loop, the inference executor and the
+Starlette threadpool alike. Identical stacks are counted, so memory stays
+proportional to the number of distinct stacks rather than to the duration.
+Nothing is installed while no profile is running, so the server pays no cost
+outside a profile; while one runs, each sample holds the GIL for the time it
+takes to walk the stacks. A thread whose innermost frame has not changed since
+the previous sample is not walked again, so sampling 30 mostly waiting threads
+takes about 30 us, well under 1% of the GIL at the default 100 samples per
+second.
+
+Samples of threads that are waiting (their innermost frame is a lock, queue
+or selector wait) are dropped unless ``include_idle`` is set, so the result
+shows where CPU time goes.
+
+Results are returned as collapsed stacks (``thread;outer;...;inner count``,
+the input of flamegraph.pl and most flamegraph viewers) or as a speedscope
+JSON document (https://www.speedscope.app) with one profile per thread.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# (function, file, first line)
+Frame = Tuple[str, str, int]
+
+# Innermost frames of a thread that is blocked rather than running
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "Condition.wait"),
+    ("threading.py", "Event.wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("threading.py", "Thread._wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("selectors.py", "EpollSelector.select"),
+    ("selectors.py", "KqueueSelector.select"),
+    ("selectors.py", "SelectSelector.select"),
+    ("queue.py", "get"),
+    ("queue.py", "Queue.get"),
+    ("thread.py", "_worker"),
+}
+
+
+def _frame(code) -> Frame:
+    return getattr(code, "co_qualname", code.co_name), code.co_filename, code.co_firstlineno
+
+
+def _is_idle(code) -> bool:
+    name, filename, _ = _frame(code)
+    return (os.path.basename(filename), name) in _IDLE_FRAMES
+
+
+class StackSampler:
+    """Samples the stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float = 0.01, include_idle: bool = False):
+        """
+        Args:
+            interval: Seconds between samples
+            include_idle: Keep samples of threads waiting on a lock, queue or selector
+        """
+        self.interval = interval
+        self.include_idle = include_idle
+        self._stacks: Counter = Counter()  # (thread name, code objects outermost first) -> samples
+        # Thread ident -> [innermost frame, stack key, samples not yet added to _stacks]
+        self._current: Dict[int, list] = {}
+        self._idle_codes: Dict[Any, bool] = {}
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="mlserver-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._flush()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        started = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            self.sample(skip=own)
+        self.duration = time.perf_counter() - started
+
+    def sample(self, skip: Optional[int] = None) -> None:
+        """Record the current stack of every thread except ``skip``."""
+        names = None
+        for ident, frame in sys._current_frames().items():
+            if ident == skip:
+                continue
+            if not self.include_idle:
+                idle = self._idle_codes.get(frame.f_code)
+                if idle is None:
+                    idle = self._idle_codes[frame.f_code] = _is_idle(frame.f_code)
+                if idle:
+                    continue
+
+            # While a thread is still in the same innermost frame its whole stack is
+            # unchanged (a frame's callers are fixed), so only a count is kept
+            current = self._current.get(ident)
+            if current is not None and current[0] is frame:
+                current[2] += 1
+                continue
+            if current is not None:
+                self._stacks[current[1]] += current[2]
+
+            # Only code objects are collected here; names are resolved once, in ``stacks``
+            stack = []
+            parent = frame
+            while parent is not None:
+                stack.append(parent.f_code)
+                parent = parent.f_back
+            stack.reverse()
+            if names is None:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self._current[ident] = [frame, (names.get(ident, f"thread-{ident}"), tuple(stack)), 1]
+        self.samples += 1
+
+    def _flush(self) -> None:
+        """Add the pending counts to ``_stacks`` and release the frames held for comparison."""
+        for _, key, count in self._current.values():
+            self._stacks[key] += count
+        self._current.clear()
+
+    @property
+    def stacks(self) -> Dict[Tuple[str, Tuple[Frame, ...]], int]:
+        """Sample count of every (thread name, frames outermost first) stack."""
+        pending = [(key, count) for _, key, count in list(self._current.values())]
+        frames: Dict[Any, Frame] = {}
+        stacks: Counter = Counter()
+        for (thread, codes), count in [*self._stacks.items(), *pending]:
+            stack = tuple(frames[code] if code in frames else frames.setdefault(code, _frame(code)) for code in codes)
+            stacks[(thread, stack)] += count
+        return stacks
+
+
+def _frame_label(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(sampler: StackSampler) -> str:
+    """Collapsed stack format: one ``thread;outer;...;inner count`` line per distinct stack."""
+    lines = [
+        ";".join([thread.replace(";", ":"), *(_frame_label(frame).replace(";", ":") for frame in stack)])
+        + f" {count}"
+        for (thread, stack), count in sorted(sampler.stacks.items())
+    ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def speedscope_profile(sampler: StackSampler, name: str = "mlserver") -> Dict[str, Any]:
+    """speedscope file format document with one sampled profile per thread."""
+    frames: List[Dict[str, Any]] = []
+    frame_index: Dict[Frame, int] = {}
+    by_thread: Dict[str, List[Tuple[List[int], int]]] = {}
+    for (thread, stack), count in sorted(sampler.stacks.items()):
+        indices = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            indices.append(frame_index[frame])
+        by_thread.setdefault(thread, []).append((indices, count))
+
+    profiles = []
+    for thread, stacks in by_thread.items():
+        weights = [count * sampler.interval for _, count in stacks]
+        profiles.append({
+            "type": "sampled",
+            "name": thread,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": [indices for indices, _ in stacks],
+            "weights": weights,
+        })
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "mlserver",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
@@ -15,11 +15,12 @@ class PredictRequest(BaseModel):
     The payload structure depends on the adapter configuration:
     - records adapter: {"records": [{"feature1": value1, "feature2": value2}, ...]}
     - ndarray adapter: {"ndarray": [[value1, value2], [value3, value4], ...]}
+    - columns adapter: {"columns": {"feature1": [value1, value3], "feature2": [value2, value4]}}
     """
     # Fully flexible payload — we parse inside route
     payload: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Prediction input data. Format depends on adapter: 'records' (list of dicts) or 'ndarray' (2D array)"
+        description="Prediction input data. Format depends on adapter: 'records' (list of dicts), 'ndarray' (2D array) or 'columns' (dict of lists)"
     )
 
     model_config = ConfigDict(
@@ -47,6 +48,18 @@ class PredictRequest(BaseModel):
                         }
                     }
                 },
+                {
+                    "description": "Columnar format (for adapter='columns')",
+                    "value": {
+                        "payload": {
+                            "columns": {
+                                "feature1": [1.5, 2.1],
+                                "feature2": [2.3, 1.7],
+                                "feature3": [0.8, 1.2]
+                            }
+                        }
+                    }
+                },
                 {
                     "description": "Single record prediction",
                     "value": {
@@ -67,7 +80,9 @@ class PredictRequest(BaseModel):
 
 
 class ClassifierMetadataResponse(BaseModel):
-    """Simplified metadata included in responses."""
+    """Simplified metadata included in responses (built once per loaded model, shared by all responses)."""
+    model_config = ConfigDict(frozen=True)
+
     project: str = Field(description="Auto-detected project/repository name")
     classifier: str = Field(description="Classifier name")
     predictor_class: Optional[str] = Field(None, description="Predictor class name")
@@ -0,0 +1,225 @@
+"""
+JSON serialization of prediction results.
+
+``to_jsonable`` converts predictor output (NumPy, pandas, datetime, nested
+containers) into plain Python structures. Converters are resolved once per
+type and cached, and whole arrays/frames with a numeric dtype are converted
+in bulk with ``tolist()`` instead of being walked element by element.
+
+``dumps`` encodes a response document straight to JSON bytes. When orjson is
+installed (``pip install mlserver-fastapi-wrapper[fast-json]``) NumPy arrays
+are encoded natively in C; otherwise the document goes through
+``to_jsonable`` and the standard library encoder.
+"""
+from __future__ import annotations
+import base64
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Maximum nesting depth, guards against self-referencing structures
+MAX_DEPTH = 50
+
+# dtype kinds whose ``tolist()`` already yields JSON-native Python values
+_NATIVE_KINDS = frozenset("biufU")
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_Converter = Callable[[Any, int], Any]
+_CONVERTERS: Dict[type, _Converter] = {}
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def to_jsonable(x: Any, _depth: int = 0) -> Any:
+    """Convert any Python object to a JSON-serializable structure.
+
+    Args:
+        x: Object to convert
+        _depth: Current nesting depth (internal use)
+
+    Returns:
+        JSON-serializable representation of x
+
+    Raises:
+        RecursionError: If nesting exceeds MAX_DEPTH
+    """
+    if _depth > MAX_DEPTH:
+        logger.warning(f"Max recursion depth {MAX_DEPTH} exceeded in to_jsonable")
+        raise RecursionError(f"Maximum recursion depth exceeded: {MAX_DEPTH}")
+
+    tp = type(x)
+    if tp in _SCALAR_TYPES:
+        return x
+    converter = _CONVERTERS.get(tp)
+    if converter is None:
+        converter = _CONVERTERS[tp] = _resolve_converter(tp)
+    return converter(x, _depth)
+
+
+def dumps(document: Any) -> bytes:
+    """Encode a response document as compact JSON bytes.
+
+    NaN and infinity are encoded as ``null`` with orjson; without orjson they
+    raise ValueError, matching the standard FastAPI JSON response.
+    """
+    if orjson is not None:
+        # orjson falls back to to_jsonable for anything it cannot encode natively
+        # (object arrays, pandas containers, Decimal, sets, ...)
+        return orjson.dumps(document, default=to_jsonable, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        to_jsonable(document), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Converter resolution
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _resolve_converter(tp: type) -> _Converter:
+    """Pick the converter for ``tp``; subclass checks follow the most specific type first."""
+    # Scalar subclasses (e.g. np.float64 is a float, IntEnum is an int)
+    if issubclass(tp, (str, int, float)):
+        return _identity
+    # pandas temporal types subclass datetime/timedelta, so they come first
+    if issubclass(tp, pd.Timestamp):
+        return _isoformat
+    if tp is type(pd.NaT):
+        return _none
+    if issubclass(tp, pd.Timedelta):
+        return _total_seconds
+    if issubclass(tp, pd.DataFrame):
+        return _convert_frame
+    if issubclass(tp, (pd.Series, pd.Index)):
+        return _convert_series
+    if issubclass(tp, (datetime, date, time)):
+        return _isoformat
+    if issubclass(tp, timedelta):
+        return _total_seconds
+    if issubclass(tp, np.datetime64):
+        return _convert_datetime64
+    if issubclass(tp, np.timedelta64):
+        return _convert_timedelta64
+    if issubclass(tp, np.ndarray):
+        return _convert_array
+    if issubclass(tp, np.generic):
+        return _item
+    if issubclass(tp, dict):
+        return _convert_dict
+    if issubclass(tp, (list, tuple)):
+        return _convert_sequence
+    if issubclass(tp, (set, frozenset)):
+        return _convert_set
+    if issubclass(tp, Decimal):
+        return _float
+    if issubclass(tp, bytes):
+        return _base64
+    return _fallback
+
+
+def _identity(x, _depth):
+    return x
+
+
+def _none(x, _depth):
+    return None
+
+
+def _isoformat(x, _depth):
+    return x.isoformat()
+
+
+def _total_seconds(x, _depth):
+    return x.total_seconds()
+
+
+def _item(x, _depth):
+    return x.item()
+
+
+def _float(x, _depth):
+    return float(x)
+
+
+def _base64(x, _depth):
+    return base64.b64encode(x).decode("ascii")
+
+
+def _convert_datetime64(x, _depth):
+    return pd.Timestamp(x).isoformat()
+
+
+def _convert_timedelta64(x, _depth):
+    return pd.Timedelta(x).total_seconds()
+
+
+def _convert_array(x, depth):
+    if x.dtype.kind in _NATIVE_KINDS:
+        return x.tolist()
+    return to_jsonable(x.tolist(), depth + 1)
+
+
+def _convert_series(x, depth):
+    if x.dtype.kind in _NATIVE_KINDS:
+        return x.tolist()
+    return to_jsonable(x.tolist(), depth + 1)
+
+
+def _convert_frame(x, depth):
+    records = x.to_dict("records")
+    if all(dtype.kind in _NATIVE_KINDS for dtype in x.dtypes):
+        # pandas already boxes numeric cells as native Python values
+        return records
+    return to_jsonable(records, depth + 1)
+
+
+def _convert_dict(x, depth):
+    depth += 1
+    return {
+        (k if type(k) in _SCALAR_TYPES else to_jsonable(k, depth)):
+            (v if type(v) in _SCALAR_TYPES else to_jsonable(v, depth))
+        for k, v in x.items()
+    }
+
+
+def _convert_sequence(x, depth):
+    depth += 1
+    return [item if type(item) in _SCALAR_TYPES else to_jsonable(item, depth) for item in x]
+
+
+def _convert_set(x, depth):
+    items = _convert_sequence(x, depth)
+    try:
+        return sorted(items)
+    except TypeError:
+        # Items aren't sortable, return unsorted
+        return items
+
+
+def _fallback(x, _depth):
+    type_name = type(x).__name__
+    logger.warning(
+        f"Unhandled type in to_jsonable: {type_name}. "
+        f"Attempting str() conversion. Value: {str(x)[:100]}"
+    )
+    try:
+        return str(x)
+    except Exception as e:
+        logger.error(
+            f"Failed to convert {type_name} to JSON-serializable format: {e}. "
+            f"Returning placeholder string."
+        )
+        return f"<Unserializable: {type_name}>"
@@ -1,23 +1,31 @@
 
 from __future__ import annotations
+import asyncio
+import os
+import secrets
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Request, Response
+import numpy as np
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
 
 from .config import AppConfig
 from .predictor_loader import load_predictor
 from .adapters import to_ndarray, AdapterError
 from .auto_detect import (
+    MetadataSnapshot,
+    capture_metadata,
     get_simplified_info_response,
     generate_simplified_metadata,
-    get_deployed_timestamp,
     get_mlserver_package_version
 )
 from .schemas import (
@@ -28,82 +36,33 @@ from .schemas import (
     CustomPredictResponse,
     SinglePredictRequest,
 )
-from .metrics import init_metrics, get_metrics
-from .concurrency_limiter import PredictionSemaphore, PredictionLimiter
-from .logging_conf import (
-    set_correlation_id,
-    log_request,
-    log_response,
-    log_prediction
+from .metrics import init_metrics, get_metrics, mark_worker_dead
+from .observability import (
+    SERVER_TIMING_HEADER, RequestObservabilityMiddleware, RequestStages, route_endpoints, timed_stage, untracked_paths
 )
-
-
-class ObservabilityMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, config: AppConfig):
-        super().__init__(app)
-        self.config = config
-        self.metrics = get_metrics() if config.observability.metrics else None
-
-    async def dispatch(self, request: Request, call_next):
-        # Skip metrics for health and metrics endpoints to reduce overhead
-        skip_metrics = request.url.path in ["/healthz", self.config.observability.metrics_endpoint]
-
-        # Set correlation ID if enabled
-        correlation_id = None
-        if self.config.observability.correlation_ids:
-            correlation_id = set_correlation_id()
-
-        start_time = time.perf_counter()
-
-        # Track active requests only if metrics enabled and not skipped
-        if self.metrics and not skip_metrics:
-            self.metrics.inc_active_requests()
-
-        # Log request start
-        if self.config.observability.structured_logging:
-            log_request(
-                method=request.method,
-                path=request.url.path,
-                correlation_id=correlation_id
-            )
-
-        try:
-            response = await call_next(request)
-            duration = time.perf_counter() - start_time
-
-            # Track metrics only if enabled and not skipped
-            if self.metrics and not skip_metrics:
-                self.metrics.track_request(request, response, duration)
-                self.metrics.dec_active_requests()
-
-            # Log response
-            if self.config.observability.structured_logging:
-                log_response(
-                    status_code=response.status_code,
-                    duration_ms=duration * 1000
-                )
-
-            return response
-
-        except Exception as e:
-            duration = time.perf_counter() - start_time
-
-            if self.metrics and not skip_metrics:
-                self.metrics.dec_active_requests()
-
-            if self.config.observability.structured_logging:
-                log_response(
-                    status_code=500,
-                    duration_ms=duration * 1000,
-                    error=str(e)
-                )
-            raise
+from .concurrency_limiter import AdaptiveLimit, AdmissionQueue, AsyncPredictionLimiter, PredictionSemaphore
+from .inference import InferenceExecutor, run_inference
+from .process_pool import ProcessPoolPredictor
+from .prediction_cache import PredictionCache
+from .prefork import process_memory
+from .batching import MicroBatcher
+from .hot_reload import ModelReloader
+from .profiler import StackSampler, collapsed_stacks, speedscope_profile
+from .startup import StartupTimings, timed
+from .warmup import WarmupState, warmup_payloads
+from . import codecs
+from .serialization import dumps as _dumps_json, to_jsonable as _to_jsonable
+from .codecs import BinaryRequest, UnsupportedMediaType
+from . import streaming
+from .logging_conf import log_prediction
 
 
 class PredictorWrapper:
-    def __init__(self, predictor: Any, thread_safe: bool = False):
+    def __init__(self, predictor: Any, thread_safe: bool = False, owned: bool = True):
         self._predictor = predictor
         self._lock = threading.Lock() if thread_safe else None
+        # A predictor handed in by the caller is closed by the caller, not by the app
+        self._owned = owned
 
     def predict(self, X):
         if self._lock:
@@ -124,13 +83,78 @@ class PredictorWrapper:
         return type(self._predictor).__name__
 
     def close(self):
-        if hasattr(self._predictor, "close"):
+        if self._owned and hasattr(self._predictor, "close"):
             try:
                 self._predictor.close()
             except Exception:
                 pass
 
 
+async def _read_predict_request(request: Request):
+    """Read the request body as a PredictRequest, or keep it raw for binary content types."""
+    started = time.perf_counter()
+    content_type = request.headers.get("content-type")
+    try:
+        body = await request.body()
+
+        if codecs.is_binary_content_type(content_type):
+            return BinaryRequest(body, content_type)
+
+        return PredictRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    finally:
+        # Picked up by the handler as the "parse" stage
+        request.state.parse_seconds = time.perf_counter() - started
+
+
+def _negotiate_response_type(accept: Optional[str]) -> str:
+    """Resolve the Accept header to a supported response media type (406 if its codec is missing)."""
+    response_type = codecs.negotiate_response_type(accept)
+    try:
+        codecs.ensure_codec_available(response_type)
+    except UnsupportedMediaType as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    return response_type
+
+
+def _encode_response(response, raw_values, response_type: str, duration_ms: float):
+    """Encode a prediction response in a binary format chosen by content negotiation."""
+    if response_type in codecs.ARRAY_MEDIA_TYPES:
+        content = codecs.encode_array(raw_values, response_type)
+        return Response(
+            content=content,
+            media_type=response_type,
+            headers={codecs.TIMING_HEADER: f"{duration_ms:.3f}"}
+        )
+
+    document = response.model_dump(mode="json") if isinstance(response, BaseModel) else _to_jsonable(response)
+    return Response(content=codecs.encode_document(document, response_type), media_type=response_type)
+
+
+# OpenAPI description of the request body, which is read manually to allow binary formats
+_PREDICT_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            codecs.JSON: {"schema": PredictRequest.model_json_schema()},
+            codecs.MSGPACK: {"schema": {"type": "string", "format": "binary"}},
+            codecs.NPY: {"schema": {"type": "string", "format": "binary"}},
+            codecs.ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+def _resolve_feature_order(config: AppConfig):
+    """Resolve feature_order, loading it from file if needed."""
+    return config.api.get_resolved_feature_order(
+        base_path=Path(config.project_path_internal) if config.project_path_internal else Path.cwd()
+    )
+
+
 def _prepare_input_data(req: PredictRequest, config: AppConfig):
     """Parse and prepare input data for prediction."""
     import logging
@@ -144,16 +168,26 @@ def _prepare_input_data(req: PredictRequest, config: AppConfig):
         logger.debug(f"Feature order: {config.api.feature_order}")
 
     try:
-        # Resolve feature_order from file if needed
-        feature_order = config.api.get_resolved_feature_order(
-            base_path=Path(config.project_path_internal) if config.project_path_internal else Path.cwd()
-        )
+        feature_order = _resolve_feature_order(config)
+
+        if isinstance(req, BinaryRequest):
+            return codecs.decode_binary_request(
+                req,
+                adapter=config.api.adapter,
+                feature_order=feature_order,
+                input_dtype=config.api.input_dtype,
+                feature_dtypes=config.api.feature_dtypes,
+            )
 
         return to_ndarray(
             req.payload,
             adapter=config.api.adapter,
             feature_order=feature_order,
+            input_dtype=config.api.input_dtype,
+            feature_dtypes=config.api.feature_dtypes,
         )
+    except UnsupportedMediaType as e:
+        raise HTTPException(status_code=415, detail=str(e))
     except Exception as e:
         # Log full traceback in DEBUG mode
         if logger.isEnabledFor(logging.DEBUG):
@@ -172,11 +206,12 @@ def _prepare_input_data(req: PredictRequest, config: AppConfig):
 
 
 def _track_prediction_metrics(endpoint_path: str, duration_seconds: float,
-                             sample_count: int, model_name: str, config: AppConfig) -> None:
+                             sample_count: int, model_name: str, config: AppConfig,
+                             metrics_getter: Optional[Callable] = None) -> None:
     """Track prediction metrics and logging."""
     # Track prediction metrics only if enabled
     if config.observability.metrics:
-        metrics = get_metrics()
+        metrics = (metrics_getter or get_metrics)()
         if metrics:
             metrics.track_prediction(endpoint_path, duration_seconds, sample_count)
 
@@ -189,55 +224,290 @@ def _track_prediction_metrics(endpoint_path: str, duration_seconds: float,
         )
 
 
+def _app_metrics_getter(app: FastAPI) -> Callable:
+    """Metrics collector source of an app (the process-wide collector unless create_app was given one)."""
+    return getattr(app.state, "metrics_getter", None) or get_metrics
+
+
+def _request_stages(request: Request) -> RequestStages:
+    """Start the stage breakdown of a prediction request with the time spent reading its body."""
+    stages = RequestStages()
+    stages.record("parse", getattr(request.state, "parse_seconds", 0.0))
+    return stages
+
+
+def _finish_stages(app: FastAPI, config: AppConfig, endpoint_path: str, stages: RequestStages,
+                   result: Any, response: Response) -> Any:
+    """Record the stage durations of a prediction request and add the Server-Timing header."""
+    if config.observability.metrics:
+        metrics = _app_metrics_getter(app)()
+        if metrics:
+            metrics.track_stages(endpoint_path, stages.durations)
+    if config.observability.server_timing:
+        # A returned Response is sent as is; otherwise FastAPI copies the headers of ``response``
+        target = result if isinstance(result, Response) else response
+        target.headers[SERVER_TIMING_HEADER] = stages.server_timing()
+    return result
+
+
+def _require_admin(config: AppConfig, authorization: Optional[str]) -> None:
+    """Reject admin requests without the configured bearer token."""
+    token = config.api.admin.token
+    if not token:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled: no admin token is configured.")
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(credentials.encode(), token.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token.", headers={"WWW-Authenticate": "Bearer"})
+
+
+def _request_priority(request: Request, config: AppConfig) -> int:
+    """Queue priority of a request (higher is served first with ordering: priority)."""
+    if config.api.queue.ordering != "priority":
+        return 0
+    try:
+        return int(request.headers.get(config.api.queue.priority_header, 0))
+    except ValueError:
+        return 0
+
+
 def _create_predict_handler(app: FastAPI, config: AppConfig, endpoint_path: str,
-                           prediction_limiter: Optional[PredictionSemaphore] = None):
+                           prediction_limiter: Optional[PredictionSemaphore] = None,
+                           admission_queue: Optional[AdmissionQueue] = None):
     """Create a predict endpoint handler with concurrency control."""
-    def predict(req: PredictRequest):
+    async def predict(request: Request, response: Response, req: Any = Depends(_read_predict_request),
+                      accept: Optional[str] = Header(None)):
+        response_type = _negotiate_response_type(accept)
+        executor = getattr(app.state, "inference_executor", None)
+        stages = _request_stages(request)
         # Use prediction limiter if configured
         if prediction_limiter:
-            with PredictionLimiter(prediction_limiter):
-                return _execute_prediction(app, config, endpoint_path, req)
+            priority = _request_priority(request, config) if admission_queue else 0
+            async with AsyncPredictionLimiter(prediction_limiter, queue=admission_queue, priority=priority):
+                result = await run_inference(
+                    executor, _execute_prediction, app, config, endpoint_path, req, response_type, stages
+                )
         else:
-            return _execute_prediction(app, config, endpoint_path, req)
+            result = await run_inference(
+                executor, _execute_prediction, app, config, endpoint_path, req, response_type, stages
+            )
+        return _finish_stages(app, config, endpoint_path, stages, result, response)
     return predict
 
 
-def _get_classifier_metadata(config: AppConfig, predictor_class_name: str = None, config_file_name: str = None) -> Optional[ClassifierMetadataResponse]:
+# OpenAPI description of the streaming request body
+_STREAM_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            streaming.NDJSON: {"schema": {"type": "string", "description": "One record or feature row per line"}},
+            codecs.ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+def _predict_stream_chunk(app: FastAPI, config: AppConfig, method: str, endpoint_path: str,
+                          decode, chunk, offset: int, encoder) -> tuple:
+    """Decode and predict one chunk of a streaming request.
+
+    ``decode`` yields the chunk as model input arrays of at most ``chunk_size``
+    rows each (an Arrow record batch may be larger and is sliced before it is
+    converted).
+
+    Returns:
+        Tuple of (list of encoded response pieces, number of rows scored)
+    """
+    slices = decode(
+        chunk,
+        feature_order=_resolve_feature_order(config),
+        input_dtype=config.api.input_dtype,
+        feature_dtypes=config.api.feature_dtypes,
+    )
+    key = "predictions" if method == "predict" else "probabilities"
+    pieces = []
+    start = 0
+    for rows in slices:
+        started = time.perf_counter()
+        values = _predict_rows(app, method, rows)
+        _track_prediction_metrics(
+            endpoint_path, time.perf_counter() - started, len(rows), app.state.predictor.name, config,
+            _app_metrics_getter(app)
+        )
+        if encoder is not None:
+            pieces.append(encoder.encode(values))
+        else:
+            pieces.append(_dumps_json({"offset": offset + start, key: values}) + b"\n")
+        start += len(rows)
+    return pieces, start
+
+
+async def _stream_predictions(app: FastAPI, config: AppConfig, method: str, endpoint_path: str,
+                              request: Request, request_type: str, response_type: str,
+                              prediction_limiter: Optional[PredictionSemaphore] = None,
+                              admission_queue: Optional[AdmissionQueue] = None, priority: int = 0):
+    """Read the request body incrementally and yield encoded predictions chunk by chunk."""
+    executor = getattr(app.state, "inference_executor", None)
+    settings = config.api.streaming
+    if request_type == streaming.NDJSON:
+        chunker = streaming.NDJSONChunker(settings.chunk_size, settings.max_message_bytes)
+
+        def decode(lines, **options):
+            # The chunker already cuts the body into chunk_size lines
+            return [streaming.decode_ndjson_chunk(lines, **options)]
+    else:
+        chunker = streaming.ArrowChunker(settings.max_message_bytes)
+
+        def decode(stream, **options):
+            return streaming.decode_arrow_chunk(stream, settings.chunk_size, **options)
+    encoder = streaming.ArrowStreamEncoder() if response_type == codecs.ARROW_STREAM else None
+    offset = 0
+    started = False
+
+    async def predict_chunk(chunk):
+        return await run_inference(
+            executor, _predict_stream_chunk, app, config, method, endpoint_path, decode, chunk, offset, encoder
+        )
+
+    async def score(chunk):
+        nonlocal offset
+        # A prediction slot is held while a chunk is scored, not while the next one is read
+        # from the network; a chunk's duration says nothing about per-request latency, so
+        # it is not fed to the estimates
+        if prediction_limiter:
+            async with AsyncPredictionLimiter(
+                prediction_limiter, queue=admission_queue, priority=priority, record_latency=False
+            ):
+                pieces, rows = await predict_chunk(chunk)
+        else:
+            pieces, rows = await predict_chunk(chunk)
+        offset += rows
+        return pieces
+
+    try:
+        async for data in request.stream():
+            for chunk in chunker.feed(data):
+                for piece in await score(chunk):
+                    started = True
+                    yield piece
+        for chunk in chunker.finish():
+            for piece in await score(chunk):
+                started = True
+                yield piece
+        if encoder is not None:
+            yield encoder.close()
+    except Exception as e:
+        import logging
+        logger = logging.getLogger(__name__)
+        status_code, headers = 500, None
+        if isinstance(e, AdapterError):
+            status_code = 413 if isinstance(e, streaming.MessageTooLarge) else 400
+            detail = f"Input parsing failed: {e}"
+            logger.error(f"Streaming input error at row {offset}: {e}")
+        elif isinstance(e, HTTPException):
+            # No prediction slot for the next chunk; the client can resume from ``offset``
+            status_code, detail, headers = e.status_code, e.detail, e.headers
+            logger.warning(f"Streaming prediction rejected at row {offset}: {e.detail}")
+        else:
+            detail = "Prediction failed. Please contact support if the issue persists."
+            logger.error(f"Streaming prediction error at row {offset}: {e}", exc_info=True)
+        if not started:
+            # Nothing has been sent yet, so the response still gets a proper status
+            raise HTTPException(status_code=status_code, detail=detail, headers=headers)
+        if encoder is not None:
+            raise
+        # The response has already started, so the error goes into the stream
+        yield _dumps_json({"offset": offset, "error": detail}) + b"\n"
+
+
+def _create_stream_handler(app: FastAPI, config: AppConfig, method: str, endpoint_path: str,
+                           prediction_limiter: Optional[PredictionSemaphore] = None,
+                           admission_queue: Optional[AdmissionQueue] = None):
+    """Create a streaming endpoint handler for ``method`` (predict or predict_proba)."""
+    async def predict_stream(request: Request, accept: Optional[str] = Header(None)):
+        request_type = codecs._media_type(request.headers.get("content-type"))
+        if request_type not in streaming.STREAM_REQUEST_TYPES:
+            raise HTTPException(
+                status_code=415,
+                detail=f"Streaming requests must be {' or '.join(streaming.STREAM_REQUEST_TYPES)}"
+            )
+        try:
+            codecs.ensure_codec_available(request_type)
+        except UnsupportedMediaType as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        try:
+            response_type = streaming.negotiate_stream_response_type(accept)
+        except UnsupportedMediaType as e:
+            raise HTTPException(status_code=406, detail=str(e))
+
+        # Slots are taken per chunk by the body generator. Without a queue, a server that is
+        # busy right now answers 503 before the stream starts rather than in its first line
+        priority = _request_priority(request, config) if admission_queue else 0
+        if prediction_limiter and admission_queue is None:
+            async with AsyncPredictionLimiter(prediction_limiter, record_latency=False):
+                pass
+
+        return streaming.DuplexStreamingResponse(
+            _stream_predictions(
+                app, config, method, endpoint_path, request, request_type, response_type,
+                prediction_limiter, admission_queue, priority
+            ),
+            media_type=response_type
+        )
+    return predict_stream
+
+
+def _get_classifier_metadata(config: AppConfig, predictor_class_name: str = None, config_file_name: str = None,
+                             snapshot: Optional[MetadataSnapshot] = None) -> Optional[ClassifierMetadataResponse]:
     """Get simplified classifier metadata for response."""
     if not config.classifier:
         return None
 
-    # Use auto-detection for git info
-    from .auto_detect import get_git_info, get_project_name, get_mlserver_git_info
-    import os
-
-    git_data = get_git_info(config.project_path or ".")
-    mlserver_info = get_mlserver_git_info()
+    # Use auto-detection for git info unless it was captured already
+    snapshot = snapshot or capture_metadata(config.project_path or ".")
+    git_data = snapshot.git
+    mlserver_info = snapshot.mlserver
 
     # Get config_file from environment if not provided (for containerized deployments)
     if not config_file_name:
         config_file_name = os.environ.get('MLSERVER_CONFIG_FILE')
 
-    metadata = ClassifierMetadataResponse(
-        project=git_data.get("repository") or get_project_name(config.project_path or "."),
+    return ClassifierMetadataResponse(
+        project=snapshot.project,
         classifier=config.classifier.get('name', 'unknown'),
         predictor_class=predictor_class_name,
         predictor_module=config.predictor.module if config.predictor else None,
         config_file=config_file_name,
         git_commit=git_data.get("commit"),
         git_tag=git_data.get("tag"),
-        deployed_at=None,  # Will be set at runtime
+        deployed_at=snapshot.deployed_at,
         mlserver_version=mlserver_info.get("package_version", "unknown"),
         mlserver_api_commit=mlserver_info.get("api_commit"),
         mlserver_api_tag=mlserver_info.get("api_tag")
     )
 
-    # Note: deployed_at will be added at runtime from app.state.deployed_at
-
-    return metadata
 
-
-def _format_response(predictions, config: AppConfig, timing_ms: float, model_name: str, metadata=None):
+def _info_response(config: AppConfig, predictor_name: str, snapshot: MetadataSnapshot) -> Dict[str, Any]:
+    """Build the /info document from captured metadata."""
+    info_response = get_simplified_info_response(
+        config.model_dump(),
+        predictor_name,
+        config.project_path or ".",
+        snapshot=snapshot
+    )
+    # Keep the endpoints section consistent
+    info_response["endpoints"] = {
+        "predict": "/predict" if config.is_endpoint_enabled("predict") else None,
+        "predict_proba": "/predict_proba" if config.is_endpoint_enabled("predict_proba") else None,
+        "info": "/info",
+        "health": "/healthz",
+        "ready": "/readyz",
+        "metrics": config.observability.metrics_endpoint if config.observability.metrics else None
+    }
+    return info_response
+
+
+def _format_response(predictions, config: AppConfig, timing_ms: float, model_name: str, metadata=None,
+                     stages: Optional[RequestStages] = None):
     """Format response based on configuration.
 
     Args:
@@ -246,21 +516,59 @@ def _format_response(predictions, config: AppConfig, timing_ms: float, model_nam
         timing_ms: Time taken for prediction in milliseconds
         model_name: Name of the predictor/model
         metadata: Optional classifier metadata
+        stages: Stage breakdown of the request ("format" and "validate" are recorded)
 
     Returns:
         Formatted response based on response_format configuration
     """
-    response_format = config.api.response_format
-
     # Passthrough format - return exactly what predictor returned
-    if response_format == 'passthrough':
+    if config.api.response_format == 'passthrough':
         return predictions
 
     # Convert to JSON-serializable format
-    json_safe = _to_jsonable(predictions)
+    with timed_stage(stages, "format"):
+        json_safe = _to_jsonable(predictions)
+        response_model, fields = _response_fields(json_safe, config)
+
+    with timed_stage(stages, "validate"):
+        return response_model(
+            **fields,
+            time_ms=timing_ms,
+            predictor_class=model_name,
+            metadata=metadata
+        )
+
+
+def _format_response_document(predictions, config: AppConfig, timing_ms: float, metadata=None):
+    """Build the response document as a plain dict, without constructing the Pydantic model.
+
+    Used when ``response_validation`` is disabled. Prediction arrays are left as
+    ndarrays so that the JSON encoder can serialize them in bulk.
+    """
+    if config.api.response_format == 'passthrough':
+        return predictions
+
+    if isinstance(predictions, np.ndarray) and predictions.ndim > 0:
+        values = predictions
+    else:
+        values = _to_jsonable(predictions)
+
+    _, document = _response_fields(values, config)
+    document["time_ms"] = timing_ms
+    document["metadata"] = metadata.model_dump(mode="json") if metadata is not None else None
+    return document
+
+
+def _response_fields(json_safe, config: AppConfig):
+    """Shape converted predictions into the fields of the configured response model.
+
+    Returns:
+        Tuple of (response model class, field dict without timing and metadata)
+    """
+    is_list = isinstance(json_safe, (list, np.ndarray))
 
     # Custom format - flexible structure with result field
-    if response_format == 'custom':
+    if config.api.response_format == 'custom':
         # For dictionaries, include the whole structure
         if isinstance(json_safe, dict):
             # Extract predictions if configured or if the dict contains a 'predictions' key
@@ -270,24 +578,13 @@ def _format_response(predictions, config: AppConfig, timing_ms: float, model_nam
             elif 'predictions' in json_safe:
                 # Use the predictions field if it exists in the response
                 predictions_list = json_safe['predictions'] if isinstance(json_safe['predictions'], list) else [json_safe['predictions']]
+            return CustomPredictResponse, {"result": json_safe, "predictions": predictions_list}
 
-            response = CustomPredictResponse(
-                result=json_safe,
-                predictions=predictions_list,
-                time_ms=timing_ms,
-                predictor_class=model_name,
-                metadata=metadata
-            )
-            return response
-        else:
-            # For non-dict responses, wrap in result field
-            return CustomPredictResponse(
-                result=json_safe,
-                predictions=json_safe if isinstance(json_safe, list) else [json_safe],
-                time_ms=timing_ms,
-                predictor_class=model_name,
-                metadata=metadata
-            )
+        # For non-dict responses, wrap in result field
+        return CustomPredictResponse, {
+            "result": json_safe,
+            "predictions": json_safe if is_list else [json_safe],
+        }
 
     # Standard format (default) - backward compatible
     # Special handling for dict responses
@@ -300,40 +597,91 @@ def _format_response(predictions, config: AppConfig, timing_ms: float, model_nam
         else:
             # Use the dict as a single prediction item
             predictions_list = [json_safe]
-
-        return PredictResponse(
-            predictions=predictions_list,
-            time_ms=timing_ms,
-            predictor_class=model_name,
-            metadata=metadata
-        )
+        return PredictResponse, {"predictions": predictions_list}
 
     # Standard format for list/array responses
-    if isinstance(json_safe, list):
-        return PredictResponse(
-            predictions=json_safe,
-            time_ms=timing_ms,
-            predictor_class=model_name,
-            metadata=metadata
-        )
+    if is_list:
+        return PredictResponse, {"predictions": json_safe}
 
     # Single value response - wrap in list for consistency
-    return PredictResponse(
-        predictions=[json_safe],
-        time_ms=timing_ms,
-        predictor_class=model_name,
-        metadata=metadata
-    )
+    return PredictResponse, {"predictions": [json_safe]}
+
+
+def _json_response(document) -> Response:
+    """Return a pre-encoded JSON response, bypassing FastAPI's response model serialization."""
+    return Response(content=_dumps_json(document), media_type=codecs.JSON)
 
 
-def _execute_prediction(app: FastAPI, config: AppConfig, endpoint_path: str, req: PredictRequest):
+def _call_predictor(app: FastAPI, method: str, X):
+    """Run a predictor method, going through the micro-batcher when one is active."""
+    batcher = getattr(app.state, "batcher", None)
+    if batcher is not None:
+        return batcher.submit(method, X)
+    return getattr(app.state.predictor, method)(X)
+
+
+def _predict_rows(app: FastAPI, method: str, X):
+    """Run a predictor method on the current model, holding it until the call returns."""
+    reloader = getattr(app.state, "reloader", None)
+    if reloader is None:
+        return _predict_cached(app, method, X)
+    # A hot reload closes the previous model only after its leases are returned
+    with reloader.generations.lease():
+        return _predict_cached(app, method, X)
+
+
+def _predict_cached(app: FastAPI, method: str, X):
+    """Run a predictor method through the prediction cache when one is active."""
+    cache = getattr(app.state, "prediction_cache", None)
+    if cache is None:
+        return _call_predictor(app, method, X)
+    return cache.predict(method, X, lambda rows: _call_predictor(app, method, rows))
+
+
+def _warmup_prediction(app: FastAPI, config: AppConfig, payload: Dict[str, Any], method: str) -> None:
+    """Run one warm-up payload through the request path, bypassing metrics and the prediction cache."""
+    X = _prepare_input_data(PredictRequest(payload=payload), config)
+    try:
+        predictions = _call_predictor(app, method, X)
+    except AttributeError:
+        if method == "predict_proba":
+            return  # Predictor without probabilities: /predict_proba answers 501
+        raise
+
+    metadata = getattr(app.state, "metadata", None)
+    if method == "predict_proba":
+        from .schemas import ProbaResponse
+        document = ProbaResponse(probabilities=_tolist2d(predictions), time_ms=0.0, metadata=metadata)
+    elif config.api.response_validation:
+        document = _format_response(predictions, config, 0.0, app.state.predictor.name, metadata)
+    else:
+        document = _format_response_document(predictions, config, 0.0, metadata)
+    if isinstance(document, BaseModel):
+        document = document.model_dump(mode="json")
+    _dumps_json(document)
+
+
+def _model_identity(metadata, predictor_name: str) -> str:
+    """Identity of the loaded model, mixed into prediction cache keys."""
+    if metadata is None:
+        return predictor_name
+    return "|".join(str(part) for part in (
+        metadata.classifier, metadata.predictor_module, metadata.predictor_class,
+        metadata.git_commit, metadata.git_tag, predictor_name
+    ))
+
+
+def _execute_prediction(app: FastAPI, config: AppConfig, endpoint_path: str, req: PredictRequest,
+                        response_type: str = codecs.JSON, stages: Optional[RequestStages] = None):
     """Execute the actual prediction."""
     start_time = time.perf_counter()
 
-    X = _prepare_input_data(req, config)
+    with timed_stage(stages, "adapt"):
+        X = _prepare_input_data(req, config)
 
     try:
-        predictions = app.state.predictor.predict(X)
+        with timed_stage(stages, "predict"):
+            predictions = _predict_rows(app, "predict", X)
     except Exception as e:
         # Log full error internally, return sanitized message to client
         import logging
@@ -352,49 +700,74 @@ def _execute_prediction(app: FastAPI, config: AppConfig, endpoint_path: str, req
 
     _track_prediction_metrics(
         endpoint_path, duration_ms / 1000, num_predictions,
-        app.state.predictor.name, config
+        app.state.predictor.name, config, _app_metrics_getter(app)
     )
 
     # Include cached metadata if available
     metadata = getattr(app.state, 'metadata', None)
 
-    # Add deployed_at timestamp to metadata
-    if metadata:
-        deployed_at = getattr(app.state, 'deployed_at', None)
-        if deployed_at:
-            metadata.deployed_at = deployed_at
+    # Array formats encode the raw predictions directly, skipping JSON conversion
+    if response_type in codecs.ARRAY_MEDIA_TYPES:
+        with timed_stage(stages, "encode"):
+            return _encode_response(None, predictions, response_type, duration_ms)
+
+    if response_type == codecs.JSON and not config.api.response_validation:
+        with timed_stage(stages, "format"):
+            document = _format_response_document(predictions, config, duration_ms, metadata)
+        with timed_stage(stages, "encode"):
+            return _json_response(document)
 
     # Use the new formatting function
-    return _format_response(
+    response = _format_response(
         predictions,
         config,
         duration_ms,
         app.state.predictor.name,
-        metadata
+        metadata,
+        stages
     )
 
+    if response_type != codecs.JSON:
+        with timed_stage(stages, "encode"):
+            return _encode_response(response, predictions, response_type, duration_ms)
+    return response
+
 
 def _create_predict_proba_handler(app: FastAPI, config: AppConfig, endpoint_path: str,
-                                 prediction_limiter: Optional[PredictionSemaphore] = None):
+                                 prediction_limiter: Optional[PredictionSemaphore] = None,
+                                 admission_queue: Optional[AdmissionQueue] = None):
     """Create a predict_proba endpoint handler with concurrency control."""
-    def predict_proba(req: PredictRequest):
+    async def predict_proba(request: Request, response: Response, req: Any = Depends(_read_predict_request),
+                            accept: Optional[str] = Header(None)):
+        response_type = _negotiate_response_type(accept)
+        executor = getattr(app.state, "inference_executor", None)
+        stages = _request_stages(request)
         # Use prediction limiter if configured
         if prediction_limiter:
-            with PredictionLimiter(prediction_limiter):
-                return _execute_predict_proba(app, config, endpoint_path, req)
+            priority = _request_priority(request, config) if admission_queue else 0
+            async with AsyncPredictionLimiter(prediction_limiter, queue=admission_queue, priority=priority):
+                result = await run_inference(
+                    executor, _execute_predict_proba, app, config, endpoint_path, req, response_type, stages
+                )
         else:
-            return _execute_predict_proba(app, config, endpoint_path, req)
+            result = await run_inference(
+                executor, _execute_predict_proba, app, config, endpoint_path, req, response_type, stages
+            )
+        return _finish_stages(app, config, endpoint_path, stages, result, response)
     return predict_proba
 
 
-def _execute_predict_proba(app: FastAPI, config: AppConfig, endpoint_path: str, req: PredictRequest):
+def _execute_predict_proba(app: FastAPI, config: AppConfig, endpoint_path: str, req: PredictRequest,
+                           response_type: str = codecs.JSON, stages: Optional[RequestStages] = None):
     """Execute the actual probability prediction."""
     start_time = time.perf_counter()
 
-    X = _prepare_input_data(req, config)
+    with timed_stage(stages, "adapt"):
+        X = _prepare_input_data(req, config)
 
     try:
-        probabilities = app.state.predictor.predict_proba(X)
+        with timed_stage(stages, "predict"):
+            probabilities = _predict_rows(app, "predict_proba", X)
     except AttributeError:
         raise HTTPException(status_code=501, detail="Probability prediction not available for this model.")
     except Exception as e:
@@ -407,26 +780,43 @@ def _execute_predict_proba(app: FastAPI, config: AppConfig, endpoint_path: str,
 
     _track_prediction_metrics(
         endpoint_path, duration_ms / 1000, len(probabilities),
-        app.state.predictor.name, config
+        app.state.predictor.name, config, _app_metrics_getter(app)
     )
 
     # Include cached metadata if available
     metadata = getattr(app.state, 'metadata', None)
 
-    # Add deployed_at timestamp to metadata
-    if metadata:
-        deployed_at = getattr(app.state, 'deployed_at', None)
-        if deployed_at:
-            metadata.deployed_at = deployed_at
+    if response_type in codecs.ARRAY_MEDIA_TYPES:
+        with timed_stage(stages, "encode"):
+            return _encode_response(None, probabilities, response_type, duration_ms)
+
+    if response_type == codecs.JSON and not config.api.response_validation:
+        with timed_stage(stages, "format"):
+            document = {
+                "probabilities": probabilities,
+                "time_ms": duration_ms,
+                "classes": None,
+                "metadata": metadata.model_dump(mode="json") if metadata is not None else None,
+            }
+        with timed_stage(stages, "encode"):
+            return _json_response(document)
 
     # Create ProbaResponse with metadata
     from .schemas import ProbaResponse
-    return ProbaResponse(
-        probabilities=_tolist2d(probabilities),
-        time_ms=duration_ms,
-        classes=None,  # Could be populated if predictor provides class names
-        metadata=metadata
-    )
+    with timed_stage(stages, "format"):
+        rows = _tolist2d(probabilities)
+    with timed_stage(stages, "validate"):
+        response = ProbaResponse(
+            probabilities=rows,
+            time_ms=duration_ms,
+            classes=None,  # Could be populated if predictor provides class names
+            metadata=metadata
+        )
+
+    if response_type != codecs.JSON:
+        with timed_stage(stages, "encode"):
+            return _encode_response(response, probabilities, response_type, duration_ms)
+    return response
 
 
 def _register_endpoint(app: FastAPI, endpoint_name: str, handler,
@@ -436,20 +826,21 @@ def _register_endpoint(app: FastAPI, endpoint_name: str, handler,
     if base_path:
         versioned_path = f"{base_path}/{endpoint_name}"
         if response_model:
-            app.post(versioned_path, response_model=response_model)(handler)
+            app.post(versioned_path, response_model=response_model, openapi_extra=_PREDICT_OPENAPI_EXTRA)(handler)
         else:
-            app.post(versioned_path)(handler)
+            app.post(versioned_path, openapi_extra=_PREDICT_OPENAPI_EXTRA)(handler)
     else:
         # Fallback to root level if no base path (should not happen in modern config)
         fallback_path = f"/{endpoint_name}"
         if response_model:
-            app.post(fallback_path, response_model=response_model)(handler)
+            app.post(fallback_path, response_model=response_model, openapi_extra=_PREDICT_OPENAPI_EXTRA)(handler)
         else:
-            app.post(fallback_path)(handler)
+            app.post(fallback_path, openapi_extra=_PREDICT_OPENAPI_EXTRA)(handler)
 
 
 def _register_prediction_endpoints(app: FastAPI, config: AppConfig,
-                                  prediction_limiter: Optional[PredictionSemaphore] = None) -> None:
+                                  prediction_limiter: Optional[PredictionSemaphore] = None,
+                                  admission_queue: Optional[AdmissionQueue] = None) -> None:
     """Register versioned prediction endpoints with optional concurrency control."""
     base_path = config.get_base_path()
 
@@ -465,7 +856,7 @@ def _register_prediction_endpoints(app: FastAPI, config: AppConfig,
     # Register predict endpoint
     if config.is_endpoint_enabled("predict"):
         endpoint_path = f"{base_path}/predict" if base_path else "/predict"
-        predict_handler = _create_predict_handler(app, config, endpoint_path, prediction_limiter)
+        predict_handler = _create_predict_handler(app, config, endpoint_path, prediction_limiter, admission_queue)
         _register_endpoint(
             app, "predict", predict_handler, base_path, response_model
         )
@@ -475,51 +866,252 @@ def _register_prediction_endpoints(app: FastAPI, config: AppConfig,
     # Register predict_proba endpoint
     if config.is_endpoint_enabled("predict_proba"):
         endpoint_path = f"{base_path}/predict_proba" if base_path else "/predict_proba"
-        predict_proba_handler = _create_predict_proba_handler(app, config, endpoint_path, prediction_limiter)
+        predict_proba_handler = _create_predict_proba_handler(app, config, endpoint_path, prediction_limiter, admission_queue)
         _register_endpoint(
             app, "predict_proba", predict_proba_handler, base_path
         )
 
+    # Register streaming endpoints for very large inputs
+    if config.api.streaming.enabled:
+        for method in ("predict", "predict_proba"):
+            if config.is_endpoint_enabled(method):
+                endpoint_path = f"{base_path}/{method}/stream" if base_path else f"/{method}/stream"
+                stream_handler = _create_stream_handler(
+                    app, config, method, endpoint_path, prediction_limiter, admission_queue
+                )
+                app.post(endpoint_path, openapi_extra=_STREAM_OPENAPI_EXTRA)(stream_handler)
+
+
+def _load_predictor_wrapper(config: AppConfig, inference_workers: int, preloaded_predictor: Any = None,
+                            timings: Optional[StartupTimings] = None):
+    """Load the configured predictor behind the interface the request path uses."""
+    # Pass config_dir for intelligent module resolution
+    config_dir = config.project_path if config.project_path else None
+    if preloaded_predictor is not None:
+        return PredictorWrapper(preloaded_predictor, thread_safe=config.api.thread_safe_predict, owned=False)
+    if config.api.inference_backend == "process":
+        # Each worker process loads its own predictor instance
+        with timed(timings, "process_pool"):
+            return ProcessPoolPredictor(
+                config.predictor.module,
+                config.predictor.class_name,
+                config.predictor.init_kwargs,
+                config_dir=config_dir,
+                workers=inference_workers,
+                artifacts=config.predictor.artifacts
+            )
+    predictor = load_predictor(
+        config.predictor.module,
+        config.predictor.class_name,
+        config.predictor.init_kwargs,
+        config_dir=config_dir,
+        artifacts=config.predictor.artifacts,
+        timings=timings
+    )
+    return PredictorWrapper(predictor, thread_safe=config.api.thread_safe_predict)
+
 
-def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
-    predictor_wrapper: Optional[PredictorWrapper] = None
+def _collect_metadata(config: AppConfig, timings: Optional[StartupTimings] = None) -> MetadataSnapshot:
+    """Capture the git and deployment metadata of the project (runs while the predictor loads)."""
+    with timed(timings, "metadata"):
+        return capture_metadata(config.project_path or ".")
 
-    @asynccontextmanager
-    async def lifespan(app: FastAPI):
-        nonlocal predictor_wrapper
-        # Load predictor once at startup
-        # Pass config_dir for intelligent module resolution
-        config_dir = config.project_path if config.project_path else None
-        predictor = load_predictor(
-            config.predictor.module,
-            config.predictor.class_name,
-            config.predictor.init_kwargs,
-            config_dir=config_dir
+
+def _build_model_state(config: AppConfig, predictor_wrapper, snapshot: MetadataSnapshot,
+                       config_file_name: Optional[str], metrics_getter: Optional[Callable]) -> Dict[str, Any]:
+    """Build the per-model components around a loaded predictor.
+
+    Metadata is derived from ``snapshot`` once here; request handlers only read it.
+
+    Returns:
+        Mapping of app.state attribute -> value (predictor, metadata, info,
+        deployed_at, batcher, prediction_cache)
+    """
+    predictor_class_name = config.predictor.class_name if config.predictor else None
+    metadata = _get_classifier_metadata(config, predictor_class_name, config_file_name, snapshot)
+
+    # Start the micro-batcher if enabled
+    batcher = None
+    if config.api.batching.enabled:
+        batcher = MicroBatcher(
+            predictor_wrapper,
+            max_batch_size=config.api.batching.max_batch_size,
+            max_wait_ms=config.api.batching.max_wait_ms,
+            metrics_getter=metrics_getter
         )
-        predictor_wrapper = PredictorWrapper(
-            predictor, thread_safe=config.api.thread_safe_predict
+
+    # Row-level prediction cache, keyed by input row and model identity
+    prediction_cache = None
+    if config.api.cache.enabled:
+        prediction_cache = PredictionCache(
+            max_entries=config.api.cache.max_entries,
+            max_memory_mb=config.api.cache.max_memory_mb,
+            ttl_seconds=config.api.cache.ttl_seconds,
+            model_identity=_model_identity(metadata, predictor_wrapper.name),
+            metrics_getter=metrics_getter
         )
-        app.state.predictor = predictor_wrapper
 
-        # Cache metadata at startup
-        predictor_class_name = config.predictor.class_name if config.predictor else None
-        app.state.metadata = _get_classifier_metadata(config, predictor_class_name, config_file_name)
+    return {
+        "predictor": predictor_wrapper,
+        "metadata": metadata,
+        "info": _info_response(config, predictor_wrapper.name, snapshot),
+        "deployed_at": snapshot.deployed_at,
+        "batcher": batcher,
+        "prediction_cache": prediction_cache,
+    }
+
+
+_MODEL_STATE_KEYS = ("predictor", "metadata", "info", "deployed_at", "batcher", "prediction_cache")
+
+
+def _install_model_state(app: FastAPI, state: Dict[str, Any]) -> None:
+    for key in _MODEL_STATE_KEYS:
+        setattr(app.state, key, state[key])
+
+
+def _current_model_state(app: FastAPI) -> Dict[str, Any]:
+    return {key: getattr(app.state, key) for key in _MODEL_STATE_KEYS}
 
-        # Cache deployment timestamp at startup
-        app.state.deployed_at = get_deployed_timestamp()
+
+def _close_model_state(state: Dict[str, Any]) -> None:
+    if state["batcher"] is not None:
+        state["batcher"].close()
+    state["predictor"].close()
+
+
+def create_app(config: AppConfig, config_file_name: str = None, preloaded_predictor: Any = None,
+               metrics_getter: Optional[Callable] = None,
+               startup_timings: Optional[StartupTimings] = None) -> FastAPI:
+    """Create the FastAPI application.
+
+    Args:
+        config: Application configuration
+        config_file_name: Name of the configuration file (reported in metadata)
+        preloaded_predictor: Predictor instance loaded ahead of time (e.g. before
+            forking workers); when given, the lifespan does not load the predictor,
+            ``api.inference_backend: process`` is not applied (it is called on the
+            inference threads), and the app does not close it on shutdown
+        metrics_getter: Returns the metrics collector used by this app; when given,
+            the lifespan does not create the process-wide collector (multi-model
+            serving passes a collector bound to the classifier name)
+        startup_timings: Startup phases recorded before the app was created
+            (e.g. config parsing); the lifespan adds its own phases
+    """
+    timings = startup_timings or StartupTimings()
+    owns_metrics = metrics_getter is None
+    metrics_getter = metrics_getter or get_metrics
+    component_metrics = metrics_getter if config.observability.metrics else None
+    inference_workers = config.api.inference_workers or (
+        config.api.adaptive_concurrency.max_limit if config.api.adaptive_concurrency.enabled
+        else config.api.max_concurrent_predictions
+    )
+
+    def build_model_state(predictor: Any = None, timings: Optional[StartupTimings] = None) -> Dict[str, Any]:
+        # Metadata lookups (git) run while the predictor loads
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlserver-metadata") as pool:
+            snapshot = pool.submit(_collect_metadata, config, timings)
+            predictor_wrapper = _load_predictor_wrapper(config, inference_workers, predictor, timings)
+            return _build_model_state(config, predictor_wrapper, snapshot.result(), config_file_name,
+                                      component_metrics)
+
+    async def _warmup_predict(payload: Dict[str, Any], method: str) -> None:
+        # The server already accepts requests, so warm-up takes a prediction slot and runs
+        # on the inference threads like they do. It waits for a free slot instead of being
+        # rejected (and does not queue behind requests in the admission queue)
+        executor = app.state.inference_executor
+        if prediction_limiter is None:
+            await run_inference(executor, _warmup_prediction, app, config, payload, method)
+            return
+        while not prediction_limiter.acquire_nowait():
+            await asyncio.sleep(0.01)
+        try:
+            await run_inference(executor, _warmup_prediction, app, config, payload, method)
+        finally:
+            if admission_queue is not None:
+                admission_queue.release()
+            else:
+                prediction_limiter.release()
+
+    async def _warm_up(warmup: WarmupState) -> None:
+        await warmup.run(
+            lambda: warmup_payloads(config, _resolve_feature_order(config)),
+            [method for method in ("predict", "predict_proba") if config.is_endpoint_enabled(method)],
+            _warmup_predict
+        )
+        timings.record("warmup", warmup.duration_seconds or 0.0)
+        if warmup.ready:
+            timings.ready()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Load predictor once at startup, unless the model state was built ahead
+        # of the lifespan (multi-model serving builds it off the event loop)
+        model_state = getattr(app.state, "prebuilt_model_state", None)
+        app.state.prebuilt_model_state = None
+        if model_state is None:
+            model_state = build_model_state(preloaded_predictor, timings)
+        _install_model_state(app, model_state)
+        predictor_wrapper = model_state["predictor"]
 
         # Initialize metrics if enabled
         if config.observability.metrics:
-            init_metrics(predictor_wrapper.name)
+            metrics = init_metrics(predictor_wrapper.name) if owns_metrics else metrics_getter()
+            if metrics is not None and prediction_limiter:
+                metrics.set_concurrency_limit(prediction_limiter.limit)
+            if metrics is not None:
+                metrics.bind_endpoints(route_endpoints(app.routes, untracked_paths(config)))
+
+        # Hot reload replaces the state above without restarting
+        reloader = None
+        if config.api.reload.enabled:
+            reloader = ModelReloader(
+                config,
+                build=build_model_state,
+                install=lambda state: _install_model_state(app, state),
+                close=_close_model_state,
+                state=model_state,
+                metrics_getter=component_metrics,
+                feature_order=_resolve_feature_order(config)
+            )
+            if config.api.reload.watch:
+                reloader.start_watching()
+        app.state.reloader = reloader
+
+        # Inference runs on its own threads so control endpoints never wait behind it
+        inference_executor = InferenceExecutor(max_workers=inference_workers)
+        app.state.inference_executor = inference_executor
+
+        # Warm up in the background: /healthz answers meanwhile, /readyz once it is done
+        warmup = WarmupState(config.api.warmup)
+        app.state.warmup = warmup
+        app.state.startup_timings = timings
+        timings.started()
+        warmup_task = None
+        if config.api.warmup.enabled:
+            warmup_task = asyncio.create_task(_warm_up(warmup))
+        else:
+            timings.ready()
 
         yield
         # Shutdown
-        predictor_wrapper.close()
+        if warmup_task is not None:
+            await warmup_task
+        warmup.status = "stopping"
+        if reloader is not None:
+            await reloader.stop()
+        inference_executor.shutdown()
+        _close_model_state(_current_model_state(app))
+        if owns_metrics:
+            mark_worker_dead(os.getpid())
 
     app = FastAPI(title=config.get_api_title(), lifespan=lifespan)
+    app.state.metrics_getter = metrics_getter
+    # Blocking part of the startup (predictor load, metadata capture); its result may be
+    # set as app.state.prebuilt_model_state before entering the lifespan
+    app.state.build_model_state = build_model_state
 
     # Add observability middleware
-    app.add_middleware(ObservabilityMiddleware, config=config)
+    app.add_middleware(RequestObservabilityMiddleware, config=config, metrics_getter=metrics_getter)
 
     # CORS
     if config.server.cors:
@@ -535,9 +1127,35 @@ def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
     # Create prediction limiter if concurrency control is enabled
     prediction_limiter = None
     if config.api.max_concurrent_predictions > 0:
+        adaptive_limit = None
+        adaptive_config = config.api.adaptive_concurrency
+        if adaptive_config.enabled:
+            adaptive_limit = AdaptiveLimit(
+                initial_limit=config.api.max_concurrent_predictions,
+                min_limit=adaptive_config.min_limit,
+                max_limit=adaptive_config.max_limit,
+                algorithm=adaptive_config.algorithm,
+                tolerance=adaptive_config.tolerance,
+                smoothing=adaptive_config.smoothing,
+                metrics_getter=component_metrics
+            )
         prediction_limiter = PredictionSemaphore(
             max_concurrent=config.api.max_concurrent_predictions,
-            timeout=0  # Immediate rejection for Kubernetes pod scaling
+            timeout=0,  # Immediate rejection for Kubernetes pod scaling
+            adaptive=adaptive_limit
+        )
+
+    # Optionally let busy requests wait for a slot instead of failing fast
+    admission_queue = None
+    if prediction_limiter and config.api.queue.enabled:
+        queue_config = config.api.queue
+        admission_queue = AdmissionQueue(
+            prediction_limiter,
+            max_depth=queue_config.max_depth,
+            timeout=queue_config.timeout_seconds,
+            ordering=queue_config.ordering,
+            max_estimated_wait=queue_config.max_estimated_wait_seconds,
+            metrics_getter=component_metrics
         )
 
     @app.get("/healthz", response_model=HealthResponse)
@@ -545,51 +1163,112 @@ def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
         predictor = getattr(app.state, "predictor", None)
         return HealthResponse(status="ok", model=predictor.name if predictor else None)
 
+    @app.get("/readyz")
+    def readiness():
+        """Readiness probe: 200 once the model is loaded and warmed up, 503 before."""
+        warmup = getattr(app.state, "warmup", None)
+        if warmup is None or not warmup.ready:
+            return JSONResponse(
+                status_code=503,
+                content={"status": "not_ready", "warmup": warmup.as_dict() if warmup else None}
+            )
+        return {"status": "ready", "warmup": warmup.as_dict()}
+
     @app.get("/info")
     def info():
         """Get simplified classifier information with auto-detected metadata."""
-        predictor = getattr(app.state, "predictor", None)
-        deployed_at = getattr(app.state, 'deployed_at', None)
-
-        # Use the new simplified info response
-        info_response = get_simplified_info_response(
-            config.model_dump(),
-            predictor.name if predictor else "unknown",
-            config.project_path or "."
-        )
-
-        # Use the cached deployed_at timestamp from startup
-        if deployed_at:
-            info_response["deployed_at"] = deployed_at
-
-        # Keep the endpoints section consistent
-        info_response["endpoints"] = {
-            "predict": "/predict" if config.is_endpoint_enabled("predict") else None,
-            "predict_proba": "/predict_proba" if config.is_endpoint_enabled("predict_proba") else None,
-            "info": "/info",
-            "health": "/healthz",
-            "metrics": config.observability.metrics_endpoint if config.observability.metrics else None
-        }
+        # Captured when the model was loaded: no git or package lookups per request
+        info_response = getattr(app.state, "info", None)
+        if info_response is None:
+            predictor = getattr(app.state, "predictor", None)
+            info_response = _info_response(
+                config, predictor.name if predictor else "unknown", capture_metadata(config.project_path or ".")
+            )
 
-        return info_response
+        startup_timings = getattr(app.state, "startup_timings", None)
+        if startup_timings is not None:
+            info_response = {**info_response, "startup": startup_timings.as_dict()}
+        return _json_response(info_response)
 
     @app.get("/status")
     def prediction_status():
         """Get current prediction availability status."""
         if prediction_limiter:
-            return {
+            status = {
                 "prediction_slots_available": prediction_limiter.is_available,
                 "active_predictions": prediction_limiter.active_predictions,
                 "max_concurrent_predictions": config.api.max_concurrent_predictions,
+                "concurrency_limit": prediction_limiter.limit,
+                "adaptive_concurrency": prediction_limiter.adaptive,
                 "concurrency_control_enabled": True
             }
+            if admission_queue:
+                status["queue_depth"] = admission_queue.depth
+                status["estimated_wait_seconds"] = round(admission_queue.estimated_wait(), 3)
         else:
-            return {
+            status = {
                 "prediction_slots_available": True,
                 "active_predictions": 0,
                 "max_concurrent_predictions": None,
                 "concurrency_control_enabled": False
             }
+        reloader = getattr(app.state, "reloader", None)
+        if reloader is not None:
+            status["model_version"] = reloader.version
+            status["reloads"] = reloader.reloads
+            status["last_reload"] = reloader.last_reload
+        # Memory of the worker serving this request (USS excludes pages shared with other workers)
+        status["worker_pid"] = os.getpid()
+        status["memory"] = process_memory()
+        return status
+
+    if config.api.reload.enabled:
+        @app.post("/admin/reload")
+        async def reload_model(authorization: Optional[str] = Header(None)):
+            """Load the model again and swap it in without dropping requests."""
+            _require_admin(config, authorization)
+            reloader = getattr(app.state, "reloader", None)
+            if reloader is None:
+                raise HTTPException(status_code=503, detail="Model is not loaded yet.")
+            try:
+                return await reloader.reload(reason="admin")
+            except Exception:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Model reload failed; the previous model is still serving. See server logs."
+                )
+
+    if config.api.profiler.enabled:
+        # One profile at a time; acquired without blocking, so it works from any event loop
+        profiling = threading.Lock()
+
+        @app.post("/admin/profile")
+        async def profile(seconds: float = Query(10.0, gt=0), format: str = Query("collapsed"),
+                          interval_ms: Optional[float] = Query(None, ge=1), idle: bool = False,
+                          authorization: Optional[str] = Header(None)):
+            """Sample the Python stacks of all threads for ``seconds`` and return them."""
+            _require_admin(config, authorization)
+            profiler_config = config.api.profiler
+            if seconds > profiler_config.max_seconds:
+                raise HTTPException(status_code=400, detail=f"seconds must be at most {profiler_config.max_seconds:g}.")
+            if format not in ("collapsed", "speedscope"):
+                raise HTTPException(status_code=400, detail="format must be 'collapsed' or 'speedscope'.")
+            if not profiling.acquire(blocking=False):
+                raise HTTPException(status_code=409, detail="A profile is already running.")
+            try:
+                sampler = StackSampler((interval_ms or profiler_config.interval_ms) / 1000, include_idle=idle)
+                sampler.start()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    await asyncio.to_thread(sampler.stop)
+            finally:
+                profiling.release()
+
+            if format == "speedscope":
+                name = f"{config.classifier.get('name', 'mlserver')} (pid {os.getpid()})"
+                return _json_response(speedscope_profile(sampler, name=name))
+            return Response(content=collapsed_stacks(sampler), media_type="text/plain")
 
     # Add metrics endpoint if enabled
     if config.observability.metrics:
@@ -597,7 +1276,7 @@ def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
         @lru_cache(maxsize=1)
         def _get_cached_metrics(timestamp_key: int):
             """Cache metrics generation keyed by 5-second intervals."""
-            metrics_collector = get_metrics()
+            metrics_collector = metrics_getter()
             if metrics_collector:
                 return Response(
                     content=metrics_collector.generate_metrics(),
@@ -612,7 +1291,7 @@ def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
             return _get_cached_metrics(cache_key)
 
     # Register versioned prediction endpoints
-    _register_prediction_endpoints(app, config, prediction_limiter)
+    _register_prediction_endpoints(app, config, prediction_limiter, admission_queue)
 
     return app
 
@@ -621,188 +1300,6 @@ def create_app(config: AppConfig, config_file_name: str = None) -> FastAPI:
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _to_jsonable(x, _depth=0):
-    """Convert any Python object to JSON-serializable format.
-
-    Handles pandas, numpy, datetime types, and nested structures with comprehensive
-    type coverage to prevent serialization errors in production.
-
-    Args:
-        x: Object to convert
-        _depth: Current recursion depth (internal use)
-
-    Returns:
-        JSON-serializable representation of x
-
-    Raises:
-        RecursionError: If recursion depth exceeds maximum limit
-    """
-    # Maximum recursion depth to prevent stack overflow
-    _MAX_RECURSION_DEPTH = 50
-
-    # Recursion depth check
-    if _depth > _MAX_RECURSION_DEPTH:
-        logger.warning(f"Max recursion depth {_MAX_RECURSION_DEPTH} exceeded in _to_jsonable")
-        raise RecursionError(f"Maximum recursion depth exceeded: {_MAX_RECURSION_DEPTH}")
-
-    # Fast path: None
-    if x is None:
-        return None
-
-    # Fast path: Basic JSON-serializable types
-    if isinstance(x, (str, int, float, bool)):
-        return x
-
-    # === Pandas temporal types (MUST be before numpy!) ===
-    try:
-        import pandas as pd
-
-        # pd.Timestamp - Convert to ISO 8601 string
-        if isinstance(x, pd.Timestamp):
-            return x.isoformat()
-
-        # pd.NaT - Not a Time (pandas null for timestamps)
-        # Check type name first to avoid calling pd.isna() on arrays
-        if hasattr(x, '__class__') and x.__class__.__name__ == 'NaTType':
-            return None
-
-        # pd.Timedelta - Convert to seconds
-        if isinstance(x, pd.Timedelta):
-            return x.total_seconds()
-
-    except ImportError:
-        pass
-
-    # === Pandas collection types ===
-    try:
-        import pandas as pd
-
-        # DataFrame - Convert to list of records
-        if isinstance(x, pd.DataFrame):
-            # Recursively convert to handle nested types
-            records = x.to_dict('records')
-            return _to_jsonable(records, _depth + 1)
-
-        # Series - Convert to list
-        if isinstance(x, pd.Series):
-            # Recursively convert to handle nested types
-            return _to_jsonable(x.tolist(), _depth + 1)
-
-        # Index - Convert to list
-        if isinstance(x, pd.Index):
-            return _to_jsonable(x.tolist(), _depth + 1)
-
-    except ImportError:
-        pass
-
-    # === Python datetime types ===
-    try:
-        from datetime import datetime, date, time, timedelta
-
-        # datetime.datetime - ISO 8601 with timezone
-        if isinstance(x, datetime):
-            return x.isoformat()
-
-        # datetime.date - YYYY-MM-DD
-        if isinstance(x, date):
-            return x.isoformat()
-
-        # datetime.time - HH:MM:SS
-        if isinstance(x, time):
-            return x.isoformat()
-
-        # datetime.timedelta - Total seconds
-        if isinstance(x, timedelta):
-            return x.total_seconds()
-
-    except ImportError:
-        pass
-
-    # === NumPy types ===
-    try:
-        import numpy as np
-
-        # np.datetime64 - MUST check before np.generic!
-        if isinstance(x, np.datetime64):
-            # Convert to ISO string via pandas for consistency
-            import pandas as pd
-            return pd.Timestamp(x).isoformat()
-
-        # np.timedelta64 - Convert to seconds
-        if isinstance(x, np.timedelta64):
-            # Convert to pandas Timedelta for consistent handling
-            import pandas as pd
-            return pd.Timedelta(x).total_seconds()
-
-        # np.ndarray - Convert to nested list
-        if isinstance(x, np.ndarray):
-            # Recursively convert to handle nested types
-            return _to_jsonable(x.tolist(), _depth + 1)
-
-        # np.generic - Catches all numpy scalar types (int64, float64, bool_, etc.)
-        if isinstance(x, np.generic):
-            return x.item()
-
-    except ImportError:
-        pass
-
-    # === Python collection types (recursive) ===
-
-    # Dictionary - Recursively convert keys and values
-    if isinstance(x, dict):
-        return {
-            _to_jsonable(k, _depth + 1): _to_jsonable(v, _depth + 1)
-            for k, v in x.items()
-        }
-
-    # List/tuple - Recursively convert items
-    if isinstance(x, (list, tuple)):
-        return [_to_jsonable(item, _depth + 1) for item in x]
-
-    # Set/frozenset - Convert to sorted list
-    if isinstance(x, (set, frozenset)):
-        try:
-            return sorted(_to_jsonable(list(x), _depth + 1))
-        except TypeError:
-            # If items aren't sortable, return unsorted
-            return _to_jsonable(list(x), _depth + 1)
-
-    # === Other common types ===
-
-    # decimal.Decimal - Convert to float
-    try:
-        from decimal import Decimal
-        if isinstance(x, Decimal):
-            return float(x)
-    except ImportError:
-        pass
-
-    # bytes - Convert to base64 string
-    if isinstance(x, bytes):
-        import base64
-        return base64.b64encode(x).decode('ascii')
-
-    # === Fallback ===
-    # If we reach here, the type isn't explicitly handled
-    # Log a warning and attempt str conversion
-    type_name = type(x).__name__
-    logger.warning(
-        f"Unhandled type in _to_jsonable: {type_name}. "
-        f"Attempting str() conversion. Value: {str(x)[:100]}"
-    )
-
-    try:
-        # Attempt to convert to string as last resort
-        return str(x)
-    except Exception as e:
-        # If even str() fails, log error and return placeholder
-        logger.error(
-            f"Failed to convert {type_name} to JSON-serializable format: {e}. "
-            f"Returning placeholder string."
-        )
-        return f"<Unserializable: {type_name}>"
-
-
 def _tolist2d(arr):
     try:
         import numpy as _np
@@ -821,7 +1318,12 @@ def app() -> FastAPI:
     import yaml
     from pathlib import Path
     from .config import AppConfig
-    from .multi_classifier import detect_multi_classifier_config, load_multi_classifier_config
+    from .cli import resolve_relative_paths
+    from .multi_classifier import (
+        MultiClassifierConfig,
+        extract_single_classifier_config,
+        is_multi_classifier_document,
+    )
 
     # Try to find config file
     config_paths = [
@@ -838,29 +1340,33 @@ def app() -> FastAPI:
     if not config_file:
         raise RuntimeError("No configuration file found. Please specify mlserver.yaml or set MLSERVER_CONFIG_PATH")
 
-    # Check for multi-classifier config
-    if detect_multi_classifier_config(str(config_file)):
-        # Get classifier from environment or use default
-        classifier_name = os.environ.get('MLSERVER_CLASSIFIER')
-        configs = load_multi_classifier_config(str(config_file))
-
-        if classifier_name and classifier_name in configs:
-            cfg = configs[classifier_name]
-        else:
-            # Find default or first classifier
-            with open(config_file, 'r') as f:
-                raw = yaml.safe_load(f)
-            default = raw.get('default_classifier')
-            if default and default in configs:
-                cfg = configs[default]
-            else:
-                cfg = next(iter(configs.values()))
-    else:
-        # Single classifier config
+    # Parse the file once; the multi-classifier check works on the parsed document
+    timings = StartupTimings()
+    with timings.phase("config"):
         with open(config_file, 'r') as f:
             raw = yaml.safe_load(f)
-        cfg = AppConfig.model_validate(raw)
 
-    cfg.set_project_path(str(config_file.parent))
+        if is_multi_classifier_document(raw):
+            multi_config = MultiClassifierConfig.model_validate(raw)
+            config_dir = str(config_file.resolve().parent)
+            if os.environ.get('MLSERVER_ALL_CLASSIFIERS'):
+                # Serve every classifier from this worker (mlserver serve --all)
+                from .multi_model import build_model_configs, create_multi_model_app
+                configs = build_model_configs(multi_config, config_dir, resolve_relative_paths)
+                return create_multi_model_app(multi_config, configs, config_file_name=config_file.name)
+
+            # Classifier from environment, else the default, else the first one
+            classifier_name = os.environ.get('MLSERVER_CLASSIFIER')
+            if not classifier_name or classifier_name not in multi_config.classifiers:
+                default = multi_config.default_classifier
+                classifier_name = default if default in multi_config.classifiers else next(iter(multi_config.classifiers))
+            cfg = extract_single_classifier_config(multi_config, classifier_name)
+            if cfg.predictor.init_kwargs:
+                cfg.predictor.init_kwargs = resolve_relative_paths(cfg.predictor.init_kwargs, config_dir)
+        else:
+            # Single classifier config
+            cfg = AppConfig.model_validate(raw)
+
+        cfg.set_project_path(str(config_file.parent))
 
-    return create_app(cfg, config_file_name=config_file.name)
+    return create_app(cfg, config_file_name=config_file.name, startup_timings=timings)
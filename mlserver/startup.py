@@ -0,0 +1,83 @@
+"""
+Startup timing breakdown.
+
+Records how long each phase of bringing a model up takes, so the time a new
+pod or worker needs before it serves (and before it is ready) can be
+attributed:
+
+- ``config``: reading and validating the configuration file
+- ``import``: importing the predictor module
+- ``artifacts``: loading ``predictor.artifacts`` (in parallel with the import)
+- ``predictor_init``: the predictor constructor (including files it loads itself)
+- ``metadata``: collecting classifier/git metadata (in parallel with the predictor load)
+- ``warmup``: warm-up predictions (``api.warmup``)
+
+Phases that run concurrently overlap, so ``startup_seconds`` (until the
+server accepts requests) and ``ready_seconds`` (until ``/readyz`` reports
+ready) are wall-clock times rather than sums. The breakdown is logged and
+reported by ``/info`` under ``startup``.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimings:
+    """Wall-clock duration of every startup phase (thread-safe)."""
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.phases: Dict[str, float] = {}
+        self.startup_seconds: Optional[float] = None
+        self.ready_seconds: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as the named phase (repeated phases add up)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def started(self) -> None:
+        """Mark the server as accepting requests."""
+        self.startup_seconds = time.perf_counter() - self._started
+        logger.info(f"Startup took {self.startup_seconds:.2f}s ({self._format_phases()})")
+
+    def ready(self) -> None:
+        """Mark the server as ready (warm-up finished)."""
+        self.ready_seconds = time.perf_counter() - self._started
+        logger.info(f"Ready after {self.ready_seconds:.2f}s ({self._format_phases()})")
+
+    def _format_phases(self) -> str:
+        with self._lock:
+            return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items()) or "no phases"
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = {name: round(seconds, 3) for name, seconds in self.phases.items()}
+        return {
+            "phases": phases,
+            "startup_seconds": round(self.startup_seconds, 3) if self.startup_seconds is not None else None,
+            "ready_seconds": round(self.ready_seconds, 3) if self.ready_seconds is not None else None,
+        }
+
+
+@contextmanager
+def timed(timings: Optional[StartupTimings], name: str):
+    """``timings.phase(name)``, or nothing when no timings are being recorded."""
+    if timings is None:
+        yield
+    else:
+        with timings.phase(name):
+            yield
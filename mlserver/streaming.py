@@ -0,0 +1,332 @@
+"""
+Incremental request parsing and response encoding for the streaming endpoints.
+
+``/predict/stream`` and ``/predict_proba/stream`` score request bodies of any
+size with constant memory. The body is read as it arrives and cut into
+chunks of ``api.streaming.chunk_size`` rows; a single NDJSON line or Arrow
+message larger than ``api.streaming.max_message_bytes`` is rejected. Each chunk is decoded and
+predicted on the inference threads, and its results are written to the
+response before more of the body is read.
+
+Request formats:
+
+- ``application/x-ndjson``: one JSON record (object) or feature row (array)
+  per line
+- ``application/vnd.apache.arrow.stream``: an Arrow IPC stream. Every record
+  batch is decoded on its own and scored in slices of ``chunk_size`` rows, so
+  a batch is bounded by ``max_message_bytes`` rather than by a row count
+
+Response formats (chosen with the Accept header):
+
+- ``application/x-ndjson`` (default): one line per chunk,
+  ``{"offset": <first row>, "predictions": [...]}``. A failure after the
+  response has started is reported as a final ``{"offset": ..., "error": ...}``
+  line
+- ``application/vnd.apache.arrow.stream``: one record batch per chunk
+"""
+import io
+import json
+import struct
+from typing import Any, Iterator, List, Optional
+
+import numpy as np
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, StreamingResponse
+
+from . import codecs
+from .adapters import AdapterError, to_ndarray
+
+NDJSON = "application/x-ndjson"
+
+STREAM_REQUEST_TYPES = (NDJSON, codecs.ARROW_STREAM)
+STREAM_RESPONSE_TYPES = (NDJSON, codecs.ARROW_STREAM)
+
+# Arrow IPC framing: an optional continuation marker, then the metadata length
+_CONTINUATION = b"\xff\xff\xff\xff"
+# Message header types (Schema, DictionaryBatch, RecordBatch) from Arrow's Message.fbs
+_SCHEMA, _DICTIONARY_BATCH, _RECORD_BATCH = 1, 2, 3
+
+# Largest NDJSON line or Arrow IPC message buffered before it is rejected with 413
+DEFAULT_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def negotiate_stream_response_type(accept: Optional[str]) -> str:
+    """Pick the streaming response format from an Accept header (NDJSON unless Arrow is preferred)."""
+    response_type = codecs.negotiate_response_type(accept, supported=STREAM_RESPONSE_TYPES, default=NDJSON)
+    if response_type == codecs.ARROW_STREAM:
+        codecs.ensure_codec_available(codecs.ARROW_STREAM)
+    return response_type
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse whose body iterator may keep reading the request body.
+
+    StreamingResponse normally consumes ``receive`` in the background to
+    detect client disconnects, which swallows request body messages that have
+    not been read yet. Here the body iterator is the only reader; a disconnect
+    surfaces as ``ClientDisconnect`` from ``request.stream()``.
+
+    The status line is sent together with the first piece of the body, so an
+    ``HTTPException`` raised before it (e.g. an oversized or invalid first
+    chunk) is answered with its own status instead of a 200.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        iterator = self.body_iterator.__aiter__()
+        try:
+            first = await iterator.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except HTTPException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+            await response(scope, receive, send)
+            return
+        self.body_iterator = _prepend(first, iterator)
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def _prepend(first, iterator):
+    if first is not None:
+        yield first
+    async for piece in iterator:
+        yield piece
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Request chunking (event loop side, byte-level only)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class MessageTooLarge(AdapterError):
+    """An NDJSON line or Arrow IPC message is larger than ``api.streaming.max_message_bytes``."""
+    pass
+
+
+class NDJSONChunker:
+    """Split an NDJSON byte stream into chunks of at most ``chunk_size`` lines."""
+
+    def __init__(self, chunk_size: int, max_line_bytes: int = DEFAULT_MAX_MESSAGE_BYTES):
+        self.chunk_size = chunk_size
+        self.max_line_bytes = max_line_bytes
+        # Pieces of the line that is not terminated yet, joined once its newline arrives
+        self._partial: List[bytes] = []
+        self._partial_size = 0
+        self._lines: List[bytes] = []
+
+    def feed(self, data: bytes) -> Iterator[List[bytes]]:
+        """Add body bytes; yields every chunk that is complete."""
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if end < 0:
+                break
+            line = self._complete(data[start:end])
+            start = end + 1
+            if line.strip():
+                self._lines.append(line)
+                if len(self._lines) == self.chunk_size:
+                    yield self._take()
+        if start < len(data):
+            self._add_partial(data[start:])
+
+    def finish(self) -> Iterator[List[bytes]]:
+        """Flush the remaining lines at the end of the body."""
+        line = self._complete(b"")
+        if line.strip():
+            self._lines.append(line)
+        if self._lines:
+            yield self._take()
+
+    def _add_partial(self, piece: bytes) -> None:
+        self._partial_size += len(piece)
+        if self._partial_size > self.max_line_bytes:
+            raise MessageTooLarge(f"NDJSON line longer than {self.max_line_bytes} bytes")
+        self._partial.append(piece)
+
+    def _complete(self, piece: bytes) -> bytes:
+        if not self._partial:
+            if len(piece) > self.max_line_bytes:
+                raise MessageTooLarge(f"NDJSON line longer than {self.max_line_bytes} bytes")
+            return piece
+        self._add_partial(piece)
+        line = b"".join(self._partial)
+        self._partial, self._partial_size = [], 0
+        return line
+
+    def _take(self) -> List[bytes]:
+        lines, self._lines = self._lines, []
+        return lines
+
+
+class ArrowChunker:
+    """Split an Arrow IPC byte stream into self-contained single-batch streams.
+
+    Only the message framing is parsed here; each yielded chunk is the schema
+    message, any dictionary messages and one record batch message, which
+    ``decode_arrow_chunk`` reads with pyarrow on an inference thread.
+    """
+
+    def __init__(self, max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES):
+        self.max_message_bytes = max_message_bytes
+        self._buffer = bytearray()
+        self._schema: Optional[bytes] = None
+        self._dictionaries: List[bytes] = []
+        self._ended = False
+
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        """Add body bytes; yields a decodable stream for every complete record batch."""
+        self._buffer += data
+        while not self._ended:
+            message = self._next_message()
+            if message is None:
+                return
+            header_type, raw = message
+            if header_type == _SCHEMA:
+                self._schema = raw
+            elif header_type == _DICTIONARY_BATCH:
+                self._dictionaries.append(raw)
+            elif header_type == _RECORD_BATCH:
+                if self._schema is None:
+                    raise AdapterError("Arrow stream record batch received before its schema")
+                yield b"".join([self._schema, *self._dictionaries, raw])
+
+    def finish(self) -> Iterator[bytes]:
+        """Check that the body ended on a message boundary."""
+        if self._buffer and not self._ended:
+            raise AdapterError("Arrow stream ended in the middle of a message")
+        return iter(())
+
+    def _next_message(self):
+        buffer = self._buffer
+        if len(buffer) < 4:
+            return None
+        prefix = 8 if buffer[:4] == _CONTINUATION else 4
+        if len(buffer) < prefix:
+            return None
+        metadata_size = struct.unpack_from("<i", buffer, prefix - 4)[0]
+        if metadata_size == 0:  # end-of-stream marker
+            self._ended = True
+            del buffer[:prefix]
+            return None
+        if metadata_size < 0:
+            raise AdapterError("Invalid Arrow IPC stream")
+        self._check_size(prefix + metadata_size)
+        if len(buffer) < prefix + metadata_size:
+            return None
+
+        header_type, body_length = _read_message_metadata(bytes(buffer[prefix:prefix + metadata_size]))
+        total = prefix + metadata_size + body_length
+        # Checked from the declared length, before the message body is buffered
+        self._check_size(total)
+        if len(buffer) < total:
+            return None
+        raw = bytes(buffer[:total])
+        del buffer[:total]
+        return header_type, raw
+
+    def _check_size(self, size: int) -> None:
+        if size > self.max_message_bytes:
+            raise MessageTooLarge(
+                f"Arrow IPC message larger than {self.max_message_bytes} bytes; send smaller record batches"
+            )
+
+
+def _read_message_metadata(metadata: bytes):
+    """Read header_type and bodyLength from a flatbuffer-encoded Arrow Message."""
+    try:
+        table = struct.unpack_from("<I", metadata, 0)[0]
+        vtable = table - struct.unpack_from("<i", metadata, table)[0]
+        vtable_size = struct.unpack_from("<H", metadata, vtable)[0]
+
+        def field_offset(index: int) -> int:
+            position = 4 + 2 * index
+            if position >= vtable_size:
+                return 0
+            return struct.unpack_from("<H", metadata, vtable + position)[0]
+
+        # Message fields: version (0), header_type (1), header (2), bodyLength (3)
+        offset = field_offset(1)
+        header_type = metadata[table + offset] if offset else 0
+        offset = field_offset(3)
+        body_length = struct.unpack_from("<q", metadata, table + offset)[0] if offset else 0
+    except (struct.error, IndexError):
+        raise AdapterError("Invalid Arrow IPC message")
+    if body_length < 0:
+        raise AdapterError("Invalid Arrow IPC message")
+    return header_type, body_length
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Chunk decoding (inference thread side)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def decode_ndjson_chunk(lines: List[bytes], feature_order=None, input_dtype: str = "object",
+                        feature_dtypes=None) -> np.ndarray:
+    """Decode NDJSON lines (records or feature rows) into the 2D model input array."""
+    try:
+        rows = json.loads(b"[" + b",".join(lines) + b"]")
+    except ValueError as e:
+        raise AdapterError(f"Invalid NDJSON: {e}")
+
+    if isinstance(rows[0], dict):
+        payload, adapter = {"records": rows}, "records"
+    else:
+        payload, adapter = {"ndarray": rows}, "ndarray"
+    return to_ndarray(
+        payload,
+        adapter=adapter,
+        feature_order=feature_order,
+        input_dtype=input_dtype,
+        feature_dtypes=feature_dtypes,
+    )
+
+
+def decode_arrow_chunk(stream: bytes, chunk_size: int, feature_order=None, input_dtype: str = "object",
+                       feature_dtypes=None) -> Iterator[np.ndarray]:
+    """Decode a single-batch Arrow IPC stream into model input arrays of at most ``chunk_size`` rows.
+
+    A record batch may hold more rows than one request is allowed; it is sliced
+    (without copying) before each slice is converted.
+    """
+    table = codecs.read_arrow_table(stream)
+    for start in range(0, table.num_rows, chunk_size):
+        yield codecs.table_to_ndarray(table.slice(start, chunk_size), feature_order, input_dtype, feature_dtypes)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Response encoding
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ArrowStreamEncoder:
+    """Write prediction chunks as record batches of a single Arrow IPC stream."""
+
+    def __init__(self):
+        self._pa = codecs._import_pyarrow()
+        self._sink = io.BytesIO()
+        self._writer = None
+        self._schema = None
+
+    def encode(self, values: Any) -> bytes:
+        """Encode one chunk; the first call also emits the stream schema."""
+        table = codecs.array_to_table(values)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._pa.ipc.new_stream(self._sink, self._schema)
+        elif table.schema != self._schema:
+            table = table.cast(self._schema)
+        self._writer.write_table(table)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """Finish the stream (end-of-stream marker)."""
+        if self._writer is None:
+            return b""
+        self._writer.close()
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
@@ -0,0 +1,143 @@
+"""
+Startup warm-up and readiness (``api.warmup``, ``GET /readyz``).
+
+The first predictions of a freshly started model are much slower than the
+following ones: libraries initialize lazily, JIT-compiled code paths are
+compiled and buffers are allocated on first use. With warm-up enabled the
+server runs sample payloads through the same path as a request (input
+adapter, predictor, response formatting and JSON encoding) right after
+startup. ``/healthz`` answers as soon as the process is up, while ``/readyz``
+reports ready only once warm-up has finished, so a load balancer or a
+Kubernetes readiness probe keeps traffic away from a cold model.
+
+Payloads are taken from ``samples`` and ``samples_file`` (recorded request
+payloads), or built from ``feature_order`` as synthetic all-zero rows.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .config import AppConfig, WarmupConfig
+
+logger = logging.getLogger(__name__)
+
+
+def synthetic_payload(feature_order: List[str], adapter: str, rows: int,
+                      feature_dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Build a payload of all-zero rows ("0" for categorical features)."""
+    feature_dtypes = feature_dtypes or {}
+    row = [("0" if feature_dtypes.get(name) == "category" else 0.0) for name in feature_order]
+    if adapter == "ndarray":
+        return {"ndarray": [list(row) for _ in range(rows)]}
+    return {"records": [dict(zip(feature_order, row)) for _ in range(rows)]}
+
+
+def _read_samples_file(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        text = f.read()
+    if path.endswith((".ndjson", ".jsonl")):
+        samples = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        samples = json.loads(text)
+    if isinstance(samples, dict):
+        samples = [samples]
+    if not isinstance(samples, list) or not all(isinstance(s, dict) for s in samples):
+        raise ValueError(f"Warm-up samples file must contain request payload objects: {path}")
+    return samples
+
+
+def warmup_payloads(config: AppConfig, feature_order: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """
+    Collect the payloads to warm up with.
+
+    Args:
+        config: Application configuration
+        feature_order: Resolved feature order (used for synthetic payloads)
+
+    Returns:
+        Request payloads; empty when there are no samples and no feature order
+        to build a synthetic payload from
+    """
+    warmup = config.api.warmup
+    payloads = list(warmup.samples or [])
+    if warmup.samples_file:
+        path = warmup.samples_file
+        if not os.path.isabs(path) and config.project_path:
+            path = os.path.join(config.project_path, path)
+        payloads.extend(_read_samples_file(path))
+    if not payloads and feature_order:
+        payloads.append(synthetic_payload(
+            feature_order, config.api.adapter, warmup.synthetic_rows, config.api.feature_dtypes
+        ))
+    return payloads
+
+
+class WarmupState:
+    """Progress of the startup warm-up, reported by ``/readyz``."""
+
+    def __init__(self, warmup: WarmupConfig):
+        self.config = warmup
+        self.status = "pending" if warmup.enabled else "ready"
+        self.predictions = 0
+        self.errors = 0
+        self.error: Optional[str] = None
+        self.duration_seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    async def run(self, load_payloads: Callable[[], List[Dict[str, Any]]], methods: List[str],
+                  predict: Callable[[Dict[str, Any], str], Awaitable[Any]]) -> None:
+        """
+        Run every payload through every method ``iterations`` times.
+
+        Args:
+            load_payloads: Returns the request payloads (called on a worker thread)
+            methods: Prediction methods to warm up ("predict", "predict_proba")
+            predict: Runs one payload through the request path for a method
+        """
+        self.status = "running"
+        started = time.perf_counter()
+        try:
+            payloads = await asyncio.to_thread(load_payloads)
+        except Exception as e:
+            payloads = []
+            self.errors += 1
+            self.error = f"samples: {e}"
+            logger.warning(f"Cannot load warm-up samples: {e}")
+        if not payloads and not self.errors:
+            logger.warning("Warm-up is enabled but there are no samples and no feature_order; skipping it")
+        for _ in range(self.config.iterations):
+            for payload in payloads:
+                for method in methods:
+                    try:
+                        await predict(payload, method)
+                        self.predictions += 1
+                    except Exception as e:
+                        self.errors += 1
+                        self.error = f"{method}: {e}"
+                        logger.warning(f"Warm-up {method} failed: {e}")
+        self.duration_seconds = time.perf_counter() - started
+
+        if self.errors and self.config.fail_on_error:
+            self.status = "failed"
+            logger.error(f"Warm-up failed ({self.errors} errors); the server will not report ready")
+            return
+        self.status = "ready"
+        logger.info(
+            f"Warm-up finished: {self.predictions} predictions in {self.duration_seconds:.2f}s"
+            + (f" ({self.errors} failed)" if self.errors else "")
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "predictions": self.predictions,
+            "errors": self.errors,
+            "error": self.error,
+            "duration_seconds": round(self.duration_seconds, 3) if self.duration_seconds is not None else None,
+        }
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Request observability middleware overhead benchmark.
+
+Drives a trivial FastAPI app through its ASGI interface (no network, no HTTP
+parsing) and reports the time per request with no middleware, with a
+``BaseHTTPMiddleware`` doing the same logging (the implementation the server
+used before) and with the pure ASGI ``RequestObservabilityMiddleware`` (at
+full and sampled logging). Structured logs are formatted and written to a null
+stream so that the logging cost is included; metrics are disabled.
+
+Usage:
+    python scripts/bench_middleware.py [--requests N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from mlserver.config import AppConfig  # noqa: E402
+from mlserver.logging_conf import StructuredFormatter, log_request, log_response, set_correlation_id  # noqa: E402
+from mlserver.observability import RequestObservabilityMiddleware  # noqa: E402
+
+
+class _BaseHTTPObservabilityMiddleware(BaseHTTPMiddleware):
+    """Baseline: correlation ID and request/response logs as a ``BaseHTTPMiddleware``."""
+
+    def __init__(self, app, config: AppConfig):
+        super().__init__(app)
+        self.config = config
+
+    async def dispatch(self, request: Request, call_next):
+        correlation_id = set_correlation_id() if self.config.observability.correlation_ids else None
+        start_time = time.perf_counter()
+        if self.config.observability.structured_logging:
+            log_request(method=request.method, path=request.url.path, correlation_id=correlation_id)
+        response = await call_next(request)
+        if self.config.observability.structured_logging:
+            log_response(status_code=response.status_code, duration_ms=(time.perf_counter() - start_time) * 1000)
+        return response
+
+
+def _config(log_sample_rate: float) -> AppConfig:
+    return AppConfig.model_validate({
+        "predictor": {"module": "bench", "class_name": "Bench"},
+        "classifier": {"name": "bench", "version": "1.0.0"},
+        "api": {"adapter": "records"},
+        "observability": {"metrics": False, "log_sample_rate": log_sample_rate},
+    })
+
+
+def _app(middleware=None, log_sample_rate: float = 1.0) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if middleware is not None:
+        app.add_middleware(middleware, config=_config(log_sample_rate))
+    return app
+
+
+async def _run(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per variant")
+    args = parser.parse_args()
+
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(StructuredFormatter())
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+    variants = [
+        ("no middleware", _app()),
+        ("BaseHTTPMiddleware", _app(_BaseHTTPObservabilityMiddleware)),
+        ("RequestObservabilityMiddleware, log_sample_rate=1.0", _app(RequestObservabilityMiddleware)),
+        ("RequestObservabilityMiddleware, log_sample_rate=0.01", _app(RequestObservabilityMiddleware, 0.01)),
+    ]
+    for name, app in variants:
+        micros = asyncio.run(_run(app, args.requests))
+        print(f"{name:<55} {micros:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
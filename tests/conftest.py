@@ -257,6 +257,7 @@ def observability_config():
             version="v1",
             adapter="records",
             thread_safe_predict=False,
+            max_concurrent_predictions=10,  # Allow concurrent requests for testing
             endpoints={
                 "predict": True,
                 "batch_predict": True,
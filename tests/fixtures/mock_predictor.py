@@ -88,3 +88,29 @@ class MockPredictorWithPreprocessing:
         df = df[self.feature_order]
         X_processed = self.preprocessor.transform(df)
         return self.model.predict_proba(X_processed)
+
+
+class FileValuePredictor:
+    """Mock predictor whose "model" is a number read from model_path."""
+
+    closed = []
+
+    def __init__(self, model_path: str, **kwargs):
+        with open(model_path) as f:
+            self.value = float(f.read())
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return np.full(len(X), self.value)
+
+    def close(self):
+        FileValuePredictor.closed.append(self.value)
+
+
+class CrashingPredictor:
+    """Mock predictor that kills its process for rows starting with a negative value."""
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        if X[0][0] < 0:
+            import os
+            os._exit(1)
+        return np.zeros(len(X))
@@ -0,0 +1,107 @@
+"""Integration tests for binary request/response content negotiation."""
+import io
+
+import numpy as np
+import pytest
+
+from mlserver import codecs
+
+
+def _npy_bytes(arr):
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(arr), allow_pickle=False)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+class TestBinaryRequests:
+    """Binary request bodies produce the same predictions as JSON."""
+
+    async def test_npy_request(self, async_client, sample_ndarray_payload):
+        json_response = await async_client.post("/predict", json=sample_ndarray_payload)
+        rows = sample_ndarray_payload["payload"]["ndarray"]
+
+        response = await async_client.post(
+            "/predict", content=_npy_bytes(rows), headers={"content-type": codecs.NPY}
+        )
+        assert response.status_code == 200
+        assert response.json()["predictions"] == json_response.json()["predictions"]
+
+    async def test_msgpack_request_and_response(self, async_client, sample_records_payload):
+        msgpack = pytest.importorskip("msgpack")
+        response = await async_client.post(
+            "/predict",
+            content=msgpack.packb(sample_records_payload),
+            headers={"content-type": codecs.MSGPACK, "accept": codecs.MSGPACK},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == codecs.MSGPACK
+        document = msgpack.unpackb(response.content)
+        assert len(document["predictions"]) == 2
+        assert "time_ms" in document
+
+    async def test_npy_response(self, async_client, sample_records_payload):
+        response = await async_client.post(
+            "/predict_proba", json=sample_records_payload, headers={"accept": codecs.NPY}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == codecs.NPY
+        assert codecs.TIMING_HEADER in response.headers
+        probabilities = np.load(io.BytesIO(response.content))
+        assert probabilities.shape == (2, 2)
+
+    async def test_arrow_roundtrip(self, async_client):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({f"f{i}": [float(i), float(i) + 0.5] for i in range(1, 6)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        response = await async_client.post(
+            "/predict",
+            content=sink.getvalue().to_pybytes(),
+            headers={"content-type": codecs.ARROW_STREAM, "accept": codecs.ARROW_STREAM},
+        )
+        assert response.status_code == 200
+        result = pa.ipc.open_stream(response.content).read_all()
+        assert result.num_rows == 2
+
+    async def test_invalid_npy_body(self, async_client):
+        response = await async_client.post(
+            "/predict", content=b"not an array", headers={"content-type": codecs.NPY}
+        )
+        assert response.status_code == 400
+
+    async def test_json_accept_is_default(self, async_client, sample_records_payload):
+        response = await async_client.post(
+            "/predict", json=sample_records_payload, headers={"accept": "*/*"}
+        )
+        assert response.status_code == 200
+        assert "predictions" in response.json()
+
+    async def test_openapi_documents_binary_formats(self, async_client):
+        response = await async_client.get("/openapi.json")
+        assert response.status_code == 200
+        content = response.json()["paths"]["/predict"]["post"]["requestBody"]["content"]
+        assert codecs.NPY in content
+        assert codecs.JSON in content
+
+
+class TestNegotiation:
+    """Accept header negotiation."""
+
+    def test_defaults_to_json(self):
+        assert codecs.negotiate_response_type(None) == codecs.JSON
+        assert codecs.negotiate_response_type("text/html") == codecs.JSON
+
+    def test_respects_quality(self):
+        accept = f"{codecs.JSON};q=0.5, {codecs.NPY}"
+        assert codecs.negotiate_response_type(accept) == codecs.NPY
+
+    def test_zero_quality_is_not_acceptable(self):
+        assert codecs.negotiate_response_type(f"{codecs.MSGPACK};q=0") == codecs.JSON
+        assert codecs.negotiate_response_type(f"{codecs.NPY};q=0.0, {codecs.MSGPACK};q=0.1") == codecs.MSGPACK
+
+    def test_content_type_parameters_ignored(self):
+        assert codecs.is_binary_content_type(f"{codecs.NPY}; charset=binary")
+        assert not codecs.is_binary_content_type("application/json")
@@ -4,7 +4,7 @@ from mlserver.adapters import (
     to_ndarray, AdapterError, _infer_adapter_type,
     _get_cached_feature_order, _records_to_numpy_fast,
     _extract_ndarray_data, _extract_records_data,
-    _process_records_to_array, _FEATURE_ORDER_CACHE
+    _process_records_to_array, _FEATURE_ORDER_CACHE, clear_feature_cache
 )
 
 
@@ -517,4 +517,134 @@ class TestAdditionalEdgeCases:
         assert result.shape == (2, 3)
         # Values should be preserved as-is (object dtype)
         assert result[0, 1] == {"nested": "value"}
-        assert result[0, 2] == ["a", "b"]
\ No newline at end of file
+        assert result[0, 2] == ["a", "b"]
+
+class TestTypedConversion:
+    """Test schema-aware typed conversion"""
+
+    def test_default_keeps_object_dtype(self):
+        result = to_ndarray({"records": [{"a": 1, "b": 2.5}]}, adapter="records")
+        assert result.dtype == object
+
+    def test_numeric_input_dtype_records(self):
+        payload = {"records": [{"a": 1, "b": 2.5}, {"a": 3, "b": 4}]}
+        result = to_ndarray(payload, adapter="records", feature_order=["a", "b"], input_dtype="float32")
+        assert result.dtype == np.float32
+        assert result.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(result, [[1.0, 2.5], [3.0, 4.0]])
+
+    def test_numeric_input_dtype_ndarray(self):
+        result = to_ndarray({"ndarray": [[1, 2], [3, 4]]}, adapter="ndarray", input_dtype="int")
+        assert result.dtype == np.int64
+
+    @pytest.mark.parametrize("payload,adapter", [
+        ({"records": [{"a": 1, "b": 2.7}]}, "records"),
+        ({"ndarray": [[1, 2.7]]}, "ndarray"),
+        ({"columns": {"a": [1], "b": [2.7]}}, "columns"),
+    ])
+    def test_integer_dtype_rejects_fractions(self, payload, adapter):
+        with pytest.raises(AdapterError, match="whole numbers"):
+            to_ndarray(payload, adapter=adapter, feature_order=["a", "b"], input_dtype="int")
+
+    def test_integer_dtype_accepts_whole_floats(self):
+        result = to_ndarray({"records": [{"a": 1, "b": 2.0}]}, adapter="records",
+                            feature_order=["a", "b"], input_dtype="int32")
+        assert result.dtype == np.int32
+        np.testing.assert_array_equal(result, [[1, 2]])
+
+    def test_auto_infers_numeric_schema(self):
+        clear_feature_cache()
+        result = to_ndarray({"records": [{"a": 1, "b": 2.5}]}, adapter="records", input_dtype="auto")
+        assert result.dtype == np.float64
+
+    def test_auto_keeps_object_for_strings(self):
+        clear_feature_cache()
+        result = to_ndarray({"records": [{"a": 1, "b": "x"}]}, adapter="records", input_dtype="auto")
+        assert result.dtype == object
+
+    def test_auto_falls_back_when_later_batch_differs(self):
+        clear_feature_cache()
+        to_ndarray({"records": [{"a": 1.0}]}, adapter="records", feature_order=["a"], input_dtype="auto")
+        result = to_ndarray({"records": [{"a": "x"}]}, adapter="records", feature_order=["a"], input_dtype="auto")
+        assert result.dtype == object
+        assert result[0, 0] == "x"
+
+    def test_auto_ndarray(self):
+        assert to_ndarray({"ndarray": [[1, 2]]}, adapter="ndarray", input_dtype="auto").dtype == np.float64
+        assert to_ndarray({"ndarray": [[1, "x"]]}, adapter="ndarray", input_dtype="auto").dtype == object
+
+    def test_mixed_feature_dtypes(self):
+        payload = {"records": [{"age": "22", "sex": "male"}, {"age": 38, "sex": 1}]}
+        result = to_ndarray(
+            payload, adapter="records", feature_order=["age", "sex"],
+            feature_dtypes={"age": "float32", "sex": "category"}
+        )
+        assert result.dtype == object
+        assert result[:, 0].tolist() == [22.0, 38.0]
+        assert result[:, 1].tolist() == ["male", "1"]
+
+    def test_feature_dtypes_ndarray(self):
+        result = to_ndarray(
+            {"ndarray": [[1, 2.5]]}, adapter="ndarray", feature_order=["a", "b"],
+            feature_dtypes={"a": "float64", "b": "float64"}
+        )
+        assert result.dtype == np.float64
+
+    def test_invalid_value_for_declared_dtype(self):
+        with pytest.raises(AdapterError, match="'a'"):
+            to_ndarray({"records": [{"a": "abc"}]}, adapter="records", input_dtype="float64")
+
+    def test_missing_feature_still_reported(self):
+        with pytest.raises(AdapterError, match="missing required features"):
+            to_ndarray({"records": [{"a": 1}]}, adapter="records", feature_order=["a", "b"], input_dtype="float64")
+
+    def test_unknown_input_dtype(self):
+        with pytest.raises(AdapterError):
+            to_ndarray({"records": [{"a": 1}]}, adapter="records", input_dtype="complex")
+
+
+class TestColumnsAdapter:
+    """Test columnar payload conversion"""
+
+    def test_infer_columns_payload(self):
+        assert _infer_adapter_type({"columns": {"a": [1, 2]}}) == "columns"
+
+    def test_columns_basic(self):
+        payload = {"columns": {"b": [2, 4], "a": [1, 3]}}
+        result = to_ndarray(payload, adapter="columns")
+        # Without feature_order, columns are sorted like records
+        np.testing.assert_array_equal(result, [[1, 2], [3, 4]])
+
+    def test_columns_with_feature_order(self):
+        payload = {"columns": {"a": [1, 3], "b": [2, 4], "extra": [0, 0]}}
+        result = to_ndarray(payload, adapter="auto", feature_order=["b", "a"])
+        np.testing.assert_array_equal(result, [[2, 1], [4, 3]])
+
+    def test_columns_matches_records(self):
+        records = {"records": [{"a": 1.0, "b": "x"}, {"a": 2.0, "b": "y"}]}
+        columns = {"columns": {"a": [1.0, 2.0], "b": ["x", "y"]}}
+        np.testing.assert_array_equal(
+            to_ndarray(records, adapter="records"), to_ndarray(columns, adapter="columns")
+        )
+
+    def test_columns_typed(self):
+        payload = {"columns": {"a": [1, 2], "b": [0.5, 1.5]}}
+        result = to_ndarray(payload, adapter="columns", input_dtype="float32")
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, [[1.0, 0.5], [2.0, 1.5]])
+
+    def test_columns_length_mismatch(self):
+        with pytest.raises(AdapterError, match="'b' has 1 values"):
+            to_ndarray({"columns": {"a": [1, 2], "b": [1]}}, adapter="columns")
+
+    def test_columns_missing_feature(self):
+        with pytest.raises(AdapterError, match="missing required features"):
+            to_ndarray({"columns": {"a": [1]}}, adapter="columns", feature_order=["a", "b"])
+
+    def test_columns_not_lists(self):
+        with pytest.raises(AdapterError, match="must be a list"):
+            to_ndarray({"columns": {"a": 1}}, adapter="columns")
+
+    def test_columns_empty(self):
+        with pytest.raises(AdapterError):
+            to_ndarray({"columns": {"a": []}}, adapter="columns")
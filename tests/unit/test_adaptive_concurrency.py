@@ -0,0 +1,134 @@
+"""Unit tests for the adaptive concurrency limit."""
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.concurrency_limiter import AdaptiveLimit, AdmissionQueue, PredictionSemaphore
+from mlserver.config import AdaptiveConcurrencyConfig, AppConfig
+from mlserver.server import create_app
+
+
+class TestGradientLimit:
+    """Test the gradient algorithm."""
+
+    def test_grows_while_latency_is_flat(self):
+        limit = AdaptiveLimit(initial_limit=2, max_limit=32)
+        for _ in range(50):
+            limit.update(0.01, inflight=limit.limit)
+        assert limit.limit > 2
+
+    def test_shrinks_when_latency_rises(self):
+        limit = AdaptiveLimit(initial_limit=16, max_limit=32)
+        for _ in range(20):
+            limit.update(0.01, inflight=16)
+        grown = limit.limit
+        for _ in range(20):
+            limit.update(0.1, inflight=limit.limit)
+        assert limit.limit < grown
+
+    def test_does_not_grow_when_underused(self):
+        limit = AdaptiveLimit(initial_limit=8, max_limit=32)
+        for _ in range(50):
+            limit.update(0.01, inflight=1)
+        assert limit.limit == 8
+
+    def test_respects_upper_bound(self):
+        limit = AdaptiveLimit(initial_limit=4, min_limit=2, max_limit=6)
+        for _ in range(100):
+            limit.update(0.01, inflight=limit.limit)
+        assert limit.limit == 6
+
+    def test_reports_limit_changes(self):
+        metrics = Mock()
+        limit = AdaptiveLimit(initial_limit=2, max_limit=32, metrics_getter=lambda: metrics)
+        for _ in range(20):
+            limit.update(0.01, inflight=limit.limit)
+        metrics.set_concurrency_limit.assert_called_with(limit.limit)
+
+
+class TestAimdLimit:
+    """Test the AIMD algorithm."""
+
+    def test_additive_increase(self):
+        limit = AdaptiveLimit(initial_limit=4, algorithm="aimd")
+        limit.update(0.01, inflight=4)
+        limit.update(0.01, inflight=4)
+        assert limit.limit == 6
+
+    def test_multiplicative_decrease(self):
+        limit = AdaptiveLimit(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+        limit.update(0.01, inflight=10)
+        limit.update(1.0, inflight=10)
+        assert limit.limit == 5
+
+    def test_respects_lower_bound(self):
+        limit = AdaptiveLimit(initial_limit=10, min_limit=3, algorithm="aimd", backoff_ratio=0.5)
+        limit.update(0.01, inflight=10)
+        for scale in range(2, 10):
+            limit.update(0.01 * 10 ** scale, inflight=limit.limit)
+        assert limit.limit == 3
+
+    def test_invalid_algorithm(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimit(algorithm="vegas")
+
+
+class TestAdaptiveSemaphore:
+    """Test slots following the adaptive limit."""
+
+    def test_slots_follow_limit(self):
+        semaphore = PredictionSemaphore(max_concurrent=1, adaptive=AdaptiveLimit(initial_limit=1, max_limit=8))
+        assert semaphore.adaptive
+        assert semaphore.acquire_nowait()
+        assert not semaphore.acquire_nowait()
+
+        for _ in range(30):
+            semaphore.record_latency(0.01)
+        assert semaphore.limit > 1
+        assert semaphore.acquire_nowait()
+
+    @pytest.mark.asyncio
+    async def test_queue_admits_waiters_when_limit_grows(self):
+        adaptive = AdaptiveLimit(initial_limit=1, max_limit=8)
+        semaphore = PredictionSemaphore(max_concurrent=1, adaptive=adaptive)
+        queue = AdmissionQueue(semaphore, timeout=5)
+        await queue.acquire()
+        waiters = [asyncio.create_task(queue.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert queue.depth == 2
+
+        for _ in range(30):
+            semaphore.record_latency(0.01)
+        queue.release()
+        await asyncio.gather(*waiters)
+        assert queue.depth == 0
+        assert semaphore.active_predictions == 2
+
+
+def test_config_bounds_validated():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyConfig(min_limit=8, max_limit=4)
+
+
+def test_status_reports_adaptive_limit():
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {
+            "adapter": "records",
+            "max_concurrent_predictions": 2,
+            "adaptive_concurrency": {"enabled": True, "max_limit": 8},
+        },
+    })
+    app = create_app(config)
+
+    with TestClient(app) as client:
+        assert app.state.inference_executor.max_workers == 8
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        assert client.post("/predict", json=payload).status_code == 200
+
+        status = client.get("/status").json()
+        assert status["adaptive_concurrency"] is True
+        assert 1 <= status["concurrency_limit"] <= 8
@@ -0,0 +1,171 @@
+"""Unit tests for queueing admission control."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from mlserver.concurrency_limiter import AdmissionQueue, AsyncPredictionLimiter, PredictionSemaphore
+from mlserver.config import AppConfig, QueueConfig
+from mlserver.server import create_app
+
+
+class TestPredictionSemaphoreEstimates:
+    """Test latency-based wait estimates and Retry-After."""
+
+    def test_no_history(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        assert semaphore.estimated_wait() == 0.0
+        assert semaphore.retry_after() == "1"
+
+    def test_estimate_scales_with_queue_and_slots(self):
+        semaphore = PredictionSemaphore(max_concurrent=2)
+        semaphore.record_latency(4.0)
+        assert semaphore.estimated_wait() == 2.0
+        assert semaphore.estimated_wait(queued=3) == 8.0
+        assert semaphore.retry_after(queued=3) == "8"
+
+    def test_retry_after_is_capped(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        semaphore.record_latency(1000.0)
+        assert semaphore.retry_after() == "60"
+
+    def test_latency_is_smoothed(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        semaphore.record_latency(1.0)
+        semaphore.record_latency(2.0)
+        assert 1.0 < semaphore.mean_latency < 2.0
+
+
+@pytest.mark.asyncio
+class TestAdmissionQueue:
+    """Test waiting, ordering and shedding."""
+
+    async def _hold(self, limiter, started, release, order, name):
+        async with limiter:
+            order.append(name)
+            started.set()
+            await release.wait()
+
+    async def test_waits_for_slot_instead_of_rejecting(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        queue = AdmissionQueue(semaphore, timeout=5)
+        order = []
+        release = asyncio.Event()
+        first = asyncio.create_task(self._hold(AsyncPredictionLimiter(semaphore, queue=queue), asyncio.Event(),
+                                               release, order, "first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(self._hold(AsyncPredictionLimiter(semaphore, queue=queue), asyncio.Event(),
+                                                release, order, "second"))
+        await asyncio.sleep(0.01)
+        assert queue.depth == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert order == ["first", "second"]
+        assert queue.depth == 0
+        assert semaphore.active_predictions == 0
+
+    async def test_priority_ordering(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        queue = AdmissionQueue(semaphore, timeout=5, ordering="priority")
+        order = []
+        release = asyncio.Event()
+        holder = asyncio.create_task(self._hold(AsyncPredictionLimiter(semaphore, queue=queue), asyncio.Event(),
+                                                release, order, "holder"))
+        await asyncio.sleep(0)
+        waiters = []
+        for name, priority in (("low", 0), ("high", 10), ("mid", 5)):
+            limiter = AsyncPredictionLimiter(semaphore, queue=queue, priority=priority)
+            waiters.append(asyncio.create_task(self._hold(limiter, asyncio.Event(), release, order, name)))
+            await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+        assert order == ["holder", "high", "mid", "low"]
+
+    async def test_full_queue_is_shed(self):
+        metrics = Mock()
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        queue = AdmissionQueue(semaphore, max_depth=1, timeout=5, metrics_getter=lambda: metrics)
+        await queue.acquire()
+        waiter = asyncio.create_task(queue.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await queue.acquire()
+        assert exc_info.value.status_code == 503
+        assert "Retry-After" in exc_info.value.headers
+        metrics.track_shed.assert_called_once_with("queue_full")
+
+        queue.release()
+        await waiter
+        queue.release()
+        assert semaphore.active_predictions == 0
+
+    async def test_deadline(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        queue = AdmissionQueue(semaphore, timeout=0.01)
+        await queue.acquire()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await queue.acquire()
+        assert exc_info.value.status_code == 503
+        assert queue.depth == 0
+
+        queue.release()
+        assert semaphore.active_predictions == 0
+
+    async def test_estimated_wait_shedding(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        semaphore.record_latency(10.0)
+        queue = AdmissionQueue(semaphore, timeout=5, max_estimated_wait=5.0)
+        await queue.acquire()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await queue.acquire()
+        assert exc_info.value.headers["Retry-After"] == "10"
+        queue.release()
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        semaphore = PredictionSemaphore(max_concurrent=1)
+        queue = AdmissionQueue(semaphore, timeout=5)
+        await queue.acquire()
+        waiter = asyncio.create_task(queue.acquire())
+        await asyncio.sleep(0)
+        assert queue.depth == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert queue.depth == 0
+
+        queue.release()
+        assert semaphore.active_predictions == 0
+
+
+def test_invalid_ordering_rejected():
+    with pytest.raises(ValueError):
+        QueueConfig(ordering="lifo")
+
+
+def test_queued_app_serves_burst():
+    """With a queue, a burst larger than max_concurrent_predictions is served rather than rejected."""
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "observability": {"metrics": True, "structured_logging": False},
+        "api": {"adapter": "records", "max_concurrent_predictions": 1, "queue": {"enabled": True}},
+    })
+    app = create_app(config)
+    payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+
+    with TestClient(app) as client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(lambda _: client.post("/predict", json=payload), range(8)))
+        assert [r.status_code for r in responses] == [200] * 8
+
+        status = client.get("/status").json()
+        assert status["queue_depth"] == 0
@@ -0,0 +1,184 @@
+"""Unit tests for memory-mapped artifact loading."""
+import json
+import pickle
+import sys
+import threading
+
+import joblib
+import numpy as np
+import pytest
+import yaml
+
+from mlserver import artifacts as artifacts_module
+from mlserver.artifacts import ArtifactError, load_artifact, load_artifacts
+from mlserver.config import PredictorConfig
+from mlserver.predictor_loader import load_predictor
+
+
+@pytest.fixture
+def weights():
+    return np.arange(12, dtype=np.float32).reshape(3, 4)
+
+
+class TestLoadArtifact:
+    """Test loading single artifacts."""
+
+    def test_npy_is_memory_mapped(self, tmp_path, weights):
+        path = tmp_path / "weights.npy"
+        np.save(path, weights)
+        loaded = load_artifact(str(path))
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        np.testing.assert_array_equal(loaded, weights)
+
+    def test_npy_heap_load(self, tmp_path, weights):
+        path = tmp_path / "weights.npy"
+        np.save(path, weights)
+        loaded = load_artifact(str(path), mmap=False)
+        assert not isinstance(loaded, np.memmap)
+
+    def test_joblib_arrays_are_memory_mapped(self, tmp_path, weights):
+        path = tmp_path / "model.joblib"
+        joblib.dump({"coef": weights, "name": "linear"}, path)
+        loaded = load_artifact(str(path))
+        assert isinstance(loaded["coef"], np.memmap)
+        assert loaded["name"] == "linear"
+
+    def test_pickle(self, tmp_path):
+        path = tmp_path / "encoders.pkl"
+        path.write_bytes(pickle.dumps({"sex": ["male", "female"]}))
+        assert load_artifact(str(path)) == {"sex": ["male", "female"]}
+
+    def test_unknown_extension(self, tmp_path):
+        path = tmp_path / "model.bin"
+        path.write_bytes(b"")
+        with pytest.raises(ArtifactError):
+            load_artifact(str(path))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_artifact(str(tmp_path / "missing.npy"))
+
+    def test_size_limit_only_for_heap_loads(self, tmp_path, weights, monkeypatch):
+        monkeypatch.setattr(artifacts_module, "HEAP_FILE_SIZE_LIMIT_MB", 0)
+        path = tmp_path / "weights.npy"
+        np.save(path, weights)
+
+        assert load_artifact(str(path)) is not None
+        with pytest.raises(ValueError, match="too large"):
+            load_artifact(str(path), mmap=False)
+
+
+class TestLoadArtifacts:
+    """Test inline artifact mappings and manifests."""
+
+    def test_inline_mapping_relative_to_config_dir(self, tmp_path, weights):
+        np.save(tmp_path / "weights.npy", weights)
+        loaded = load_artifacts({"weights": "weights.npy"}, config_dir=str(tmp_path))
+        np.testing.assert_array_equal(loaded["weights"], weights)
+
+    def test_manifest(self, tmp_path, weights):
+        model_dir = tmp_path / "models"
+        model_dir.mkdir()
+        np.save(model_dir / "weights.npy", weights)
+        joblib.dump({"coef": weights}, model_dir / "model.joblib")
+        (model_dir / "artifacts.yaml").write_text(yaml.safe_dump({
+            "artifacts": {
+                "weights": "weights.npy",
+                "model": {"path": "model.joblib", "mmap": False},
+            }
+        }))
+
+        loaded = load_artifacts("models/artifacts.yaml", config_dir=str(tmp_path))
+        assert isinstance(loaded["weights"], np.memmap)
+        assert not isinstance(loaded["model"]["coef"], np.memmap)
+
+    def test_json_manifest(self, tmp_path, weights):
+        np.save(tmp_path / "weights.npy", weights)
+        manifest = tmp_path / "artifacts.json"
+        manifest.write_text(json.dumps({"artifacts": {"weights": {"path": "weights.npy", "format": "npy"}}}))
+        assert "weights" in load_artifacts(str(manifest))
+
+    def test_invalid_manifest(self, tmp_path):
+        manifest = tmp_path / "artifacts.yaml"
+        manifest.write_text("model: model.joblib\n")
+        with pytest.raises(ArtifactError):
+            load_artifacts(str(manifest))
+
+    def test_config_specs(self, tmp_path, weights):
+        np.save(tmp_path / "weights.npy", weights)
+        config = PredictorConfig(
+            module="m", class_name="C",
+            artifacts={"weights": {"path": "weights.npy", "mmap": True}}
+        )
+        loaded = load_artifacts(config.artifacts, config_dir=str(tmp_path))
+        assert isinstance(loaded["weights"], np.memmap)
+
+    def test_config_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            PredictorConfig(module="m", class_name="C", artifacts={"w": {"path": "w.bin", "format": "onnx"}})
+
+
+def test_load_predictor_passes_artifacts(tmp_path, weights):
+    np.save(tmp_path / "weights.npy", weights)
+    module = tmp_path / "artifact_predictor.py"
+    module.write_text(
+        "class ArtifactPredictor:\n"
+        "    def __init__(self, weights, threshold=0.5):\n"
+        "        self.weights = weights\n"
+        "        self.threshold = threshold\n"
+    )
+
+    predictor = load_predictor(
+        "artifact_predictor.py", "ArtifactPredictor", {"threshold": 0.7},
+        config_dir=str(tmp_path), artifacts={"weights": "weights.npy"}
+    )
+    assert isinstance(predictor.weights, np.memmap)
+    assert predictor.threshold == 0.7
+
+
+def test_several_artifacts_load_concurrently(tmp_path, weights, monkeypatch):
+    threads = set()
+    original = artifacts_module.load_artifact
+
+    def recording_load(**kwargs):
+        threads.add(threading.current_thread().name)
+        return original(**kwargs)
+
+    monkeypatch.setattr(artifacts_module, "load_artifact", recording_load)
+    for i in range(3):
+        np.save(tmp_path / f"w{i}.npy", weights * i)
+
+    loaded = load_artifacts({f"w{i}": f"w{i}.npy" for i in range(3)}, str(tmp_path))
+
+    assert list(loaded) == ["w0", "w1", "w2"]
+    np.testing.assert_array_equal(loaded["w2"], weights * 2)
+    assert all(name.startswith("mlserver-artifact") for name in threads)
+
+
+def test_pickled_artifact_can_use_project_classes(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    (tmp_path / "project_transforms.py").write_text(
+        "class Scale:\n"
+        "    def __init__(self, factor):\n"
+        "        self.factor = factor\n"
+    )
+    (tmp_path / "project_predictor.py").write_text(
+        "import project_transforms\n"
+        "\n"
+        "class ProjectPredictor:\n"
+        "    def __init__(self, scale):\n"
+        "        self.scale = scale\n"
+    )
+    # Pickle an instance of the project class, then forget where it came from
+    sys.path.insert(0, str(tmp_path))
+    import project_transforms
+    (tmp_path / "scale.pkl").write_bytes(pickle.dumps(project_transforms.Scale(3)))
+    sys.path.remove(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "project_transforms")
+
+    predictor = load_predictor(
+        "project_predictor.py", "ProjectPredictor", {},
+        config_dir=str(tmp_path), artifacts={"scale": "scale.pkl"}
+    )
+    assert predictor.scale.factor == 3
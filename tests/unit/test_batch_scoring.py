@@ -0,0 +1,141 @@
+"""Unit tests for offline batch scoring (mlserver score)."""
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from mlserver.adapters import AdapterError
+from mlserver.batch_scoring import ChunkScorer, detect_format, iter_chunks, score_file
+from mlserver.cli import app
+from mlserver.config import AppConfig
+
+FEATURES = ["f1", "f2", "f3", "f4", "f5"]
+
+
+class SumPredictor:
+    """Deterministic predictor: the row sum."""
+
+    def predict(self, X):
+        return X.astype(float).sum(axis=1)
+
+    def predict_proba(self, X):
+        p = np.full(len(X), 0.25)
+        return np.column_stack([p, 1 - p])
+
+
+def _config(**api):
+    return AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": FEATURES, "input_dtype": "float64", **api},
+    })
+
+
+@pytest.fixture
+def input_frame():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.random((250, 5)), columns=FEATURES)
+    frame.insert(0, "id", np.arange(250))
+    return frame
+
+
+class TestChunkScorer:
+    """Test scoring a single chunk."""
+
+    def test_uses_feature_order(self, input_frame):
+        scorer = ChunkScorer(feature_order=["f2", "f1"], input_dtype="float64")
+        X = scorer.to_ndarray(input_frame)
+        assert X.dtype == np.float64
+        np.testing.assert_array_equal(X[:, 0], input_frame["f2"])
+
+    def test_columns_sorted_without_feature_order(self):
+        # The API's records adapter orders features by name; offline scoring must match
+        frame = pd.DataFrame({"b": [2.0], "c": [3.0], "a": [1.0]})
+        X = ChunkScorer(input_dtype="float64").to_ndarray(frame)
+        np.testing.assert_array_equal(X, [[1.0, 2.0, 3.0]])
+
+    def test_keep_columns_excluded_from_features(self, input_frame):
+        scored = ChunkScorer(keep_columns=["id"], input_dtype="float64")(SumPredictor(), input_frame)
+        assert list(scored.columns) == ["id", "prediction"]
+        np.testing.assert_allclose(scored["prediction"], input_frame[FEATURES].sum(axis=1))
+
+    def test_proba_columns(self, input_frame):
+        scored = ChunkScorer(method="predict_proba", feature_order=FEATURES)(SumPredictor(), input_frame)
+        assert list(scored.columns) == ["probability_0", "probability_1"]
+
+    def test_missing_feature(self, input_frame):
+        with pytest.raises(AdapterError):
+            ChunkScorer(feature_order=FEATURES + ["f6"]).to_ndarray(input_frame)
+
+
+def test_detect_format():
+    assert detect_format("data.CSV") == "csv"
+    assert detect_format("data.jsonl") == "ndjson"
+    with pytest.raises(ValueError):
+        detect_format("data.xlsx")
+
+
+def test_iter_chunks_bounds_rows(tmp_path, input_frame):
+    path = tmp_path / "input.csv"
+    input_frame.to_csv(path, index=False)
+    assert [len(c) for c in iter_chunks(path, 100)] == [100, 100, 50]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".ndjson"])
+def test_score_file_round_trip(tmp_path, input_frame, suffix):
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / f"output{suffix}"
+    input_frame.to_csv(input_path, index=False)
+    progress = []
+
+    summary = score_file(_config(), input_path, output_path, chunk_size=100,
+                         keep_columns=["id"], progress=progress.append)
+
+    assert summary.rows == 250
+    assert summary.chunks == 3
+    assert progress == [100, 100, 50]
+    output = pd.read_csv(output_path) if suffix == ".csv" else pd.read_json(output_path, lines=True)
+    assert output["id"].tolist() == list(range(250))
+    assert "prediction" in output.columns
+
+
+def test_score_file_with_worker_processes(tmp_path, input_frame):
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    input_frame.to_parquet(input_path, index=False)
+
+    summary = score_file(_config(), input_path, output_path, chunk_size=40, workers=2, keep_columns=["id"])
+
+    output = pd.read_parquet(output_path)
+    assert summary.rows == 250
+    assert output["id"].tolist() == list(range(250))
+
+
+def test_score_file_rejects_oversized_chunks(tmp_path):
+    with pytest.raises(ValueError):
+        score_file(_config(), tmp_path / "in.csv", tmp_path / "out.csv", chunk_size=10 ** 9)
+
+
+def test_score_command(tmp_path, input_frame):
+    config_path = tmp_path / "mlserver.yaml"
+    config_path.write_text(yaml.safe_dump({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"feature_order": FEATURES},
+    }))
+    input_path = tmp_path / "input.csv"
+    input_frame.to_csv(input_path, index=False)
+    output_path = tmp_path / "scored.csv"
+
+    result = CliRunner().invoke(app, [
+        "score", str(input_path), str(output_path),
+        "--config", str(config_path), "--chunk-size", "100", "--proba", "--keep", "id",
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert "rows/sec" in result.output
+    output = pd.read_csv(output_path)
+    assert len(output) == 250
+    assert list(output.columns) == ["id", "probability_0", "probability_1"]
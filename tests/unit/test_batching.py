@@ -0,0 +1,165 @@
+"""Unit tests for the micro-batching scheduler."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.batching import MicroBatcher, BatchingError, _split_rows
+from mlserver.config import AppConfig
+from mlserver.server import create_app
+
+
+class RecordingPredictor:
+    """Predictor that records the shape of every call."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def predict(self, X):
+        with self._lock:
+            self.calls.append(X.shape)
+        return X[:, 0].astype(float) * 10
+
+    def predict_proba(self, X):
+        with self._lock:
+            self.calls.append(X.shape)
+        p = X[:, 0].astype(float) / 100
+        return np.column_stack([1 - p, p])
+
+
+@pytest.fixture
+def predictor():
+    return RecordingPredictor()
+
+
+class TestMicroBatcher:
+    """Test batching and scattering behaviour."""
+
+    def test_single_request(self, predictor):
+        batcher = MicroBatcher(predictor, max_batch_size=8, max_wait_ms=1)
+        try:
+            result = batcher.submit("predict", np.array([[3.0, 1.0]]))
+            assert result.tolist() == [30.0]
+        finally:
+            batcher.close()
+
+    def test_concurrent_requests_are_batched(self, predictor):
+        batcher = MicroBatcher(predictor, max_batch_size=16, max_wait_ms=200)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = [
+                    pool.submit(batcher.submit, "predict", np.array([[float(i), 0.0]]))
+                    for i in range(8)
+                ]
+                results = [f.result() for f in futures]
+
+            # Every caller receives its own row back
+            assert [r.tolist() for r in results] == [[i * 10.0] for i in range(8)]
+            # Fewer predictor calls than requests
+            assert len(predictor.calls) < 8
+            assert sum(shape[0] for shape in predictor.calls) == 8
+        finally:
+            batcher.close()
+
+    def test_batch_size_is_capped(self, predictor):
+        batcher = MicroBatcher(predictor, max_batch_size=2, max_wait_ms=200)
+        try:
+            futures = [batcher.submit_async("predict", np.array([[float(i), 0.0]])) for i in range(5)]
+            results = [f.result(timeout=5) for f in futures]
+            assert [r.tolist() for r in results] == [[i * 10.0] for i in range(5)]
+            assert all(shape[0] <= 2 for shape in predictor.calls)
+        finally:
+            batcher.close()
+
+    def test_methods_are_not_mixed(self, predictor):
+        batcher = MicroBatcher(predictor, max_batch_size=16, max_wait_ms=100)
+        try:
+            f1 = batcher.submit_async("predict", np.array([[50.0, 0.0]]))
+            f2 = batcher.submit_async("predict_proba", np.array([[50.0, 0.0]]))
+            assert f1.result(timeout=5).tolist() == [500.0]
+            assert f2.result(timeout=5).tolist() == [[0.5, 0.5]]
+        finally:
+            batcher.close()
+
+    def test_errors_propagate_to_all_callers(self):
+        failing = Mock()
+        failing.predict.side_effect = ValueError("boom")
+        batcher = MicroBatcher(failing, max_batch_size=16, max_wait_ms=100)
+        try:
+            futures = [batcher.submit_async("predict", np.array([[1.0]])) for _ in range(3)]
+            for f in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    f.result(timeout=5)
+        finally:
+            batcher.close()
+
+    def test_submit_after_close_raises(self, predictor):
+        batcher = MicroBatcher(predictor)
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit("predict", np.array([[1.0]]))
+
+    def test_tracks_batch_metrics(self, predictor):
+        metrics = Mock()
+        batcher = MicroBatcher(predictor, max_batch_size=4, max_wait_ms=1, metrics_getter=lambda: metrics)
+        try:
+            batcher.submit("predict", np.array([[1.0], [2.0]]))
+        finally:
+            batcher.close()
+        metrics.track_batch.assert_called_once()
+        method, size, waits = metrics.track_batch.call_args[0]
+        assert method == "predict"
+        assert size == 2
+        assert len(waits) == 1
+
+
+class TestSplitRows:
+    """Test scattering of batched results."""
+
+    def test_split_ndarray(self):
+        parts = _split_rows(np.arange(5), [2, 3])
+        assert [p.tolist() for p in parts] == [[0, 1], [2, 3, 4]]
+
+    def test_split_list(self):
+        assert _split_rows(["a", "b", "c"], [1, 2]) == [["a"], ["b", "c"]]
+
+    def test_length_mismatch(self):
+        with pytest.raises(BatchingError):
+            _split_rows(np.arange(4), [2, 3])
+
+    def test_unsplittable_output(self):
+        with pytest.raises(BatchingError):
+            _split_rows({"a": 1}, [1, 1])
+
+
+def test_batched_app_predicts():
+    """The server routes predictions through the batcher when enabled."""
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "observability": {"metrics": True, "structured_logging": False},
+        "api": {
+            "adapter": "records",
+            "max_concurrent_predictions": 8,
+            "batching": {"enabled": True, "max_batch_size": 8, "max_wait_ms": 2},
+        },
+    })
+    app = create_app(config)
+
+    with TestClient(app) as client:
+        assert app.state.batcher is not None
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        response = client.post("/predict", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["predictions"]) == 1
+
+        response = client.post("/predict_proba", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["probabilities"]) == 1
+
+        metrics_text = client.get("/metrics").text
+        assert "mlserver_batch_size" in metrics_text
@@ -0,0 +1,152 @@
+"""Unit tests for the prediction benchmark (mlserver bench)."""
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from mlserver.bench import bench_payload, compare_results, run_benchmark, summarize
+from mlserver.cli import app
+from mlserver.config import AppConfig
+
+FEATURES = ["f1", "f2", "f3", "f4", "f5"]
+
+
+class ZeroPredictor:
+    def predict(self, X):
+        return np.zeros(len(X))
+
+    def predict_proba(self, X):
+        return np.tile([0.5, 0.5], (len(X), 1))
+
+
+def _config(**api):
+    return AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": FEATURES, **api},
+        "observability": {"metrics": False},
+    })
+
+
+def test_bench_payload_formats():
+    assert bench_payload(["a", "b"], "records", 2) == {"records": [{"a": 0.0, "b": 0.0}] * 2}
+    assert bench_payload(["a", "b"], "ndarray", 2) == {"ndarray": [[0.0, 0.0]] * 2}
+    assert bench_payload(["a", "b"], "columns", 2, {"b": "category"}) == {"columns": {"a": [0.0, 0.0], "b": ["0", "0"]}}
+
+
+def test_summarize():
+    latencies = [0.001] * 990 + [0.010] * 10
+    result = summarize("asgi", "records", "json", 10, latencies, errors=0, seconds=2.0,
+                       stage_totals={"predict": 500.0})
+
+    assert result.key == "asgi/records/json/batch=10"
+    assert (result.requests_per_second, result.rows_per_second) == (500.0, 5000.0)
+    assert result.p50_ms == pytest.approx(1.0)
+    assert result.p999_ms == pytest.approx(10.0)
+    assert result.stages_ms == {"predict": 0.5}
+
+
+def test_compare_results():
+    baseline = {"results": [
+        {"key": "asgi/records/json/batch=1", "requests_per_second": 1000.0, "p99_ms": 2.0},
+        {"key": "http/records/json/batch=1", "requests_per_second": 500.0, "p99_ms": 4.0},
+    ]}
+    results = [
+        summarize("asgi", "records", "json", 1, [0.0025] * 100, 0, 0.1, {}),  # p99 2.5 ms
+        summarize("http", "records", "json", 1, [0.004] * 100, 0, 0.21, {}),  # 476 req/s, within 10%
+        summarize("asgi", "ndarray", "json", 1, [0.1] * 100, 0, 10.0, {}),  # not in the baseline
+    ]
+
+    regressions = compare_results(results, baseline, tolerance=0.10)
+
+    assert [(r.key, r.metric) for r in regressions] == [("asgi/records/json/batch=1", "p99_ms")]
+    assert regressions[0].change == pytest.approx(0.25)
+    assert compare_results(results, baseline, tolerance=0.5) == []
+
+
+def test_run_benchmark_over_asgi_and_http():
+    results = asyncio.run(run_benchmark(
+        _config(), transports=["asgi", "http"], adapters=["records", "ndarray"], batch_sizes=[3],
+        response_formats=["json", "npy"], requests=20, warmup=2, predictor=ZeroPredictor()
+    ))
+
+    assert [result.key for result in results] == [
+        f"{transport}/{adapter}/{response_format}/batch=3"
+        for adapter in ("records", "ndarray") for transport in ("asgi", "http") for response_format in ("json", "npy")
+    ]
+    assert all(result.requests == 20 and result.errors == 0 for result in results)
+    assert all("predict" in result.stages_ms for result in results)
+
+
+def test_run_benchmark_bypasses_the_prediction_cache():
+    class CountingPredictor(ZeroPredictor):
+        calls = 0
+
+        def predict(self, X):
+            CountingPredictor.calls += 1
+            return super().predict(X)
+
+    results = asyncio.run(run_benchmark(
+        _config(cache={"enabled": True}), transports=["asgi"], adapters=["records"], batch_sizes=[1],
+        requests=20, warmup=2, predictor=CountingPredictor()
+    ))
+
+    assert results[0].errors == 0
+    assert CountingPredictor.calls == 22
+
+
+def test_run_benchmark_leaves_a_shared_predictor_open():
+    class ClosablePredictor(ZeroPredictor):
+        closed = False
+
+        def predict(self, X):
+            assert not self.closed, "predicting on a closed model"
+            return super().predict(X)
+
+        def close(self):
+            self.closed = True
+
+    predictor = ClosablePredictor()
+    results = asyncio.run(run_benchmark(
+        _config(), transports=["asgi"], adapters=["records", "ndarray"], batch_sizes=[1],
+        requests=5, warmup=0, predictor=predictor
+    ))
+
+    assert [result.errors for result in results] == [0, 0]
+    assert not predictor.closed
+
+
+def test_run_benchmark_rejects_unknown_cases():
+    with pytest.raises(ValueError, match="Unknown adapter"):
+        asyncio.run(run_benchmark(_config(), adapters=["csv"], predictor=ZeroPredictor()))
+    with pytest.raises(ValueError, match="feature_order"):
+        asyncio.run(run_benchmark(_config(feature_order=None), predictor=ZeroPredictor()))
+
+
+def test_bench_command_baseline(tmp_path):
+    config_path = tmp_path / "mlserver.yaml"
+    config_path.write_text(yaml.safe_dump({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"feature_order": FEATURES},
+        "observability": {"metrics": False},
+    }))
+    args = ["bench", "--config", str(config_path), "-t", "asgi", "-a", "records", "-b", "1", "-n", "20"]
+    output_path = tmp_path / "results.json"
+
+    result = CliRunner().invoke(app, [*args, "--output", str(output_path)])
+    assert result.exit_code == 0, result.output
+    document = json.loads(output_path.read_text())
+    assert document["settings"]["requests"] == 20
+    assert [entry["key"] for entry in document["results"]] == ["asgi/records/json/batch=1"]
+
+    # A baseline far faster than anything achievable fails the run
+    document["results"][0]["requests_per_second"] = 1e9
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(document))
+    result = CliRunner().invoke(app, [*args, "--baseline", str(baseline_path)])
+    assert result.exit_code == 1
+    assert "regression" in result.output
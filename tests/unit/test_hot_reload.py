@@ -0,0 +1,143 @@
+"""Unit tests for hot model reload."""
+import os
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.hot_reload import ModelGenerations, file_fingerprint
+from mlserver.server import create_app
+from tests.fixtures.mock_predictor import FileValuePredictor
+
+TOKEN = "s3cret"
+AUTH = {"Authorization": f"Bearer {TOKEN}"}
+PAYLOAD = {"payload": {"records": [{"f1": 1.0, "f2": 2.0}]}}
+
+
+def _write_model(path, value):
+    # Write-and-rename, as a deployment would, with a distinct mtime
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(str(value))
+    stamp = time.time_ns() + 1_000_000_000
+    os.utime(tmp, ns=(stamp, stamp))
+    os.replace(tmp, path)
+
+
+def _app(model_path, **reload):
+    config = AppConfig.model_validate({
+        "predictor": {
+            "module": "tests.fixtures.mock_predictor",
+            "class_name": "FileValuePredictor",
+            "init_kwargs": {"model_path": str(model_path)},
+        },
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {
+            "adapter": "records",
+            "feature_order": ["f1", "f2"],
+            "reload": {"enabled": True, **reload},
+            "admin": {"token": TOKEN},
+        },
+    })
+    return create_app(config)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model.txt"
+    _write_model(path, 1)
+    return path
+
+
+def test_reload_swaps_model(model_path):
+    with TestClient(_app(model_path)) as client:
+        assert client.post("/predict", json=PAYLOAD).json()["predictions"] == [1.0]
+        version = client.get("/status").json()["model_version"]
+
+        _write_model(model_path, 2)
+        response = client.post("/admin/reload", headers=AUTH)
+        assert response.status_code == 200
+        assert response.json()["result"] == "success"
+
+        assert client.post("/predict", json=PAYLOAD).json()["predictions"] == [2.0]
+        status = client.get("/status").json()
+        assert status["reloads"] == 1
+        assert status["model_version"] != version
+        assert 1.0 in FileValuePredictor.closed
+
+
+def test_failed_reload_keeps_current_model(model_path):
+    with TestClient(_app(model_path)) as client:
+        client.post("/predict", json=PAYLOAD)
+        with open(model_path, "w") as f:
+            f.write("not a number")
+
+        assert client.post("/admin/reload", headers=AUTH).status_code == 500
+        assert client.post("/predict", json=PAYLOAD).json()["predictions"] == [1.0]
+        assert client.get("/status").json()["last_reload"]["result"] == "failure"
+
+
+def test_reload_warms_up_with_synthetic_rows(model_path):
+    app = _app(model_path)
+    with TestClient(app) as client:
+        client.post("/predict", json=PAYLOAD)
+        sample = app.state.reloader._sample
+        assert sample.shape == (16, 2)
+        assert not sample.any()  # no request data kept
+
+
+def test_reload_requires_token(model_path):
+    with TestClient(_app(model_path)) as client:
+        assert client.post("/admin/reload").status_code == 401
+        assert client.post("/admin/reload", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_reload_disabled_without_configured_token(model_path, monkeypatch):
+    monkeypatch.delenv("MLSERVER_ADMIN_TOKEN", raising=False)
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "FileValuePredictor",
+                      "init_kwargs": {"model_path": str(model_path)}},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"reload": {"enabled": True}},
+    })
+    with TestClient(create_app(config)) as client:
+        assert client.post("/admin/reload", headers=AUTH).status_code == 403
+
+
+def test_watch_reloads_on_file_change(model_path):
+    with TestClient(_app(model_path, watch=True, poll_interval_seconds=0.05)) as client:
+        _write_model(model_path, 3)
+        deadline = time.time() + 5
+        while time.time() < deadline and client.get("/status").json()["reloads"] == 0:
+            time.sleep(0.05)
+        assert client.post("/predict", json=PAYLOAD).json()["predictions"] == [3.0]
+
+
+def test_fingerprint_tracks_file_changes(model_path):
+    before = file_fingerprint([str(model_path)])
+    _write_model(model_path, 5)
+    assert file_fingerprint([str(model_path)]) != before
+
+
+def test_swap_drains_leases_on_previous_state():
+    generations = ModelGenerations({"name": "old"})
+    installed = {}
+    release = threading.Event()
+
+    def predict():
+        with generations.lease():
+            release.wait()
+
+    worker = threading.Thread(target=predict)
+    worker.start()
+    time.sleep(0.05)
+
+    old = generations.swap({"name": "new"}, installed.update)
+    assert installed == {"name": "new"}
+    assert not generations.drain(old, timeout=0.05)
+
+    release.set()
+    worker.join()
+    assert generations.drain(old, timeout=1)
@@ -0,0 +1,98 @@
+"""Unit tests for the dedicated inference executor and async limiter."""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from mlserver.concurrency_limiter import AsyncPredictionLimiter, PredictionSemaphore
+from mlserver.config import AppConfig
+from mlserver.inference import InferenceExecutor, run_inference
+from mlserver.logging_conf import correlation_id_var
+from mlserver.server import create_app
+
+
+@pytest.mark.asyncio
+class TestInferenceExecutor:
+    """Test running work on the inference threads."""
+
+    async def test_runs_on_dedicated_thread(self):
+        executor = InferenceExecutor(max_workers=2)
+        try:
+            name = await executor.run(lambda: threading.current_thread().name)
+            assert name.startswith("mlserver-inference")
+        finally:
+            executor.shutdown()
+
+    async def test_propagates_context(self):
+        executor = InferenceExecutor()
+        token = correlation_id_var.set("req-123")
+        try:
+            assert await executor.run(correlation_id_var.get) == "req-123"
+        finally:
+            correlation_id_var.reset(token)
+            executor.shutdown()
+
+    async def test_propagates_exceptions(self):
+        executor = InferenceExecutor()
+
+        def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                await executor.run(fail)
+        finally:
+            executor.shutdown()
+
+    async def test_cancellation_waits_for_worker(self):
+        executor = InferenceExecutor()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def slow():
+            started.set()
+            finished.wait(0.2)
+            finished.set()
+
+        try:
+            task = asyncio.create_task(executor.run(slow))
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert finished.is_set()
+        finally:
+            executor.shutdown()
+
+    async def test_falls_back_to_threadpool(self):
+        assert await run_inference(None, lambda x: x * 2, 21) == 42
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_rejects_when_busy():
+    semaphore = PredictionSemaphore(max_concurrent=1)
+    async with AsyncPredictionLimiter(semaphore):
+        assert semaphore.active_predictions == 1
+        with pytest.raises(HTTPException) as exc_info:
+            async with AsyncPredictionLimiter(semaphore):
+                pass
+        assert exc_info.value.status_code == 503
+    assert semaphore.active_predictions == 0
+
+
+def test_app_uses_inference_executor():
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "max_concurrent_predictions": 4, "inference_workers": 2},
+    })
+    app = create_app(config)
+
+    with TestClient(app) as client:
+        assert app.state.inference_executor.max_workers == 2
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        response = client.post("/predict", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["predictions"]) == 1
@@ -0,0 +1,54 @@
+"""Unit tests for the metadata snapshot served by /info and prediction responses."""
+import dataclasses
+import os
+import subprocess
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver import auto_detect
+from mlserver.auto_detect import capture_metadata, get_git_info
+from mlserver.config import AppConfig
+from mlserver.server import create_app
+
+PAYLOAD = {"payload": {"records": [{"f1": 1.0, "f2": 2.0}]}}
+
+
+def _config():
+    return AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": ["f1", "f2"]},
+    })
+
+
+def test_snapshot_is_immutable(tmp_path):
+    snapshot = capture_metadata(str(tmp_path))
+    assert snapshot.project == tmp_path.name.lower()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.project = "other"
+    with pytest.raises(TypeError):
+        snapshot.git["commit"] = "abc"
+
+
+def test_git_info_does_not_change_directory(tmp_path, monkeypatch):
+    def fail_chdir(path):
+        raise AssertionError("os.chdir is process-wide")
+
+    monkeypatch.setattr(os, "chdir", fail_chdir)
+    assert get_git_info(str(tmp_path))["commit"] is None
+
+
+def test_requests_do_not_run_metadata_detection(monkeypatch):
+    with TestClient(create_app(_config())) as client:
+        first = client.get("/info").json()
+        calls = []
+        monkeypatch.setattr(subprocess, "check_output", lambda *a, **k: calls.append(a))
+        monkeypatch.setattr(auto_detect, "get_mlserver_package_version", lambda: calls.append("version"))
+
+        assert client.get("/info").json()["deployed_at"] == first["deployed_at"]
+        prediction = client.post("/predict", json=PAYLOAD).json()
+
+    assert calls == []
+    assert prediction["metadata"]["deployed_at"] == first["deployed_at"]
+    assert prediction["metadata"]["classifier"] == "test-classifier"
@@ -2,9 +2,13 @@ import pytest
 import time
 from unittest.mock import Mock, MagicMock
 from fastapi import Request, Response
-from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client import REGISTRY, CollectorRegistry, values
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.parser import text_string_to_metric_families
 
-from mlserver.metrics import MetricsCollector, init_metrics, get_metrics
+from mlserver.metrics import (
+    MULTIPROC_DIR_ENV, OTHER_LABEL, MetricsCollector, init_metrics, get_metrics, mark_worker_dead, setup_multiprocess_metrics
+)
 
 
 @pytest.fixture(autouse=True)
@@ -184,6 +188,46 @@ class TestMetricsCollector:
         assert b"batch_predict" in metrics_output
 
 
+class TestRequestSeries:
+    """Test bounded request labels and pre-bound series"""
+
+    def test_labels_are_bounded(self):
+        collector = MetricsCollector("TestModel")
+        collector.observe_request("BREW", OTHER_LABEL, 418, 0.01)
+        collector.observe_request("GET", OTHER_LABEL, 404, 0.01)
+
+        output = collector.generate_metrics().decode()
+        assert 'method="other",model="TestModel",status_code="4xx"' in output
+        assert 'method="GET",model="TestModel",status_code="404"' in output
+        assert "BREW" not in output and '"418"' not in output
+
+    def test_series_bound_once(self):
+        collector = MetricsCollector("TestModel")
+        for _ in range(3):
+            collector.observe_request("POST", "/predict", 200, 0.01)
+        assert list(collector._request_series) == [("POST", "/predict", 200)]
+
+    def test_bind_endpoints_at_startup(self):
+        collector = MetricsCollector("TestModel")
+        collector.bind_endpoints([("/predict", {"POST"}), ("/info", {"GET", "HEAD"})])
+
+        assert set(collector._request_series) == {
+            ("POST", "/predict", 200), ("GET", "/info", 200), ("HEAD", "/info", 200), ("GET", OTHER_LABEL, 404)
+        }
+        output = collector.generate_metrics().decode()
+        assert 'endpoint="/predict",method="POST",model="TestModel",status_code="200"} 0.0' in output
+
+    def test_for_model_binds_its_own_series(self):
+        collector = MetricsCollector("TestModel")
+        collector.observe_request("POST", "/predict", 200, 0.01)
+        bound = collector.for_model("other-model")
+        bound.observe_request("POST", "/predict", 200, 0.01)
+
+        output = collector.generate_metrics().decode()
+        assert 'model="other-model",status_code="200"} 1.0' in output
+        assert 'model="TestModel",status_code="200"} 1.0' in output
+
+
 class TestMetricsModule:
     """Test module-level functions"""
 
@@ -306,4 +350,57 @@ class TestMetricsIntegration:
 
         # Should track different status codes
         metrics_output = collector.generate_metrics()
-        assert b"400" in metrics_output or b"422" in metrics_output or b"500" in metrics_output
\ No newline at end of file
+        assert b"400" in metrics_output or b"422" in metrics_output or b"500" in metrics_output
+
+
+class TestMultiprocessMetrics:
+    """Test aggregation of worker metrics in multiprocess mode"""
+
+    @pytest.fixture
+    def multiproc_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(values, "ValueClass", values.ValueClass)
+        (tmp_path / "counter_999.db").write_bytes(b"stale")
+        assert setup_multiprocess_metrics() == str(tmp_path)
+        assert not (tmp_path / "counter_999.db").exists()
+        return tmp_path
+
+    @staticmethod
+    def _worker(pid):
+        """Record one request as worker ``pid`` and leave it active"""
+        values.ValueClass = values.MultiProcessValue(lambda: pid)
+        collector = MetricsCollector("Model")
+        collector.observe_request("POST", "/predict", 200, 0.01)
+        collector.inc_active_requests()
+        for metric in [*vars(collector).values(), *collector.stage_duration.values()]:
+            if isinstance(metric, MetricWrapperBase):
+                REGISTRY.unregister(metric)
+        return collector
+
+    @staticmethod
+    def _samples(collector):
+        families = text_string_to_metric_families(collector.generate_metrics().decode())
+        return {
+            (sample.name, sample.labels.get("status_code")): sample.value
+            for family in families for sample in family.samples
+            if sample.labels.get("model") == "Model"
+        }
+
+    def test_scrape_aggregates_all_workers(self, multiproc_dir):
+        self._worker(101)
+        collector = self._worker(102)
+
+        samples = self._samples(collector)
+        assert samples[("mlserver_requests_total", "200")] == 2
+        assert samples[("mlserver_request_duration_seconds_count", None)] == 2
+        assert samples[("mlserver_active_requests", None)] == 2
+
+    def test_dead_worker_drops_live_gauges_only(self, multiproc_dir):
+        self._worker(101)
+        collector = self._worker(102)
+        mark_worker_dead(101)
+
+        samples = self._samples(collector)
+        assert samples[("mlserver_active_requests", None)] == 1
+        assert samples[("mlserver_requests_total", "200")] == 2
+
@@ -0,0 +1,133 @@
+"""Unit tests for serving several classifiers from one process."""
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.multi_classifier import MultiClassifierConfig
+from mlserver import server
+from mlserver.multi_model import ModelRegistry, build_model_configs, create_multi_model_app
+
+PAYLOAD = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+
+
+def _classifier(name, **api):
+    return {
+        "classifier": {"name": name, "version": "1.0.0"},
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "api": {"adapter": "records", "max_concurrent_predictions": 2, **api},
+    }
+
+
+def _multi_config(names=("alpha", "beta", "gamma"), **serving):
+    return MultiClassifierConfig.model_validate({
+        "repository": {"name": "test-repo"},
+        "classifiers": {name: _classifier(name) for name in names},
+        "serving": serving,
+    })
+
+
+def _client(multi_config):
+    return TestClient(create_multi_model_app(multi_config, build_model_configs(multi_config, ".")))
+
+
+def test_routes_by_classifier_and_loads_at_startup():
+    with _client(_multi_config()) as client:
+        assert client.get("/healthz").json()["models"] == ["alpha", "beta", "gamma"]
+        for name in ("alpha", "beta", "gamma"):
+            response = client.post(f"/{name}/predict", json=PAYLOAD)
+            assert response.status_code == 200
+            assert len(response.json()["predictions"]) == 1
+        assert client.post("/delta/predict", json=PAYLOAD).status_code == 404
+
+
+def test_lazy_loading_on_first_request():
+    with _client(_multi_config(lazy_loading=True)) as client:
+        assert client.get("/status").json()["loaded_models"] == 0
+        assert client.post("/beta/predict_proba", json=PAYLOAD).status_code == 200
+
+        models = client.get("/status").json()["models"]
+        assert models["beta"]["loaded"] is True
+        assert models["alpha"]["loaded"] is False
+
+
+def test_lru_unloading_above_max_loaded_models():
+    with _client(_multi_config(lazy_loading=True, max_loaded_models=2)) as client:
+        for name in ("alpha", "beta", "alpha", "gamma"):
+            assert client.post(f"/{name}/predict", json=PAYLOAD).status_code == 200
+
+        # beta was the least recently used model when gamma was loaded
+        assert client.get("/healthz").json()["models"] == ["alpha", "gamma"]
+
+        # An unloaded model is loaded again on its next request
+        assert client.post("/beta/predict", json=PAYLOAD).status_code == 200
+        assert client.get("/status").json()["models"]["beta"]["loads"] == 2
+
+
+def test_per_model_limiters_and_metrics():
+    with _client(_multi_config(names=("alpha", "beta"))) as client:
+        client.post("/alpha/predict", json=PAYLOAD)
+        assert client.get("/alpha/status").json()["max_concurrent_predictions"] == 2
+
+        metrics = client.get("/metrics").text
+        assert 'mlserver_predictions_total{endpoint="/predict",model="alpha"} 1.0' in metrics
+        assert 'mlserver_model_loaded{model="beta"} 1.0' in metrics
+
+
+def test_info_lists_classifier_endpoints():
+    with _client(_multi_config(names=("alpha",))) as client:
+        info = client.get("/info").json()
+        assert info["repository"] == "test-repo"
+        assert info["classifiers"]["alpha"]["endpoints"]["predict"] == "/alpha/predict"
+
+
+def test_failed_load_returns_503():
+    multi_config = _multi_config(names=("alpha",), lazy_loading=True)
+    configs = build_model_configs(multi_config, ".")
+    configs["alpha"].predictor.class_name = "DoesNotExist"
+    with TestClient(create_multi_model_app(multi_config, configs)) as client:
+        assert client.post("/alpha/predict", json=PAYLOAD).status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_busy_models_are_not_unloaded():
+    multi_config = _multi_config(names=("alpha", "beta"), max_loaded_models=1)
+    registry = ModelRegistry(build_model_configs(multi_config, "."), serving=multi_config.serving)
+
+    await registry.acquire("alpha")  # request in flight
+    await registry.acquire("beta")
+    assert registry.loaded_names == ["alpha", "beta"]
+
+    registry.release("alpha")
+    registry.release("beta")
+    await registry.close()
+    assert registry.loaded_names == []
+
+
+@pytest.mark.asyncio
+async def test_loading_does_not_block_the_event_loop(monkeypatch):
+    collect_metadata = server._collect_metadata
+
+    def slow_collect_metadata(*args):
+        time.sleep(0.5)  # e.g. git on a slow filesystem
+        return collect_metadata(*args)
+
+    monkeypatch.setattr(server, "_collect_metadata", slow_collect_metadata)
+    multi_config = _multi_config(names=("alpha",), lazy_loading=True)
+    registry = ModelRegistry(build_model_configs(multi_config, "."), serving=multi_config.serving)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await registry.acquire("alpha")
+    ticker.cancel()
+    assert ticks > 10
+
+    registry.release("alpha")
+    await registry.close()
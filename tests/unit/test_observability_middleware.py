@@ -0,0 +1,93 @@
+"""Unit tests for the pure ASGI request observability middleware."""
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.logging_conf import get_correlation_id
+from mlserver.observability import RequestObservabilityMiddleware
+
+
+def _client(metrics=None, **observability):
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records"},
+        "observability": {"metrics": metrics is not None, **observability},
+    })
+    app = FastAPI()
+
+    @app.get("/echo")
+    def echo():
+        return {"correlation_id": get_correlation_id()}
+
+    @app.get("/fail")
+    def fail():
+        raise HTTPException(status_code=400, detail="bad input")
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.get("/healthz")
+    def healthz():
+        return {"status": "ok"}
+
+    app.add_middleware(RequestObservabilityMiddleware, config=config, metrics_getter=lambda: metrics)
+    return TestClient(app)
+
+
+def test_incoming_request_id_is_reused_and_echoed():
+    client = _client()
+    response = client.get("/echo", headers={"X-Request-ID": "req-123"})
+    assert response.headers["X-Request-ID"] == "req-123"
+    assert response.json()["correlation_id"] == "req-123"
+
+
+def test_request_id_generated_when_missing_or_invalid():
+    client = _client(request_id_header="X-Trace")
+    generated = client.get("/echo").headers["X-Trace"]
+    assert len(generated) == 36
+
+    response = client.get("/echo", headers={"X-Trace": "bad id\twith spaces"})
+    assert response.headers["X-Trace"] not in ("bad id\twith spaces", generated)
+    assert response.json()["correlation_id"] == response.headers["X-Trace"]
+
+
+@patch("mlserver.observability.log_request")
+@patch("mlserver.observability.log_response")
+def test_sampled_out_requests_still_log_errors(mock_log_response, mock_log_request):
+    client = _client(log_sample_rate=0.0)
+    assert client.get("/echo").status_code == 200
+    assert client.get("/fail").status_code == 400
+
+    mock_log_request.assert_not_called()
+    mock_log_response.assert_called_once()
+    kwargs = mock_log_response.call_args.kwargs
+    assert (kwargs["status_code"], kwargs["method"], kwargs["path"]) == (400, "GET", "/fail")
+
+
+def test_metrics_recorded_except_for_probes():
+    metrics = MagicMock()
+    client = _client(metrics=metrics)
+    client.get("/echo")
+    client.get("/healthz")
+
+    metrics.observe_request.assert_called_once()
+    method, endpoint, status_code, duration = metrics.observe_request.call_args.args
+    assert (method, endpoint, status_code) == ("GET", "/echo", 200)
+    assert duration >= 0
+    assert metrics.inc_active_requests.call_count == metrics.dec_active_requests.call_count == 1
+
+
+def test_requests_labelled_by_route_template():
+    metrics = MagicMock()
+    client = _client(metrics=metrics)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/random-crawler-path")
+
+    endpoints = [call.args[1] for call in metrics.observe_request.call_args_list]
+    assert endpoints == ["/items/{item_id}", "/items/{item_id}", "other"]
+
@@ -0,0 +1,192 @@
+"""Unit tests for the row-level prediction cache."""
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import ApiConfig, AppConfig
+from mlserver.metrics import get_metrics
+from mlserver.prediction_cache import PredictionCache
+from mlserver.server import create_app
+
+
+class RecordingPredictor:
+    """Predictor that records the rows of every call."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def predict(self, X):
+        with self._lock:
+            self.calls.append(X.copy())
+        return X[:, 0].astype(float) * 10
+
+    def predict_proba(self, X):
+        with self._lock:
+            self.calls.append(X.copy())
+        p = X[:, 0].astype(float) / 100
+        return np.column_stack([1 - p, p])
+
+
+@pytest.fixture
+def predictor():
+    return RecordingPredictor()
+
+
+class TestPredictionCache:
+    """Test lookups, partial batches and eviction."""
+
+    def test_repeated_batch_is_served_from_cache(self, predictor):
+        cache = PredictionCache()
+        X = np.array([[1.0, 2.0], [3.0, 4.0]])
+        first = cache.predict("predict", X, predictor.predict)
+        second = cache.predict("predict", X, predictor.predict)
+
+        np.testing.assert_array_equal(first, second)
+        assert len(predictor.calls) == 1
+
+    def test_partial_batch_only_predicts_misses(self, predictor):
+        cache = PredictionCache()
+        cache.predict("predict", np.array([[1.0, 0.0], [3.0, 0.0]]), predictor.predict)
+
+        result = cache.predict("predict", np.array([[2.0, 0.0], [1.0, 0.0], [3.0, 0.0], [4.0, 0.0]]),
+                               predictor.predict)
+
+        np.testing.assert_array_equal(result, [20.0, 10.0, 30.0, 40.0])
+        np.testing.assert_array_equal(predictor.calls[-1], [[2.0, 0.0], [4.0, 0.0]])
+
+    def test_two_dimensional_outputs(self, predictor):
+        cache = PredictionCache()
+        cache.predict("predict_proba", np.array([[10.0]]), predictor.predict_proba)
+        result = cache.predict("predict_proba", np.array([[20.0], [10.0]]), predictor.predict_proba)
+
+        np.testing.assert_allclose(result, [[0.8, 0.2], [0.9, 0.1]])
+        assert result.shape == (2, 2)
+
+    def test_methods_and_models_are_keyed_separately(self, predictor):
+        X = np.array([[1.0]])
+        cache = PredictionCache(model_identity="v1")
+        cache.predict("predict", X, predictor.predict)
+        cache.predict("predict_proba", X, predictor.predict_proba)
+        assert len(predictor.calls) == 2
+
+        other = PredictionCache(model_identity="v2")
+        assert cache._row_keys("predict", X) != other._row_keys("predict", X)
+
+    def test_dtype_is_part_of_the_key(self, predictor):
+        cache = PredictionCache()
+        cache.predict("predict", np.array([[1.0]], dtype=np.float64), predictor.predict)
+        cache.predict("predict", np.array([[1.0]], dtype=np.float32), predictor.predict)
+        assert len(predictor.calls) == 2
+
+    def test_object_rows(self, predictor):
+        cache = PredictionCache()
+        X = np.array([[1, "a"], [2, "b"]], dtype=object)
+        cache.predict("predict", X, predictor.predict)
+        result = cache.predict("predict", X, predictor.predict)
+        np.testing.assert_array_equal(result, [10.0, 20.0])
+        assert len(predictor.calls) == 1
+
+    def test_list_outputs(self):
+        cache = PredictionCache()
+        compute = Mock(side_effect=lambda X: [f"label-{row[0]}" for row in X])
+        cache.predict("predict", np.array([[1], [2]]), compute)
+        result = cache.predict("predict", np.array([[3], [1]]), compute)
+        assert result == ["label-3", "label-1"]
+
+    def test_lru_eviction_by_entry_count(self, predictor):
+        cache = PredictionCache(max_entries=2)
+        for value in (1.0, 2.0, 3.0):
+            cache.predict("predict", np.array([[value]]), predictor.predict)
+
+        assert len(cache) == 2
+        cache.predict("predict", np.array([[1.0]]), predictor.predict)
+        assert len(predictor.calls) == 4
+
+    def test_recently_used_entries_survive(self, predictor):
+        cache = PredictionCache(max_entries=2)
+        cache.predict("predict", np.array([[1.0]]), predictor.predict)
+        cache.predict("predict", np.array([[2.0]]), predictor.predict)
+        cache.predict("predict", np.array([[1.0]]), predictor.predict)  # touch
+        cache.predict("predict", np.array([[3.0]]), predictor.predict)  # evicts 2.0
+
+        calls = len(predictor.calls)
+        cache.predict("predict", np.array([[1.0]]), predictor.predict)
+        assert len(predictor.calls) == calls
+
+    def test_memory_bound(self, predictor):
+        cache = PredictionCache(max_memory_mb=0.01)
+        cache.predict("predict_proba", np.arange(1000.0).reshape(-1, 1), predictor.predict_proba)
+        assert cache.memory_bytes <= cache.max_bytes
+        assert 0 < len(cache) < 1000
+
+    def test_ttl_expiry(self, predictor):
+        cache = PredictionCache(ttl_seconds=0.01)
+        X = np.array([[1.0]])
+        cache.predict("predict", X, predictor.predict)
+        time.sleep(0.02)
+        cache.predict("predict", X, predictor.predict)
+        assert len(predictor.calls) == 2
+
+    def test_unsplittable_output_bypasses_cache(self):
+        cache = PredictionCache()
+        compute = Mock(return_value={"score": 1.0})
+        X = np.array([[1.0]])
+        assert cache.predict("predict", X, compute) == {"score": 1.0}
+        assert cache.predict("predict", X, compute) == {"score": 1.0}
+        assert compute.call_count == 2
+        assert len(cache) == 0
+
+    def test_unsplittable_output_skips_lookups(self):
+        cache = PredictionCache()
+        cache._row_keys = Mock(wraps=cache._row_keys)
+        compute = Mock(return_value={"score": 1.0})
+        for _ in range(3):
+            cache.predict("predict", np.array([[1.0], [2.0]]), compute)
+
+        assert [len(c.args[0]) for c in compute.call_args_list] == [2, 2, 2]
+        cache._row_keys.assert_not_called()
+
+    def test_tracks_cache_metrics(self, predictor):
+        metrics = Mock()
+        cache = PredictionCache(max_entries=2, metrics_getter=lambda: metrics)
+        cache.predict("predict", np.array([[1.0], [2.0]]), predictor.predict)
+        cache.predict("predict", np.array([[1.0], [3.0]]), predictor.predict)
+
+        assert metrics.track_cache.call_args_list[0][0] == ("predict", 0, 2, 0)
+        assert metrics.track_cache.call_args_list[1][0] == ("predict", 1, 1, 1)
+
+
+def test_cached_app_predicts():
+    """The server answers repeated rows from the cache when enabled."""
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "observability": {"metrics": True, "structured_logging": False},
+        "api": {"adapter": "records", "cache": {"enabled": True, "max_entries": 100}},
+    })
+    app = create_app(config)
+
+    with TestClient(app) as client:
+        assert app.state.prediction_cache is not None
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        first = client.post("/predict", json=payload)
+        second = client.post("/predict", json=payload)
+        assert first.status_code == second.status_code == 200
+        assert first.json()["predictions"] == second.json()["predictions"]
+
+        response = client.post("/predict_proba", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["probabilities"][0]) == 2
+
+        metrics = get_metrics()
+        assert metrics.cache_hits.labels(model=metrics.model_name, method="predict")._value.get() == 1
+        assert metrics.cache_misses.labels(model=metrics.model_name, method="predict_proba")._value.get() == 1
+
+
+def test_cache_disabled_by_default():
+    assert ApiConfig().cache.enabled is False
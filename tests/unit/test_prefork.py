@@ -0,0 +1,61 @@
+"""Unit tests for preload-before-fork serving."""
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.prefork import PreforkServer, process_memory
+from mlserver.server import create_app
+from tests.fixtures.mock_predictor import MockPredictor
+
+
+def _config(**api):
+    return AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "server": {"workers": 2, "preload": True},
+        "api": {"adapter": "records", **api},
+    })
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_memory_reports_current_process():
+    usage = process_memory()
+    assert set(usage) == {"rss", "pss", "uss"}
+    assert usage["rss"] >= usage["uss"] > 0
+
+
+def test_process_memory_unknown_pid():
+    assert process_memory(pid=2 ** 22 + 1) is None
+
+
+def test_preload_rejects_process_backend():
+    with pytest.raises(ValueError):
+        PreforkServer(_config(inference_backend="process"))
+
+
+def test_app_uses_preloaded_predictor():
+    predictor = MockPredictor()
+    app = create_app(_config(), preloaded_predictor=predictor)
+
+    with TestClient(app) as client:
+        assert app.state.predictor._predictor is predictor
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        assert client.post("/predict", json=payload).status_code == 200
+
+        status = client.get("/status").json()
+        assert status["worker_pid"] == os.getpid()
+        assert "memory" in status
+
+
+def test_crashed_workers_restart_with_backoff():
+    server = PreforkServer(_config(), max_restarts=3, restart_window=60.0,
+                           restart_backoff=0.5, max_restart_backoff=1.5)
+
+    assert [server._record_crash(now) for now in (0.0, 1.0, 2.0)] == [0.5, 1.0, 1.5]
+    # A fourth crash within the window gives up
+    assert server._record_crash(3.0) is None
+    # Crashes older than the window no longer count
+    assert server._record_crash(100.0) == 0.5
@@ -0,0 +1,125 @@
+"""Unit tests for the process-pool inference backend."""
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.process_pool import (
+    SHARED_MEMORY_MIN_BYTES,
+    ProcessPoolPredictor,
+    _SharedArray,
+    _export,
+    _import,
+)
+from mlserver.server import create_app
+
+
+@pytest.fixture(scope="module")
+def pool_predictor():
+    predictor = ProcessPoolPredictor("tests.fixtures.mock_predictor", "MockPredictor", workers=2)
+    yield predictor
+    predictor.close()
+
+
+class TestSharedArrays:
+    """Test moving arrays through shared memory."""
+
+    def test_large_numeric_array_is_shared(self):
+        arr = np.random.rand(SHARED_MEMORY_MIN_BYTES // 8 + 1)
+        descriptor, shm = _export(arr)
+        assert isinstance(descriptor, _SharedArray)
+        try:
+            np.testing.assert_array_equal(_import(descriptor), arr)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_small_array_is_pickled(self):
+        arr = np.arange(4.0)
+        descriptor, shm = _export(arr)
+        assert descriptor is arr
+        assert shm is None
+
+    def test_object_array_is_pickled(self):
+        arr = np.array(["a"] * SHARED_MEMORY_MIN_BYTES, dtype=object)
+        descriptor, shm = _export(arr)
+        assert descriptor is arr
+        assert shm is None
+
+
+class TestProcessPoolPredictor:
+    """Test predictions in worker processes."""
+
+    def test_name(self, pool_predictor):
+        assert pool_predictor.name == "MockPredictor"
+
+    def test_predict_small_batch(self, pool_predictor):
+        result = pool_predictor.predict(np.random.rand(3, 5))
+        assert result.shape == (3,)
+
+    def test_predict_proba_large_batch(self, pool_predictor):
+        X = np.random.rand(5000, 5)
+        probabilities = pool_predictor.predict_proba(X)
+        assert probabilities.shape == (5000, 2)
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+
+    def test_worker_errors_propagate(self, pool_predictor):
+        with pytest.raises(Exception):
+            pool_predictor.predict(np.random.rand(2, 5, 5))
+
+    def test_worker_death_fails_the_call_and_restarts_the_pool(self):
+        predictor = ProcessPoolPredictor("tests.fixtures.mock_predictor", "CrashingPredictor", workers=1)
+        try:
+            with pytest.raises(RuntimeError, match="died during the prediction"):
+                predictor.predict(np.array([[-1.0]]))
+            assert predictor.restarts == 1
+            assert predictor.predict(np.array([[1.0], [2.0]])).shape == (2,)
+        finally:
+            predictor.close()
+
+    def test_pool_restarts_are_limited(self):
+        predictor = ProcessPoolPredictor("tests.fixtures.mock_predictor", "CrashingPredictor", workers=1,
+                                         max_restarts=1)
+        try:
+            with pytest.raises(RuntimeError, match="died during the prediction"):
+                predictor.predict(np.array([[-1.0]]))
+            with pytest.raises(RuntimeError, match="not restarting"):
+                predictor.predict(np.array([[-1.0]]))
+            with pytest.raises(RuntimeError, match="not restarting"):
+                predictor.predict(np.array([[1.0]]))
+            assert predictor.restarts == 1
+        finally:
+            predictor.close()
+
+    def test_load_failure_raises(self):
+        with pytest.raises(Exception):
+            ProcessPoolPredictor("tests.fixtures.mock_predictor", "DoesNotExist", workers=1)
+
+
+def test_process_backend_app():
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "inference_backend": "process", "max_concurrent_predictions": 2},
+    })
+    app = create_app(config)
+
+    with TestClient(app) as client:
+        assert isinstance(app.state.predictor, ProcessPoolPredictor)
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+        response = client.post("/predict", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["predictions"]) == 1
+
+        response = client.post("/predict_proba", json=payload)
+        assert response.status_code == 200
+        assert len(response.json()["probabilities"][0]) == 2
+
+
+def test_invalid_backend_rejected():
+    with pytest.raises(ValueError):
+        AppConfig.model_validate({
+            "predictor": {"module": "m", "class_name": "C"},
+            "classifier": {"name": "c"},
+            "api": {"inference_backend": "gpu"},
+        })
@@ -0,0 +1,101 @@
+"""Unit tests for the on-demand stack sampling profiler."""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.profiler import StackSampler, collapsed_stacks, speedscope_profile
+from mlserver.server import create_app
+
+TOKEN = "secret-token"
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def threads():
+    """A thread burning CPU and a thread blocked on an event."""
+    stop = threading.Event()
+    busy = threading.Thread(target=busy_loop, args=(stop,), name="busy", daemon=True)
+    waiting = threading.Thread(target=stop.wait, name="waiting", daemon=True)
+    busy.start()
+    waiting.start()
+    time.sleep(0.01)
+    yield
+    stop.set()
+    busy.join()
+    waiting.join()
+
+
+def _thread_names(sampler):
+    return {thread for thread, _ in sampler.stacks}
+
+
+def test_samples_running_threads_only(threads):
+    sampler = StackSampler()
+    for _ in range(5):
+        sampler.sample()
+
+    assert sampler.samples == 5
+    assert "busy" in _thread_names(sampler)
+    assert "waiting" not in _thread_names(sampler)
+    busy_stacks = [stack for (thread, stack), _ in sampler.stacks.items() if thread == "busy"]
+    assert any(frame[0] == "busy_loop" for stack in busy_stacks for frame in stack)
+
+
+def test_include_idle_threads(threads):
+    sampler = StackSampler(include_idle=True)
+    sampler.sample()
+    assert {"busy", "waiting"} <= _thread_names(sampler)
+
+
+def test_output_formats(threads):
+    sampler = StackSampler(interval=0.005)
+    sampler.start()
+    time.sleep(0.1)
+    sampler.stop()
+
+    lines = collapsed_stacks(sampler).splitlines()
+    assert any(line.startswith("busy;") and "busy_loop (test_profiler.py:" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    document = speedscope_profile(sampler)
+    profile = next(p for p in document["profiles"] if p["name"] == "busy")
+    frames = document["shared"]["frames"]
+    assert profile["type"] == "sampled" and len(profile["samples"]) == len(profile["weights"])
+    assert any(frames[index]["name"] == "busy_loop" for stack in profile["samples"] for index in stack)
+
+
+def _client(token=TOKEN):
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "admin": {"token": token}, "profiler": {"enabled": True, "max_seconds": 1}},
+        "observability": {"metrics": False},
+    })
+    return TestClient(create_app(config))
+
+
+def test_profile_endpoint_requires_admin_token():
+    with _client(token=None) as client:
+        assert client.post("/admin/profile?seconds=0.1").status_code == 403
+    with _client() as client:
+        assert client.post("/admin/profile?seconds=0.1", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_profile_endpoint(threads):
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+    with _client() as client:
+        assert client.post("/admin/profile?seconds=5", headers=headers).status_code == 400
+
+        collapsed = client.post("/admin/profile?seconds=0.1&interval_ms=5", headers=headers)
+        assert collapsed.headers["content-type"].startswith("text/plain")
+        assert "busy_loop" in collapsed.text
+
+        speedscope = client.post("/admin/profile?seconds=0.1&format=speedscope", headers=headers)
+        assert speedscope.json()["name"].startswith("test-classifier (pid ")
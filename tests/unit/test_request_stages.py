@@ -0,0 +1,73 @@
+"""Unit tests for the per-stage latency breakdown of prediction requests."""
+import numpy as np
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.observability import RequestStages, timed_stage
+from mlserver.server import create_app
+
+PAYLOAD = {"payload": {"records": [{"f1": 1.0, "f2": 2.0}]}}
+
+
+class Predictor:
+    def predict(self, X):
+        return np.zeros(len(X))
+
+    def predict_proba(self, X):
+        return np.tile([0.5, 0.5], (len(X), 1))
+
+
+def _client(response_validation=True, **observability):
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": ["f1", "f2"], "response_validation": response_validation},
+        "observability": observability,
+    })
+    return TestClient(create_app(config, preloaded_predictor=Predictor()))
+
+
+def _server_timing(response):
+    entries = [entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", ")]
+    return {name: float(duration) for name, duration in entries}
+
+
+def test_stages_add_up():
+    stages = RequestStages()
+    stages.record("predict", 0.002)
+    stages.record("predict", 0.001)
+    with timed_stage(stages, "encode"):
+        pass
+    with timed_stage(None, "format"):
+        pass
+
+    assert list(stages.durations) == ["predict", "encode"]
+    assert stages.server_timing().startswith("predict;dur=3.000, encode;dur=")
+
+
+def test_server_timing_header():
+    with _client(server_timing=True) as client:
+        predict = client.post("/predict", json=PAYLOAD)
+        proba = client.post("/predict_proba", json=PAYLOAD)
+
+    assert predict.status_code == 200
+    assert list(_server_timing(predict)) == ["parse", "adapt", "predict", "format", "validate"]
+    assert list(_server_timing(proba)) == ["parse", "adapt", "predict", "format", "validate"]
+    assert all(duration >= 0 for duration in _server_timing(predict).values())
+
+
+def test_server_timing_without_response_validation():
+    with _client(response_validation=False, server_timing=True) as client:
+        response = client.post("/predict", json=PAYLOAD)
+
+    assert list(_server_timing(response)) == ["parse", "adapt", "predict", "format", "encode"]
+
+
+def test_stage_histograms_without_header():
+    with _client() as client:
+        response = client.post("/predict", json=PAYLOAD)
+        metrics = client.get("/metrics").text
+
+    assert "Server-Timing" not in response.headers
+    for stage in ("parse", "adapt", "predict", "format", "validate"):
+        assert f'mlserver_stage_{stage}_seconds_count{{endpoint="/predict",model="Predictor"}} 1.0' in metrics
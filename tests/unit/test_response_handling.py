@@ -1,9 +1,15 @@
 """Test complex response handling and formatting."""
 
+import json
+from decimal import Decimal
+
 import pytest
 import numpy as np
+import pandas as pd
 from unittest.mock import Mock
-from mlserver.server import _to_jsonable, _format_response
+from fastapi.testclient import TestClient
+from mlserver import serialization
+from mlserver.server import _to_jsonable, _format_response, _format_response_document, create_app
 from mlserver.config import AppConfig, ApiConfig
 from mlserver.schemas import ClassifierMetadataResponse
 
@@ -284,4 +290,90 @@ class TestComplexPredictor:
         result_pass = _format_response(predictions, config_pass, 16.365, "RFQLikelihoodPredictor", None)
 
         # Should return exactly the original
-        assert result_pass == predictions
\ No newline at end of file
+        assert result_pass == predictions
+
+class TestSerializationEngine:
+    """Test bulk conversion and direct JSON encoding."""
+
+    def test_numeric_array_converted_in_bulk(self):
+        arr = np.random.rand(100, 5).astype(np.float32)
+        result = _to_jsonable(arr)
+        assert len(result) == 100
+        assert type(result[0][0]) is float
+
+    def test_object_array_walked(self):
+        arr = np.array([pd.Timestamp("2024-01-01"), Decimal("1.5")], dtype=object)
+        assert _to_jsonable(arr) == ["2024-01-01T00:00:00", 1.5]
+
+    def test_dataframe(self):
+        df = pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5], "when": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+        result = _to_jsonable(df)
+        assert result[0]["a"] == 1
+        assert result[1]["when"] == "2024-01-02T00:00:00"
+
+    def test_set_sorted(self):
+        assert _to_jsonable({3, 1, 2}) == [1, 2, 3]
+
+    def test_recursion_limit(self):
+        nested = []
+        current = nested
+        for _ in range(60):
+            current.append([])
+            current = current[0]
+        with pytest.raises(RecursionError):
+            _to_jsonable(nested)
+
+    def test_dumps_handles_numpy(self):
+        document = {"predictions": np.array([[0.1, 0.9]]), "time_ms": np.float64(1.5), "tags": {"b", "a"}}
+        assert json.loads(serialization.dumps(document)) == {
+            "predictions": [[0.1, 0.9]], "time_ms": 1.5, "tags": ["a", "b"]
+        }
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        document = {"predictions": np.array([1, 2]), "when": pd.Timestamp("2024-01-01")}
+        assert json.loads(serialization.dumps(document)) == {
+            "predictions": [1, 2], "when": "2024-01-01T00:00:00"
+        }
+
+
+class TestFormatResponseDocument:
+    """The response_validation=false path must produce the same JSON as the Pydantic path."""
+
+    @pytest.mark.parametrize("response_format", ["standard", "custom"])
+    @pytest.mark.parametrize("predictions", [
+        np.array([0, 1, 0]),
+        {"a": np.array([1, 2]), "b": 0.5},
+        np.int64(3),
+    ])
+    def test_matches_validated_response(self, response_format, predictions):
+        config = AppConfig(
+            predictor={"module": "test", "class_name": "Test"},
+            api=ApiConfig(response_format=response_format, response_validation=False),
+            classifier={"name": "test-classifier", "version": "1.0.0"}
+        )
+        metadata = ClassifierMetadataResponse(project="p", classifier="c")
+
+        validated = _format_response(predictions, config, 1.0, "TestModel", metadata).model_dump(mode="json")
+        document = json.loads(serialization.dumps(
+            _format_response_document(predictions, config, 1.0, metadata)
+        ))
+        assert document == validated
+
+    def test_endpoint_returns_preencoded_response(self):
+        config = AppConfig.model_validate({
+            "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+            "classifier": {"name": "test-classifier", "version": "1.0.0"},
+            "api": {"adapter": "records", "response_validation": False},
+        })
+        app = create_app(config)
+        payload = {"payload": {"records": [{"f1": 1.0, "f2": 2.0, "f3": 3.0, "f4": 4.0, "f5": 5.0}]}}
+
+        with TestClient(app) as client:
+            response = client.post("/predict", json=payload)
+            assert response.status_code == 200
+            assert len(response.json()["predictions"]) == 1
+
+            response = client.post("/predict_proba", json=payload)
+            assert response.status_code == 200
+            assert len(response.json()["probabilities"][0]) == 2
@@ -2,11 +2,10 @@
 import pytest
 import time
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from fastapi import Request, Response, HTTPException
+from fastapi import HTTPException
 from starlette.responses import JSONResponse
 
 from mlserver.server import (
-    ObservabilityMiddleware,
     create_app,
     PredictorWrapper,
     _prepare_input_data,
@@ -73,136 +72,6 @@ def mock_config_minimal():
     })
 
 
-class TestObservabilityMiddleware:
-    """Test the ObservabilityMiddleware class."""
-
-    def test_middleware_init(self, mock_config):
-        """Test middleware initialization."""
-        with patch('mlserver.server.get_metrics') as mock_get_metrics:
-            mock_metrics = Mock()
-            mock_get_metrics.return_value = mock_metrics
-
-            app = Mock()
-            middleware = ObservabilityMiddleware(app, mock_config)
-
-            assert middleware.config == mock_config
-            assert middleware.metrics == mock_metrics
-
-    def test_middleware_init_no_metrics(self, mock_config_minimal):
-        """Test middleware initialization when metrics are disabled."""
-        with patch('mlserver.server.get_metrics') as mock_get_metrics:
-            mock_get_metrics.return_value = None
-
-            app = Mock()
-            middleware = ObservabilityMiddleware(app, mock_config_minimal)
-
-            assert middleware.config == mock_config_minimal
-            assert middleware.metrics is None
-
-    @pytest.mark.asyncio
-    async def test_middleware_dispatch_full_observability(self, mock_config):
-        """Test middleware dispatch with full observability enabled."""
-        with patch('mlserver.server.get_metrics') as mock_get_metrics, \
-             patch('mlserver.server.set_correlation_id') as mock_set_correlation_id, \
-             patch('mlserver.server.log_request') as mock_log_request, \
-             patch('mlserver.server.log_response') as mock_log_response:
-
-            # Setup mocks
-            mock_metrics = Mock()
-            mock_get_metrics.return_value = mock_metrics
-            mock_set_correlation_id.return_value = "test-correlation-id"
-
-            # Create middleware
-            app = Mock()
-            middleware = ObservabilityMiddleware(app, mock_config)
-
-            # Create mock request and response
-            mock_request = Mock(spec=Request)
-            mock_request.url = Mock()
-            mock_request.url.path = "/predict"
-            mock_request.method = "POST"
-
-            mock_response = Mock(spec=Response)
-            mock_response.status_code = 200
-
-            # Mock call_next
-            async def mock_call_next(request):
-                return mock_response
-
-            # Execute middleware
-            result = await middleware.dispatch(mock_request, mock_call_next)
-
-            # Verify calls - API changed to use track_request instead of record_request_duration
-            mock_set_correlation_id.assert_called_once()
-            mock_metrics.inc_active_requests.assert_called_once()
-            mock_metrics.dec_active_requests.assert_called_once()
-            mock_metrics.track_request.assert_called_once()  # Updated: was record_request_duration
-            mock_log_request.assert_called_once()
-            mock_log_response.assert_called_once()
-
-            assert result == mock_response
-
-    @pytest.mark.asyncio
-    async def test_middleware_dispatch_minimal_observability(self, mock_config_minimal):
-        """Test middleware dispatch with minimal observability."""
-        with patch('mlserver.server.get_metrics') as mock_get_metrics, \
-             patch('mlserver.server.set_correlation_id') as mock_set_correlation_id, \
-             patch('mlserver.server.log_request') as mock_log_request, \
-             patch('mlserver.server.log_response') as mock_log_response:
-
-            # Setup mocks
-            mock_get_metrics.return_value = None
-
-            # Create middleware
-            app = Mock()
-            middleware = ObservabilityMiddleware(app, mock_config_minimal)
-
-            # Create mock request and response
-            mock_request = Mock(spec=Request)
-            mock_response = Mock(spec=Response)
-            mock_response.status_code = 200
-
-            # Mock call_next
-            async def mock_call_next(request):
-                return mock_response
-
-            # Execute middleware
-            result = await middleware.dispatch(mock_request, mock_call_next)
-
-            # Verify minimal calls
-            mock_set_correlation_id.assert_not_called()
-            mock_log_request.assert_not_called()
-            mock_log_response.assert_not_called()
-
-            assert result == mock_response
-
-    @pytest.mark.asyncio
-    async def test_middleware_dispatch_handles_exceptions(self, mock_config):
-        """Test middleware properly handles exceptions."""
-        with patch('mlserver.server.get_metrics') as mock_get_metrics:
-            mock_metrics = Mock()
-            mock_get_metrics.return_value = mock_metrics
-
-            app = Mock()
-            middleware = ObservabilityMiddleware(app, mock_config)
-
-            mock_request = Mock(spec=Request)
-            mock_request.url = Mock()
-            mock_request.url.path = "/predict"
-            mock_request.method = "POST"
-
-            # Mock call_next to raise an exception
-            async def mock_call_next(request):
-                raise Exception("Test error")
-
-            # Execute middleware and expect exception to propagate
-            with pytest.raises(Exception, match="Test error"):
-                await middleware.dispatch(mock_request, mock_call_next)
-
-            # Verify cleanup still happened
-            mock_metrics.dec_active_requests.assert_called_once()
-
-
 class TestCreateApp:
     """Test the create_app function."""
 
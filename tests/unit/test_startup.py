@@ -0,0 +1,93 @@
+"""Unit tests for the startup timing breakdown and the app factory."""
+import numpy as np
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from mlserver import server
+from mlserver.config import AppConfig
+from mlserver.predictor_loader import load_predictor
+from mlserver.server import create_app
+from mlserver.startup import StartupTimings
+
+
+def test_timings_add_up_repeated_phases():
+    timings = StartupTimings()
+    timings.record("import", 0.25)
+    timings.record("import", 0.5)
+    with timings.phase("config"):
+        pass
+    timings.started()
+
+    report = timings.as_dict()
+    assert report["phases"]["import"] == 0.75
+    assert "config" in report["phases"]
+    assert report["startup_seconds"] is not None
+    assert report["ready_seconds"] is None
+
+
+def test_load_predictor_records_phases(tmp_path):
+    np.save(tmp_path / "weights.npy", np.ones(3))
+    (tmp_path / "timed_predictor.py").write_text(
+        "class TimedPredictor:\n"
+        "    def __init__(self, weights):\n"
+        "        self.weights = weights\n"
+    )
+    timings = StartupTimings()
+
+    predictor = load_predictor("timed_predictor.py", "TimedPredictor", {}, config_dir=str(tmp_path),
+                               artifacts={"weights": "weights.npy"}, timings=timings)
+
+    assert predictor.weights.shape == (3,)
+    assert set(timings.phases) == {"import", "artifacts", "predictor_init"}
+
+
+def test_info_reports_startup_breakdown():
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records"},
+    })
+    with TestClient(create_app(config)) as client:
+        startup = client.get("/info").json()["startup"]
+
+    assert {"import", "predictor_init", "metadata"} <= set(startup["phases"])
+    assert startup["ready_seconds"] >= startup["startup_seconds"] > 0
+
+
+@pytest.fixture
+def multi_config_file(tmp_path):
+    path = tmp_path / "classifiers.yaml"
+    classifier = {
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "api": {"adapter": "records"},
+    }
+    path.write_text(yaml.safe_dump({
+        "repository": {"name": "test-repo"},
+        "default_classifier": "beta",
+        "classifiers": {
+            "alpha": {**classifier, "classifier": {"name": "alpha", "version": "1.0.0"}},
+            "beta": {**classifier, "classifier": {"name": "beta", "version": "2.0.0"}},
+        },
+    }))
+    return path
+
+
+@pytest.mark.parametrize("classifier,expected", [(None, "beta"), ("alpha", "alpha")])
+def test_factory_parses_config_once(multi_config_file, monkeypatch, classifier, expected):
+    loads = []
+    safe_load = yaml.safe_load
+    monkeypatch.setattr(yaml, "safe_load", lambda f: loads.append(f) or safe_load(f))
+    monkeypatch.setenv("MLSERVER_CONFIG_PATH", str(multi_config_file))
+    if classifier:
+        monkeypatch.setenv("MLSERVER_CLASSIFIER", classifier)
+    else:
+        monkeypatch.delenv("MLSERVER_CLASSIFIER", raising=False)
+
+    app = server.app()
+
+    assert len(loads) == 1
+    with TestClient(app) as client:
+        info = client.get("/info").json()
+    assert info["startup"]["phases"]["config"] >= 0
+    assert app.title.startswith(expected.title())
@@ -0,0 +1,258 @@
+"""Unit tests for the streaming scoring endpoints."""
+import json
+import struct
+import threading
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.adapters import MAX_RECORDS, AdapterError
+from mlserver.config import AppConfig
+from mlserver.server import create_app
+from mlserver.streaming import (
+    NDJSON,
+    ArrowChunker,
+    ArrowStreamEncoder,
+    MessageTooLarge,
+    NDJSONChunker,
+    decode_arrow_chunk,
+    decode_ndjson_chunk,
+    negotiate_stream_response_type,
+    _read_message_metadata,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+FEATURES = ["f1", "f2", "f3", "f4", "f5"]
+
+
+def _arrow_stream(batches):
+    sink = pa.BufferOutputStream()
+    schema = batches[0].schema
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def _feature_batch(rows, start=0):
+    return pa.record_batch({f: np.arange(start, start + rows, dtype=np.float64) + i for i, f in enumerate(FEATURES)})
+
+
+def _feed_in_pieces(chunker, data, piece_size):
+    chunks = []
+    for i in range(0, len(data), piece_size):
+        chunks.extend(chunker.feed(data[i:i + piece_size]))
+    chunks.extend(chunker.finish())
+    return chunks
+
+
+class TestNDJSONChunker:
+    """Test splitting NDJSON bodies into chunks."""
+
+    def test_lines_split_across_reads(self):
+        body = b"".join(json.dumps({"a": i}).encode() + b"\n" for i in range(25))
+        chunks = _feed_in_pieces(NDJSONChunker(chunk_size=10), body, 7)
+        assert [len(c) for c in chunks] == [10, 10, 5]
+        assert json.loads(chunks[2][-1]) == {"a": 24}
+
+    def test_missing_trailing_newline_and_blank_lines(self):
+        chunks = _feed_in_pieces(NDJSONChunker(chunk_size=10), b'{"a": 1}\n\n{"a": 2}', 3)
+        assert chunks == [[b'{"a": 1}', b'{"a": 2}']]
+
+    def test_line_longer_than_limit(self):
+        chunker = NDJSONChunker(chunk_size=10, max_line_bytes=20)
+        assert _feed_in_pieces(chunker, b'{"a": 1}\n' * 3, 4) == [[b'{"a": 1}'] * 3]
+        with pytest.raises(MessageTooLarge):
+            for piece in [b"[1, 2, ", b"3, 4, 5, 6, ", b"7, 8, 9]\n"]:
+                list(chunker.feed(piece))
+
+    def test_decode_records_and_rows(self):
+        X = decode_ndjson_chunk([b'{"x": 1, "y": 2}', b'{"x": 3, "y": 4}'], feature_order=["x", "y"])
+        np.testing.assert_array_equal(X.astype(float), [[1, 2], [3, 4]])
+
+        X = decode_ndjson_chunk([b"[1, 2]", b"[3, 4]"], input_dtype="float64")
+        assert X.dtype == np.float64
+        assert X.shape == (2, 2)
+
+    def test_decode_invalid_json(self):
+        with pytest.raises(AdapterError):
+            decode_ndjson_chunk([b"{not json"])
+
+
+class TestArrowChunker:
+    """Test splitting Arrow IPC bodies into single-batch streams."""
+
+    @pytest.mark.parametrize("piece_size", [1, 13, 1 << 20])
+    def test_batches_survive_arbitrary_read_boundaries(self, piece_size):
+        body = _arrow_stream([_feature_batch(3), _feature_batch(4, start=3)])
+        chunks = _feed_in_pieces(ArrowChunker(), body, piece_size)
+
+        assert len(chunks) == 2
+        [first] = decode_arrow_chunk(chunks[0], 100, feature_order=FEATURES, input_dtype="float64")
+        [second] = decode_arrow_chunk(chunks[1], 100, feature_order=FEATURES, input_dtype="float64")
+        assert first.shape == (3, 5)
+        np.testing.assert_array_equal(second[:, 0], [3, 4, 5, 6])
+
+    def test_large_batch_decoded_in_slices(self):
+        [chunk] = _feed_in_pieces(ArrowChunker(), _arrow_stream([_feature_batch(250)]), 1 << 20)
+        slices = list(decode_arrow_chunk(chunk, 100, feature_order=FEATURES, input_dtype="float64"))
+        assert [len(rows) for rows in slices] == [100, 100, 50]
+        np.testing.assert_array_equal(slices[2][:, 0], np.arange(200, 250))
+
+    def test_negative_body_length(self):
+        reader = pa.ipc.MessageReader.open_stream(pa.BufferReader(_arrow_stream([_feature_batch(3)])))
+        reader.read_next_message()  # schema
+        message = reader.read_next_message()
+        metadata = message.metadata.to_pybytes()
+        assert _read_message_metadata(metadata)[1] == message.body.size
+        corrupted = metadata.replace(struct.pack("<q", message.body.size), struct.pack("<q", -8))
+        with pytest.raises(AdapterError):
+            _read_message_metadata(corrupted)
+
+    def test_record_batch_larger_than_limit(self):
+        body = _arrow_stream([_feature_batch(1000)])
+        with pytest.raises(MessageTooLarge):
+            _feed_in_pieces(ArrowChunker(max_message_bytes=4096), body, 1024)
+
+    def test_truncated_stream(self):
+        body = _arrow_stream([_feature_batch(3)])
+        chunker = ArrowChunker()
+        list(chunker.feed(body[:-20]))
+        with pytest.raises(AdapterError):
+            list(chunker.finish())
+
+    def test_encoder_produces_one_stream(self):
+        encoder = ArrowStreamEncoder()
+        data = encoder.encode(np.array([1, 2])) + encoder.encode(np.array([3])) + encoder.close()
+        table = pa.ipc.open_stream(pa.BufferReader(data)).read_all()
+        assert table.column("predictions").to_pylist() == [1, 2, 3]
+
+
+@pytest.fixture
+def stream_client():
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {
+            "adapter": "records",
+            "feature_order": FEATURES,
+            "input_dtype": "float64",
+            "streaming": {"enabled": True, "chunk_size": 100},
+        },
+    })
+    with TestClient(create_app(config)) as client:
+        yield client
+
+
+def test_ndjson_stream(stream_client):
+    body = "".join(json.dumps({f: float(i) for f in FEATURES}) + "\n" for i in range(250))
+    response = stream_client.post("/predict/stream", content=body, headers={"Content-Type": NDJSON})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(NDJSON)
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["offset"] for line in lines] == [0, 100, 200]
+    assert sum(len(line["predictions"]) for line in lines) == 250
+
+
+def test_ndjson_proba_stream(stream_client):
+    body = "\n".join(json.dumps([0.1] * 5) for _ in range(3))
+    response = stream_client.post("/predict_proba/stream", content=body, headers={"Content-Type": NDJSON})
+    line = json.loads(response.text.splitlines()[0])
+    assert len(line["probabilities"]) == 3
+    assert len(line["probabilities"][0]) == 2
+
+
+def test_arrow_stream_in_and_out(stream_client):
+    body = _arrow_stream([_feature_batch(150), _feature_batch(30)])
+    response = stream_client.post(
+        "/predict/stream", content=body,
+        headers={"Content-Type": ARROW_STREAM, "Accept": ARROW_STREAM}
+    )
+
+    assert response.status_code == 200
+    reader = pa.ipc.open_stream(pa.BufferReader(response.content))
+    batch_sizes = [batch.num_rows for batch in reader]
+    assert batch_sizes == [100, 50, 30]
+
+
+def test_stream_response_negotiation():
+    assert negotiate_stream_response_type(None) == NDJSON
+    assert negotiate_stream_response_type(ARROW_STREAM) == ARROW_STREAM
+    assert negotiate_stream_response_type(f"{NDJSON}, {ARROW_STREAM};q=0.5") == NDJSON
+    assert negotiate_stream_response_type(f"{ARROW_STREAM};q=0") == NDJSON
+
+
+def test_arrow_batch_above_record_limit(stream_client):
+    rows = MAX_RECORDS * 2
+    response = stream_client.post(
+        "/predict/stream", content=_arrow_stream([_feature_batch(rows)]),
+        headers={"Content-Type": ARROW_STREAM}
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1]["offset"] == rows - 100
+    assert sum(len(line["predictions"]) for line in lines) == rows
+
+
+def test_invalid_line_reports_error_in_stream(stream_client):
+    good = json.dumps({f: 1.0 for f in FEATURES})
+    body = "\n".join([good] * 100 + ["{broken"])
+    response = stream_client.post("/predict/stream", content=body, headers={"Content-Type": NDJSON})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines[0]["predictions"]) == 100
+    assert lines[-1]["offset"] == 100
+    assert "error" in lines[-1]
+
+
+def test_errors_before_first_chunk_get_a_status(stream_client):
+    response = stream_client.post("/predict/stream", content="{broken\n", headers={"Content-Type": NDJSON})
+    assert response.status_code == 400
+    assert "Input parsing failed" in response.json()["detail"]
+
+    line = json.dumps({"f1": "x" * (17 * 1024 * 1024)})
+    response = stream_client.post("/predict/stream", content=line, headers={"Content-Type": NDJSON})
+    assert response.status_code == 413
+
+
+def test_unsupported_content_type(stream_client):
+    response = stream_client.post("/predict/stream", json={"payload": {}})
+    assert response.status_code == 415
+
+
+def test_stream_releases_prediction_slot(stream_client):
+    stream_client.post("/predict/stream", content="[1, 2, 3, 4, 5]\n", headers={"Content-Type": NDJSON})
+    assert stream_client.get("/status").json()["active_predictions"] == 0
+
+
+def test_stream_rejected_up_front_when_busy():
+    started, release = threading.Event(), threading.Event()
+
+    class BlockingPredictor:
+        def predict(self, X):
+            started.set()
+            release.wait(5)
+            return np.zeros(len(X))
+
+    config = AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": FEATURES, "streaming": {"enabled": True}},
+        "observability": {"metrics": False},
+    })
+    record = {f: 1.0 for f in FEATURES}
+    with TestClient(create_app(config, preloaded_predictor=BlockingPredictor())) as client:
+        busy = threading.Thread(target=client.post, args=("/predict",), kwargs={"json": {"payload": {"records": [record]}}})
+        busy.start()
+        assert started.wait(5)
+        response = client.post("/predict/stream", content=json.dumps(record), headers={"Content-Type": NDJSON})
+        release.set()
+        busy.join()
+
+        assert response.status_code == 503
+        assert client.get("/status").json()["active_predictions"] == 0
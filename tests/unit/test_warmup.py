@@ -0,0 +1,130 @@
+"""Unit tests for startup warm-up and the /readyz probe."""
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from mlserver.config import AppConfig
+from mlserver.server import create_app
+from mlserver.warmup import synthetic_payload, warmup_payloads
+
+FEATURES = ["f1", "f2"]
+
+
+class RecordingPredictor:
+    """Records the input of every call; optionally blocks until released."""
+
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+
+    def predict(self, X):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.calls.append(("predict", X.copy()))
+        return np.zeros(len(X))
+
+    def predict_proba(self, X):
+        self.calls.append(("predict_proba", X.copy()))
+        return np.tile([0.5, 0.5], (len(X), 1))
+
+
+def _config(**warmup):
+    return AppConfig.model_validate({
+        "predictor": {"module": "tests.fixtures.mock_predictor", "class_name": "MockPredictor"},
+        "classifier": {"name": "test-classifier", "version": "1.0.0"},
+        "api": {"adapter": "records", "feature_order": FEATURES, "warmup": {"enabled": True, **warmup}},
+    })
+
+
+def _wait_ready(client, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/readyz")
+        if response.status_code == 200 or response.json()["warmup"]["status"] == "failed":
+            return response
+        time.sleep(0.01)
+    raise AssertionError("warm-up did not finish")
+
+
+def test_synthetic_payload_matches_adapter():
+    assert synthetic_payload(FEATURES, "records", 2) == {"records": [{"f1": 0.0, "f2": 0.0}] * 2}
+    assert synthetic_payload(FEATURES, "ndarray", 1, {"f2": "category"}) == {"ndarray": [[0.0, "0"]]}
+
+
+def test_samples_file_relative_to_project(tmp_path):
+    (tmp_path / "samples.ndjson").write_text(json.dumps({"records": [{"f1": 1, "f2": 2}]}) + "\n")
+    config = _config(samples_file="samples.ndjson")
+    config.set_project_path(str(tmp_path))
+    assert warmup_payloads(config, FEATURES) == [{"records": [{"f1": 1, "f2": 2}]}]
+
+
+def test_readyz_gates_on_warmup():
+    gate = threading.Event()
+    predictor = RecordingPredictor(gate=gate)
+    app = create_app(_config(iterations=2, synthetic_rows=4), preloaded_predictor=predictor)
+    with TestClient(app) as client:
+        # The process is alive while the model is still warming up
+        assert client.get("/healthz").status_code == 200
+        assert client.get("/readyz").status_code == 503
+
+        gate.set()
+        response = _wait_ready(client)
+        assert response.status_code == 200
+        assert response.json()["warmup"]["predictions"] == 4  # 2 iterations x (predict, predict_proba)
+
+    methods = [method for method, _ in predictor.calls]
+    assert methods == ["predict", "predict_proba"] * 2
+    assert predictor.calls[0][1].shape == (4, 2)
+
+
+def test_warmup_takes_a_prediction_slot():
+    gate = threading.Event()
+    predictor = RecordingPredictor(gate=gate)
+    app = create_app(_config(), preloaded_predictor=predictor)
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        while client.get("/status").json()["active_predictions"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Warm-up holds the default single slot, so a live request is turned away meanwhile
+        response = client.post("/predict", json={"payload": {"records": [{"f1": 1.0, "f2": 2.0}]}})
+        assert response.status_code == 503
+
+        gate.set()
+        assert _wait_ready(client).status_code == 200
+        assert client.post("/predict", json={"payload": {"records": [{"f1": 1.0, "f2": 2.0}]}}).status_code == 200
+
+
+def test_warmup_uses_recorded_samples_and_skips_metrics():
+    predictor = RecordingPredictor()
+    samples = [{"records": [{"f1": 3.0, "f2": 4.0}]}]
+    app = create_app(_config(samples=samples, iterations=1), preloaded_predictor=predictor)
+    with TestClient(app) as client:
+        _wait_ready(client)
+        metrics = client.get("/metrics").text
+
+    np.testing.assert_array_equal(predictor.calls[0][1], [[3.0, 4.0]])
+    assert 'mlserver_predictions_total{endpoint="/predict"' not in metrics
+
+
+@pytest.mark.parametrize("fail_on_error,status", [(False, 200), (True, 503)])
+def test_failed_warmup(fail_on_error, status):
+    samples = [{"records": [{"unknown": 1.0}]}]
+    app = create_app(
+        _config(samples=samples, iterations=1, fail_on_error=fail_on_error),
+        preloaded_predictor=RecordingPredictor()
+    )
+    with TestClient(app) as client:
+        response = _wait_ready(client)
+        assert response.status_code == status
+        assert response.json()["warmup"]["errors"] == 2
+
+
+def test_ready_immediately_without_warmup():
+    config = _config()
+    config.api.warmup.enabled = False
+    with TestClient(create_app(config, preloaded_predictor=RecordingPredictor())) as client:
+        assert client.get("/readyz").json()["status"] == "ready"